@@ -16,6 +16,7 @@ is installed. This plots the PDF (probability density function).
 """
 import abc
 import logging
+from typing import Optional, Tuple, Union
 
 import numpy
 
@@ -63,11 +64,113 @@ class Distribution:
 
         The probability has to be in the range [0, 1].
 
-        :param x: The value to check the probability for
+        The value `x` can either be a single value or an array of values.
+        For arrays, the densities of all values are calculated at once
+        and returned as an array of the same shape. For single values,
+        a single density is returned.
+
+        :param x: The value(s) to check the probability for
         :return: The probability, that the given value `x` get's sampled
         """
         raise NotImplementedError("Has to be implemented by the subclasses")
 
+    def logpdf(self, x: object) -> float:
+        """
+        Calculate the logarithm of the probability density for the value(s) `x`.
+
+        Just like `pdf`, this accepts a single value or an array of values.
+        Values which can't be sampled from this distribution get a log-density
+        of ``-inf``.
+
+        Summing log-densities does not underflow like multiplying many small
+        densities does. Thus, subclasses should override this to evaluate the
+        density directly in log space, instead of taking the logarithm of
+        the `pdf`, as it's done by default.
+
+        :param x: The value(s) to calculate the log-density for
+        :return: The logarithm of the probability density of `x`
+        """
+        with numpy.errstate(divide="ignore"):
+            return numpy.log(self.pdf(x))
+
+    @abc.abstractmethod
+    def cdf(self, x: object) -> float:
+        """
+        Calculate the cumulative distribution function (CDF) at `x`.
+
+        This is the probability that a sampled value is smaller than
+        or equal to `x`. Like `pdf`, this accepts single values and arrays.
+
+        :param x: The value(s) to evaluate the CDF at
+        :return: The probability to sample a value <= `x`
+        """
+        raise NotImplementedError("Has to be implemented by the subclasses")
+
+    @abc.abstractmethod
+    def ppf(self, q: float) -> object:
+        """
+        Calculate the percent point function (PPF), the inverse of the CDF.
+
+        This maps probabilities from [0, 1] to values of this distribution.
+        Thus, mapping uniformly distributed values through the PPF results in
+        values distributed like this distribution. This way, any point of the
+        unit hypercube (e.g. from a quasi-random sequence) can be transformed
+        into a value of this distribution.
+
+        :param q: The probability (or array of probabilities) in [0, 1]
+        :return: The smallest value(s) `x` with ``cdf(x) >= q``
+        """
+        raise NotImplementedError("Has to be implemented by the subclasses")
+
+    @abc.abstractmethod
+    def to_unit(self, x: object) -> float:
+        """
+        Encode value(s) of this distribution into the unit interval [0, 1].
+
+        Optimizers work best in a normalized, continuous space. This
+        transforms the values of this distribution into such a space,
+        e.g. linear for uniform and logarithmic for log-uniform distributions.
+        It's the inverse of `from_unit`.
+
+        :param x: The value(s) to encode
+        :return: The encoded value(s) in [0, 1]
+        """
+        raise NotImplementedError("Has to be implemented by the subclasses")
+
+    @abc.abstractmethod
+    def from_unit(self, u: float) -> object:
+        """
+        Decode value(s) of the unit interval [0, 1] into values of this
+        distribution.
+
+        This is the inverse of `to_unit`.
+
+        :param u: The encoded value(s) in [0, 1]
+        :return: The decoded value(s) of this distribution
+        """
+        raise NotImplementedError("Has to be implemented by the subclasses")
+
+    @abc.abstractmethod
+    def sample(
+        self,
+        size: Optional[int] = None,
+        rng: Union[None, int, numpy.random.Generator] = None,
+    ):
+        """
+        Draw random values from this distribution.
+
+        All values are drawn at once in a single vectorized call.
+        If `size` is ``None``, a single value is returned. Otherwise,
+        an array of the given size (or shape) is returned.
+
+        :param size: The number (or shape) of values to draw.
+        :param rng: The random number generator to draw the values from.
+                    This can be a ``numpy.random.Generator`` or a seed to create
+                    a new generator from. If ``None``, a fresh generator is used.
+        :return: The value(s) drawn from this distribution
+        """
+        raise NotImplementedError("Has to be implemented by the subclasses")
+
     @abc.abstractmethod
     def _plot_min_value(self) -> float:
         """
@@ -109,7 +212,7 @@ class Distribution:
         # plot at least 1.000 points, 10.000 at most
         num_points = int(min(max(stop - start, 1000), 10000))
         x = numpy.linspace(start=start, stop=stop, num=num_points)
-        y = numpy.vectorize(self.pdf)(x)
+        y = self.pdf(x)
         axes = plt.plot(x, y, label=self._plot_label())
         mean_x = self.mean()
         mean_y = self.pdf(mean_x)
@@ -130,14 +233,19 @@ class QMixin:
     """
     This mixin adds a regulation parameter `q`
     to bind a distribution to discrete values.
+
+    It has to precede the distribution in the bases of a class. Then,
+    it rounds the values passed to and returned by the distribution
+    to multiples of `q`.
     """
 
-    def __init__(self, q: float):
+    def __init__(self, *args, q: float, **kwargs):
         """
         Add the new regulation parameter.
 
         :param q: The regulation value
         """
+        super().__init__(*args, **kwargs)
         self.__q = q
 
     @property
@@ -153,7 +261,111 @@ class QMixin:
         """
         Round a value to the next multiple of `q`.
 
-        :param value: The value to round
+        :param value: The value (or array of values) to round
         :return: The quantized value which is the nearest multiple of q
         """
-        return numpy.round(value / self.q) * self.q
+        return numpy.round(numpy.asarray(value, dtype=float) / self.q) * self.q
+
+    @property
+    def q_bounds(self) -> Tuple[float, float]:
+        """
+        The smallest and the largest multiple of `q`, which can be sampled.
+
+        :return: The bounds of the quantized values (infinite, if unbounded)
+        """
+        return -numpy.inf, numpy.inf
+
+    def round_to_support(self, value: float) -> float:
+        """
+        Round a value to the next multiple of `q`, which can be sampled.
+
+        Values beyond the bounds of the distribution are rounded to the
+        nearest multiple within the bounds (see `q_bounds`).
+
+        :param value: The value (or array of values) to round
+        :return: The nearest multiple of q, which can be sampled
+        """
+        return numpy.clip(self.round_to_q(value), *self.q_bounds)
+
+    def mean(self) -> float:
+        """
+        Calculate and return the mean value of the distribution,
+        rounded to the nearest multiple of `q`.
+
+        :return: The mean value of this distribution
+        """
+        return self.round_to_support(super().mean())
+
+    def pdf(self, x: object) -> float:
+        """
+        Calculate the probability for the given `x` to be sampled.
+
+        :param x: The value to calculate the probability for.
+        :return: The probability that the given value is sampled.
+        """
+        return super().pdf(self.round_to_q(x))
+
+    def logpdf(self, x: object) -> float:
+        """
+        Calculate the logarithm of the probability density for the given `x`.
+
+        :param x: The value to calculate the log-density for.
+        :return: The logarithm of the probability density of `x`.
+        """
+        return super().logpdf(self.round_to_q(x))
+
+    def cdf(self, x: object) -> float:
+        """
+        Calculate the probability to sample a value smaller than or equal to `x`.
+
+        :param x: The value to evaluate the CDF at.
+        :return: The cumulative probability of `x`.
+        """
+        x = numpy.asarray(x, dtype=float)
+        # The largest multiple of q which is <= x. All values
+        # of the underlying distribution up to half a step above
+        # it are rounded to that one.
+        steps = numpy.floor(x / self.q)
+        steps = numpy.where(numpy.isclose((steps + 1) * self.q, x), steps + 1, steps)
+        # Values beyond the bounds are rounded to the first or last multiple
+        low, high = numpy.round(numpy.divide(self.q_bounds, self.q))
+        cdf = numpy.where(steps >= high, 1.0, super().cdf((steps + 0.5) * self.q))
+        return numpy.where(steps < low, 0.0, cdf)[()]
+
+    def ppf(self, q: float) -> object:
+        """
+        Calculate the value, for which the CDF equals `q`.
+
+        :param q: The cumulative probability in [0, 1].
+        :return: The value with the cumulative probability `q`.
+        """
+        return self.round_to_support(super().ppf(q))
+
+    def to_unit(self, x: object) -> float:
+        """
+        Encode the given `x` into [0, 1] using the underlying distribution.
+
+        :param x: The value to encode.
+        :return: The encoded value.
+        """
+        return super().to_unit(self.round_to_q(x))
+
+    def from_unit(self, u: float) -> object:
+        """
+        Decode the given `u` of [0, 1] using the underlying distribution.
+
+        :param u: The encoded value.
+        :return: The decoded value.
+        """
+        return self.round_to_support(super().from_unit(u))
+
+    def sample(self, size=None, rng=None):
+        """
+        Draw random values from the underlying distribution,
+        which are rounded to multiples of `q`.
+
+        :param size: The number (or shape) of values to draw.
+        :param rng: The random number generator (or seed) to draw the values from.
+        :return: The value(s) drawn from this distribution
+        """
+        return self.round_to_support(super().sample(size=size, rng=rng))
@@ -9,9 +9,41 @@ There are two different distributions defined in this module:
     1. The "Choice"-Distribution defines an equal probability to each value.
     2. The "PChoice"-Distribution allows the user to weight each value differently.
 """
+import numpy
+
 from .base import Distribution, _get_matplotlib
 
 
+def _alias_table(probabilities: numpy.ndarray):
+    """
+    Build the tables of Walker's alias method using Vose's algorithm.
+
+    Each of the `n` slots keeps its own index with the probability
+    ``thresholds[i]`` and the index ``aliases[i]`` otherwise. Thus, drawing
+    a value only requires a uniform slot and a single comparison.
+
+    :param probabilities: The probabilities of the choices.
+    :return: A tuple of the thresholds and aliases of each slot.
+    """
+    num_choices = len(probabilities)
+    scaled = probabilities * num_choices
+    thresholds = numpy.ones(num_choices)
+    aliases = numpy.arange(num_choices)
+    small = [i for i in range(num_choices) if scaled[i] < 1.0]
+    large = [i for i in range(num_choices) if scaled[i] >= 1.0]
+    while small and large:
+        less, more = small.pop(), large.pop()
+        thresholds[less] = scaled[less]
+        aliases[less] = more
+        scaled[more] += scaled[less] - 1.0
+        if scaled[more] < 1.0:
+            small.append(more)
+        else:
+            large.append(more)
+    # The remaining slots are full up to rounding errors
+    return thresholds, aliases
+
+
 class WeightedChoice(Distribution):
     """
     Defines a parameter as a weighted choice.
@@ -41,7 +73,18 @@ class WeightedChoice(Distribution):
         :type choices: dict[object, float]
         """
         self.__choices = choices
-        self.__weight_sum = sum(choices.values())
+        weight_sum = sum(choices.values())
+        # Keep the values in an object array, such that the values themselves
+        # (e.g. tuples) are never interpreted as array dimensions by numpy.
+        self.__values = numpy.empty(len(choices), dtype=object)
+        self.__values[:] = list(choices.keys())
+        self.__probabilities = (
+            numpy.fromiter(choices.values(), dtype=float, count=len(choices))
+            / weight_sum
+        )
+        self.__cumulative = numpy.cumsum(self.__probabilities)
+        self.__indices = {choice: index for index, choice in enumerate(choices)}
+        self.__thresholds, self.__aliases = _alias_table(self.__probabilities)
 
     @property
     def choices(self):
@@ -54,17 +97,114 @@ class WeightedChoice(Distribution):
         """
         return self.__choices.copy()
 
+    @property
+    def probabilities(self) -> numpy.ndarray:
+        """
+        Returns the probability of each choice in the order of `choices`.
+
+        :return: An array containing the probabilities of the choices.
+        """
+        return self.__probabilities.copy()
+
+    def index(self, x: object):
+        """
+        Look up the position of the given choice(s) in `choices`.
+
+        :param x: A choice or a list or array of choices.
+        :return: The index of each choice or -1 for values,
+                 which are not part of the choices.
+        """
+        if isinstance(x, (list, numpy.ndarray)):
+            return numpy.fromiter(
+                (self.__indices.get(value, -1) for value in x), dtype=int, count=len(x)
+            )
+        return self.__indices.get(x, -1)
+
     def mean(self):
-        probabilities = [
-            weight / self.__weight_sum for weight in self.__choices.values()
-        ]
-        average = sum(i * prob for i, prob in enumerate(probabilities))
-        return list(self.__choices.keys())[int(round(average))]
+        average = self.__probabilities @ numpy.arange(len(self.__probabilities))
+        return self.__values[int(round(average))]
 
     def pdf(self, x: object):
-        if x not in self.__choices:
+        if isinstance(x, (list, numpy.ndarray)):
+            indices = self.index(x)
+            return numpy.where(indices >= 0, self.__probabilities[indices], 0.0)
+        if x not in self.__indices:
             return 0.0
-        return self.__choices[x] / self.__weight_sum
+        return self.__probabilities[self.__indices[x]]
+
+    def cdf(self, x: object):
+        """
+        Calculate the probability to sample one of the choices up to `x`.
+
+        The choices are ordered as they were given. Values, which are not
+        part of the choices, get a cumulative probability of NaN.
+
+        :param x: A choice or a list or array of choices.
+        :return: The cumulative probability of `x`
+        """
+        if isinstance(x, (list, numpy.ndarray)):
+            indices = self.index(x)
+            return numpy.where(indices >= 0, self.__cumulative[indices], numpy.nan)
+        if x not in self.__indices:
+            return numpy.nan
+        return self.__cumulative[self.__indices[x]]
+
+    def ppf(self, q: float):
+        """
+        Return the first choice, which has a cumulative probability
+        of at least `q`.
+
+        :param q: The cumulative probability (or array of them) in [0, 1].
+        :return: The choice(s) belonging to the cumulative probabilities
+        """
+        indices = numpy.searchsorted(self.__cumulative, q, side="left")
+        # Guard against rounding errors in the last cumulative probability
+        return self.__values[numpy.minimum(indices, len(self.__values) - 1)]
+
+    def to_unit(self, x: object):
+        """
+        Encode the given choice(s) by their ordinal index into [0, 1].
+
+        Each choice gets an interval of equal width, which is encoded by
+        its center. Values, which are not part of the choices, are encoded
+        as NaN.
+
+        :param x: A choice or a list or array of choices.
+        :return: The encoded choice(s).
+        """
+        indices = numpy.asarray(self.index(x), dtype=float)
+        indices = numpy.where(indices >= 0, indices, numpy.nan)
+        return ((indices + 0.5) / len(self.__values))[()]
+
+    def from_unit(self, u: float):
+        """
+        Decode the given value(s) of [0, 1] into the choice, whose
+        interval contains it.
+
+        :param u: The encoded value (or an array of them).
+        :return: The decoded choice(s).
+        """
+        indices = numpy.floor(numpy.asarray(u) * len(self.__values)).astype(int)
+        return self.__values[numpy.clip(indices, 0, len(self.__values) - 1)]
+
+    def sample_index(self, size=None, rng=None):
+        """
+        Draw random indices into `choices` according to their probabilities.
+
+        This uses Walker's alias method. Thus, drawing a value takes O(1),
+        independent of the number of choices.
+
+        :param size: The number (or shape) of indices to draw.
+        :param rng: The random number generator (or seed) to draw the indices from.
+        :return: The index or an array of indices drawn
+        """
+        rng = numpy.random.default_rng(rng)
+        slots = rng.integers(len(self.__values), size=size)
+        keep = rng.random(size=size) < self.__thresholds[slots]
+        return numpy.where(keep, slots, self.__aliases[slots])[()]
+
+    def sample(self, size=None, rng=None):
+        return self.__values[self.sample_index(size=size, rng=rng)]
 
     def _plot_min_value(self) -> float:  # pragma: no cover
         return 0.0
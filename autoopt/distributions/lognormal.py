@@ -49,7 +49,73 @@ class LogNormal(Normal):
         :return: The probability that the given value is sampled.
         :rtype: float
         """
-        return super().pdf(np.log(x)) / x if x > 0 else 0.0
+        x = np.asarray(x, dtype=float)
+        positive = x > 0
+        # Evaluate the positive values only to avoid warnings about log(0)
+        safe_x = np.where(positive, x, 1.0)
+        return np.where(positive, super().pdf(np.log(safe_x)) / safe_x, 0.0)[()]
+
+    def logpdf(self, x: float):
+        """
+        Calculate the logarithm of the probability density for the given `x`.
+
+        :param x: The value to calculate the log-density for.
+        :return: The logarithm of the probability density of `x`.
+        :rtype: float
+        """
+        x = np.asarray(x, dtype=float)
+        positive = x > 0
+        log_x = np.log(np.where(positive, x, 1.0))
+        return np.where(positive, super().logpdf(log_x) - log_x, -np.inf)[()]
+
+    def cdf(self, x: float):
+        """
+        Calculate the probability to sample a value smaller than or equal to `x`.
+
+        :param x: The value to evaluate the CDF at.
+        :return: The cumulative probability of `x`.
+        :rtype: float
+        """
+        x = np.asarray(x, dtype=float)
+        positive = x > 0
+        log_x = np.log(np.where(positive, x, 1.0))
+        return np.where(positive, super().cdf(log_x), 0.0)[()]
+
+    def ppf(self, q: float):
+        """
+        Calculate the value, for which the CDF equals `q`.
+
+        :param q: The cumulative probability in [0, 1].
+        :return: The value with the cumulative probability `q`.
+        :rtype: float
+        """
+        return np.exp(super().ppf(q))
+
+    def to_unit(self, x: float):
+        """
+        Encode the given `x` into [0, 1] using the CDF of the distribution.
+
+        :param x: The value to encode.
+        :return: The encoded value.
+        :rtype: float
+        """
+        x = np.asarray(x, dtype=float)
+        positive = x > 0
+        log_x = np.log(np.where(positive, x, 1.0))
+        return np.where(positive, super().to_unit(log_x), 0.0)[()]
+
+    def from_unit(self, u: float):
+        """
+        Decode the given `u` of [0, 1] using the inverse CDF of the distribution.
+
+        :param u: The encoded value.
+        :return: The decoded value.
+        :rtype: float
+        """
+        return np.exp(super().from_unit(u))
+
+    def sample(self, size=None, rng=None):
+        return np.exp(super().sample(size=size, rng=rng))
 
 
 class QLogNormal(QNormal, LogNormal):
@@ -62,3 +128,8 @@ class QLogNormal(QNormal, LogNormal):
 
         P(X) = 1/sqrt(2*pi*scale^2)*e^(-(round(X/q)-loc)^2/(2*scale^2))
     """
+
+    @property
+    def q_bounds(self):
+        # Only positive values can be sampled
+        return self.q, np.inf
@@ -42,13 +42,50 @@ class LogUniform(Uniform):
         self._max_log = np.log(max_value)
 
     def pdf(self, x: float):
-        if x >= 0 and self.min_value <= x <= self.max_value:
-            return 1 / (x * (self._max_log - self._min_log))
-        return 0.0
+        x = np.asarray(x, dtype=float)
+        inside = (x >= 0) & (self.min_value <= x) & (x <= self.max_value)
+        return np.divide(
+            1,
+            x * (self._max_log - self._min_log),
+            out=np.zeros_like(x),
+            where=inside,
+        )[()]
+
+    def logpdf(self, x: float):
+        x = np.asarray(x, dtype=float)
+        inside = (x >= 0) & (self.min_value <= x) & (x <= self.max_value)
+        safe_x = np.where(inside, x, 1.0)
+        log_density = -np.log(safe_x) - np.log(self._max_log - self._min_log)
+        return np.where(inside, log_density, -np.inf)[()]
+
+    def cdf(self, x: float):
+        x = np.asarray(x, dtype=float)
+        log_x = np.log(np.where(x > 0, x, self.min_value))
+        return np.clip(
+            (log_x - self._min_log) / (self._max_log - self._min_log), 0.0, 1.0
+        )[()]
+
+    def ppf(self, q: float):
+        q = np.asarray(q, dtype=float)
+        x = np.exp(self._min_log + q * (self._max_log - self._min_log))
+        return np.where((q < 0) | (q > 1), np.nan, x)[()]
+
+    def to_unit(self, x: float):
+        x = np.asarray(x, dtype=float)
+        log_x = np.log(np.where(x > 0, x, np.nan))
+        return ((log_x - self._min_log) / (self._max_log - self._min_log))[()]
+
+    def from_unit(self, u: float):
+        u = np.asarray(u, dtype=float)
+        return np.exp(self._min_log + u * (self._max_log - self._min_log))[()]
 
     def mean(self):
         return (self.max_value - self.min_value) / (self._max_log - self._min_log)
 
+    def sample(self, size=None, rng=None):
+        rng = np.random.default_rng(rng)
+        return np.exp(rng.uniform(self._min_log, self._max_log, size=size))
+
 
 class QLogUniform(QUniform, LogUniform):
     """
@@ -14,6 +14,185 @@ import numpy as np
 
 from .base import Distribution, QMixin
 
+# Coefficients of the rational approximations of the inverse of the standard
+# normal CDF by Peter J. Acklam (relative error below 1.15e-9), which is
+# refined by a single step of Halley's method afterwards.
+_PPF_CENTRAL_NUMERATOR = (
+    -3.969683028665376e01,
+    2.209460984245205e02,
+    -2.759285104469687e02,
+    1.383577518672690e02,
+    -3.066479806614716e01,
+    2.506628277459239e00,
+)
+_PPF_CENTRAL_DENOMINATOR = (
+    -5.447609879822406e01,
+    1.615858368580409e02,
+    -1.556989798598866e02,
+    6.680131188771972e01,
+    -1.328068155288572e01,
+    1.0,
+)
+_PPF_TAIL_NUMERATOR = (
+    -7.784894002430293e-03,
+    -3.223964580411365e-01,
+    -2.400758277161838e00,
+    -2.549732539343734e00,
+    4.374664141464968e00,
+    2.938163982698783e00,
+)
+_PPF_TAIL_DENOMINATOR = (
+    7.784695709041462e-03,
+    3.224671290700398e-01,
+    2.445134137142996e00,
+    3.754408661907416e00,
+    1.0,
+)
+_PPF_TAIL_LIMIT = 0.02425
+
+# Coefficients of the rational approximations of the error function
+# by W. J. Cody (relative error below 1e-16 in double precision)
+# for |x| <= 0.46875, 0.46875 < |x| <= 4 and |x| > 4.
+_ERF_SMALL_NUMERATOR = (
+    1.85777706184603153e-1,
+    3.16112374387056560e00,
+    1.13864154151050156e02,
+    3.77485237685302021e02,
+    3.20937758913846947e03,
+)
+_ERF_SMALL_DENOMINATOR = (
+    1.0,
+    2.36012909523441209e01,
+    2.44024637934444173e02,
+    1.28261652607737228e03,
+    2.84423683343917062e03,
+)
+_ERFC_MEDIUM_NUMERATOR = (
+    2.15311535474403846e-8,
+    5.64188496988670089e-1,
+    8.88314979438837594e00,
+    6.61191906371416295e01,
+    2.98635138197400131e02,
+    8.81952221241769090e02,
+    1.71204761263407058e03,
+    2.05107837782607147e03,
+    1.23033935479799725e03,
+)
+_ERFC_MEDIUM_DENOMINATOR = (
+    1.0,
+    1.57449261107098347e01,
+    1.17693950891312499e02,
+    5.37181101862009858e02,
+    1.62138957456669019e03,
+    3.29079923573345963e03,
+    4.36261909014324716e03,
+    3.43936767414372164e03,
+    1.23033935480374942e03,
+)
+_ERFC_LARGE_NUMERATOR = (
+    1.63153871373020978e-2,
+    3.05326634961232344e-1,
+    3.60344899949804439e-1,
+    1.25781726111229246e-1,
+    1.60837851487422766e-2,
+    6.58749161529837803e-4,
+)
+_ERFC_LARGE_DENOMINATOR = (
+    1.0,
+    2.56852019228982242e00,
+    1.87295284992346725e00,
+    5.27905102951428412e-1,
+    6.05183413124413191e-2,
+    2.33520497626869185e-3,
+)
+_ERF_SMALL_LIMIT = 0.46875
+# erfc(x) underflows to 0 beyond this value
+_ERFC_ZERO_LIMIT = 26.543
+_INV_SQRT_PI = 5.6418958354775628695e-1
+
+
+def _polyval(coefficients, x):
+    """
+    Evaluate a polynomial with Horner's method in-place.
+
+    Unlike `np.polyval`, this does not allocate a new array for each
+    coefficient.
+    """
+    result = np.full_like(x, coefficients[0])
+    for coefficient in coefficients[1:]:
+        result *= x
+        result += coefficient
+    return result
+
+
+def _erfc(x):
+    """
+    Vectorized complementary error function.
+
+    It evaluates the rational approximations of W. J. Cody for the three
+    regions of |x| for all values and selects the one of the region of each
+    value. For negative values, erfc(x) = 2 - erfc(-x) is used.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.abs(x)
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        y2 = y * y
+        small = _polyval(_ERF_SMALL_NUMERATOR, y2)
+        small /= _polyval(_ERF_SMALL_DENOMINATOR, y2)
+        small = 1 - y * small
+        erfc = _polyval(_ERFC_MEDIUM_NUMERATOR, y)
+        erfc /= _polyval(_ERFC_MEDIUM_DENOMINATOR, y)
+        inverse = 1 / y2
+        large = _polyval(_ERFC_LARGE_NUMERATOR, inverse)
+        large /= _polyval(_ERFC_LARGE_DENOMINATOR, inverse)
+        large = (_INV_SQRT_PI - inverse * large) / y
+        erfc = np.where(y <= 4, erfc, large)
+        # exp(-y^2) is split into two factors to reduce the rounding error
+        truncated = np.trunc(y * 16) / 16
+        erfc *= np.exp(-truncated * truncated)
+        erfc *= np.exp(-(y - truncated) * (y + truncated))
+    erfc = np.where(y <= _ERF_SMALL_LIMIT, small, erfc)
+    erfc = np.where(y >= _ERFC_ZERO_LIMIT, 0.0, erfc)
+    return np.where(x < 0, 2 - erfc, erfc)
+
+
+def _norm_cdf(z):
+    """
+    Vectorized CDF of the standard normal distribution.
+    """
+    return 0.5 * _erfc(-np.asarray(z, dtype=float) / np.sqrt(2))
+
+
+def _norm_ppf(p):
+    """
+    Vectorized inverse of the CDF of the standard normal distribution.
+
+    Values outside of [0, 1] are mapped to NaN.
+    """
+    p = np.asarray(p, dtype=float)
+    # Only solve for the lower half and mirror the results of the upper half,
+    # because `1 - p` is exact there, while `cdf(x) - p` is not close to 1.
+    lower = np.minimum(p, 1 - p)
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        q = lower - 0.5
+        central = (
+            q
+            * np.polyval(_PPF_CENTRAL_NUMERATOR, q**2)
+            / np.polyval(_PPF_CENTRAL_DENOMINATOR, q**2)
+        )
+        t = np.sqrt(-2 * np.log(lower))
+        tail = np.polyval(_PPF_TAIL_NUMERATOR, t) / np.polyval(
+            _PPF_TAIL_DENOMINATOR, t
+        )
+        x = np.where(lower < _PPF_TAIL_LIMIT, tail, central)
+        error = _norm_cdf(x) - lower
+        u = error * np.sqrt(2 * np.pi) * np.exp(x**2 / 2)
+        refined = x - u / (1 + x * u / 2)
+        x = np.where(np.isfinite(refined), refined, x)
+    x = np.where(lower == 0, -np.inf, x)
+    x = np.where(p > 0.5, -x, x)
+    return np.where((p < 0) | (p > 1), np.nan, x)
+
 
 class Normal(Distribution):
     """
@@ -62,10 +241,65 @@ class Normal(Distribution):
         :param x: The value to calculate the probability for.
         :return: The probability that the given value is sampled.
         """
+        x = np.asarray(x, dtype=float)
         return np.exp(-((x - self.loc) ** 2) / (2 * self.scale**2)) / (
             np.sqrt(2 * np.pi) * self.scale
         )
 
+    def logpdf(self, x: float) -> float:
+        """
+        Calculate the logarithm of the probability density for the given `x`.
+
+        :param x: The value to calculate the log-density for.
+        :return: The logarithm of the probability density of `x`.
+        """
+        x = np.asarray(x, dtype=float)
+        return (
+            -0.5 * ((x - self.loc) / self.scale) ** 2
+            - np.log(self.scale)
+            - 0.5 * np.log(2 * np.pi)
+        )
+
+    def cdf(self, x: float) -> float:
+        """
+        Calculate the probability to sample a value smaller than or equal to `x`.
+
+        :param x: The value to evaluate the CDF at.
+        :return: The cumulative probability of `x`.
+        """
+        return _norm_cdf((np.asarray(x, dtype=float) - self.loc) / self.scale)[()]
+
+    def ppf(self, q: float) -> float:
+        """
+        Calculate the value, for which the CDF equals `q`.
+
+        :param q: The cumulative probability in [0, 1].
+        :return: The value with the cumulative probability `q`.
+        """
+        return (self.loc + self.scale * _norm_ppf(q))[()]
+
+    def to_unit(self, x: float) -> float:
+        """
+        Encode the given `x` into [0, 1] using the CDF of the distribution.
+
+        :param x: The value to encode.
+        :return: The encoded value.
+        """
+        return _norm_cdf((np.asarray(x, dtype=float) - self.loc) / self.scale)[()]
+
+    def from_unit(self, u: float) -> float:
+        """
+        Decode the given `u` of [0, 1] using the inverse CDF of the distribution.
+
+        :param u: The encoded value.
+        :return: The decoded value.
+        """
+        return (self.loc + self.scale * _norm_ppf(u))[()]
+
+    def sample(self, size=None, rng=None):
+        rng = np.random.default_rng(rng)
+        return rng.normal(self.loc, self.scale, size=size)
+
     def _plot_min_value(self):
         return self.mean() - 3 * self.scale
 
@@ -76,7 +310,7 @@ class Normal(Distribution):
         return "loc={self.loc:g}, scale={self.scale:g}".format(self=self)
 
 
-class QNormal(Normal, QMixin):
+class QNormal(QMixin, Normal):
     """
     The quantized normal distribution acts the same as the normal distribution,
     but the values, that get samples are quantized.
@@ -88,22 +322,4 @@ class QNormal(Normal, QMixin):
     """
 
     def __init__(self, loc: float, scale: float, q: float):
-        super().__init__(loc=loc, scale=scale)
-        QMixin.__init__(self, q=q)
-
-    def mean(self) -> float:
-        """
-        Calculate and return the mean value of the distribution
-
-        :return: The mean value of this distribution
-        """
-        return self.round_to_q(super().mean())
-
-    def pdf(self, x) -> float:
-        """
-        Calculate the probability for the given `x` to be sampled.
-
-        :param x: The value to calculate the probability for.
-        :return: The probability that the given value is sampled.
-        """
-        return super().pdf(self.round_to_q(x))
+        super().__init__(loc=loc, scale=scale, q=q)
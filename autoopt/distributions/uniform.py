@@ -6,6 +6,11 @@ It implements two different distributions:
     1. The Uniform distribution (Uniform)
     2. The quantized uniform distribution (QUniform)
 """
+import math
+from typing import Tuple
+
+import numpy as np
+
 from .base import Distribution, QMixin
 
 
@@ -28,6 +33,7 @@ class Uniform(Distribution):
         self._min_value = min_value
         self._max_value = max_value
         self.__probability = 1 / (max_value - min_value)
+        self.__log_probability = -np.log(max_value - min_value)
 
     @property
     def min_value(self) -> float:
@@ -48,11 +54,41 @@ class Uniform(Distribution):
         return self._max_value
 
     def pdf(self, x: float):
-        return self.__probability if self.min_value <= x <= self.max_value else 0
+        x = np.asarray(x, dtype=float)
+        inside = (self.min_value <= x) & (x <= self.max_value)
+        return np.where(inside, self.__probability, 0.0)[()]
+
+    def logpdf(self, x: float):
+        x = np.asarray(x, dtype=float)
+        inside = (self.min_value <= x) & (x <= self.max_value)
+        return np.where(inside, self.__log_probability, -np.inf)[()]
+
+    def cdf(self, x: float):
+        x = np.asarray(x, dtype=float)
+        return np.clip(
+            (x - self.min_value) / (self.max_value - self.min_value), 0.0, 1.0
+        )[()]
+
+    def ppf(self, q: float):
+        q = np.asarray(q, dtype=float)
+        x = self.min_value + q * (self.max_value - self.min_value)
+        return np.where((q < 0) | (q > 1), np.nan, x)[()]
+
+    def to_unit(self, x: float):
+        x = np.asarray(x, dtype=float)
+        return ((x - self.min_value) / (self.max_value - self.min_value))[()]
+
+    def from_unit(self, u: float):
+        u = np.asarray(u, dtype=float)
+        return (self.min_value + u * (self.max_value - self.min_value))[()]
 
     def mean(self):
         return 0.5 * (self.min_value + self.max_value)
 
+    def sample(self, size=None, rng=None):
+        rng = np.random.default_rng(rng)
+        return rng.uniform(self.min_value, self.max_value, size=size)
+
     def _plot_min_value(self):
         return self.min_value - 1
 
@@ -63,7 +99,7 @@ class Uniform(Distribution):
         return "min={self.min_value:g}, max={self.max_value:g}".format(self=self)
 
 
-class QUniform(Uniform, QMixin):
+class QUniform(QMixin, Uniform):
     """
     The quantized uniform distribution instead, acts as a normal distribution,
     but the values that get sampled, are quantized.
@@ -74,14 +110,18 @@ class QUniform(Uniform, QMixin):
     """
 
     def __init__(self, min_value: float, max_value: float, q: float):
-        super().__init__(min_value=min_value, max_value=max_value)
-        QMixin.__init__(self, q=q)
+        super().__init__(min_value=min_value, max_value=max_value, q=q)
 
-    def pdf(self, x: float):
-        return super().pdf(self.round_to_q(x))
-
-    def mean(self):
-        return self.round_to_q(super().mean())
+    @property
+    def q_bounds(self) -> Tuple[float, float]:
+        # Multiples of q, which are close to a bound, count as inside
+        first = math.ceil(self.min_value / self.q)
+        if math.isclose((first - 1) * self.q, self.min_value):
+            first -= 1
+        last = math.floor(self.max_value / self.q)
+        if math.isclose((last + 1) * self.q, self.max_value):
+            last += 1
+        return first * self.q, last * self.q
 
     def _plot_min_value(self):
         return self.round_to_q(self.min_value) - 2 * self.q
@@ -0,0 +1,12 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# Author: Torben Hansing
+#
+"""
+This module implements the optimizers, which suggest configurations
+of a pipeline based on the losses of the previously evaluated configurations.
+"""
+from .base import Optimizer  # NOQA
+from .cma import CMAOptimizer  # NOQA
+from .gp import GPOptimizer  # NOQA
+from .tpe import TPEOptimizer  # NOQA
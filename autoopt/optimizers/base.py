@@ -0,0 +1,158 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# Author: Torben Hansing
+#
+"""
+This module implements the base class of the optimizers.
+
+Optimizers suggest configurations of a pipeline (`ask`) and learn from the
+losses of the executed configurations (`tell`):
+
+.. code:: python
+
+    optimizer = TPEOptimizer(pipeline.parameter_space(), seed=42)
+    for _ in range(100):
+        configs = optimizer.ask()
+        losses = [loss(pipeline.execute(input_data, **config)) for config in configs]
+        optimizer.tell(configs, losses)
+    config, loss = optimizer.best
+"""
+import abc
+from typing import Any, Dict, List, Sequence, Tuple, Union
+
+import numpy as np
+
+from autoopt.pipelines.space import CompiledSpace
+
+# Points of the unit hypercube are kept away from the borders, because
+# they are mapped to infinite values for unbounded distributions.
+_EPSILON = 1e-6
+
+
+def _grown_capacity(capacity: int, size: int) -> int:
+    """
+    Returns the capacity of a storage, which has to hold `size` items.
+
+    The storage grows geometrically, such that filling it item by item
+    only copies it O(log n) times.
+
+    :param capacity: The current capacity of the storage.
+    :param size: The number of items to store.
+    :return: The new capacity of the storage.
+    """
+    return max(2 * capacity, size, 16)
+
+
+class Optimizer(metaclass=abc.ABCMeta):
+    """
+    The abstract base class of optimizers.
+
+    The optimizer keeps all observations as a matrix of encoded
+    configurations (see `CompiledSpace`) and an array of their losses.
+    Lower losses are better. Failed or pruned configurations can be told
+    with an infinite loss.
+    """
+
+    def __init__(
+        self, space: Union[CompiledSpace, Dict[str, Dict[str, Any]]], seed=None
+    ):
+        """
+        Create a new optimizer for the given parameter space.
+
+        :param space: The parameter space as returned by
+                      `Pipeline.parameter_space()` or a compiled space.
+        :param seed: The seed (or random number generator) of the optimizer.
+        """
+        if not isinstance(space, CompiledSpace):
+            space = CompiledSpace(space)
+        self.__space = space
+        self.__rng = np.random.default_rng(seed)
+        self.__samples = np.empty((16, len(space)))
+        self.__losses = np.empty(16)
+        self.__size = 0
+
+    @property
+    def space(self) -> CompiledSpace:
+        """
+        The compiled parameter space, which is optimized.
+        """
+        return self.__space
+
+    @property
+    def rng(self) -> np.random.Generator:
+        """
+        The random number generator of the optimizer.
+        """
+        return self.__rng
+
+    @property
+    def samples(self) -> np.ndarray:
+        """
+        The (N x d) matrix of the encoded configurations observed so far.
+        """
+        return self.__samples[: self.__size]
+
+    @property
+    def losses(self) -> np.ndarray:
+        """
+        The losses of the configurations observed so far.
+        """
+        return self.__losses[: self.__size]
+
+    @property
+    def best(self) -> Tuple[Dict[str, Dict[str, Any]], float]:
+        """
+        The configuration with the lowest loss observed so far and its loss.
+        """
+        if self.__size == 0:
+            raise ValueError("No configuration has been observed yet")
+        index = int(np.argmin(self.losses))
+        return self.__space.decode(self.samples[index])[0], float(self.losses[index])
+
+    @abc.abstractmethod
+    def ask(self, size: int = 1) -> List[Dict[str, Dict[str, Any]]]:
+        """
+        Suggest new configurations to evaluate.
+
+        :param size: The number of configurations to suggest.
+        :return: The configurations, which can be passed to `Pipeline.execute`.
+        """
+        raise NotImplementedError("Has to be implemented by subclasses")
+
+    def tell(
+        self, configs: Sequence[Dict[str, Dict[str, Any]]], losses: Sequence[float]
+    ):
+        """
+        Report the losses of evaluated configurations.
+
+        :param configs: The evaluated configurations.
+        :param losses: The loss of each configuration.
+        """
+        losses = np.asarray(losses, dtype=float).reshape(-1)
+        if len(configs) != len(losses):
+            raise ValueError(
+                f"Got {len(configs)} configurations but {len(losses)} losses"
+            )
+        # NaN losses of failed configurations are treated as the worst loss
+        losses = np.where(np.isnan(losses), np.inf, losses)
+        samples = self.__space.encode(list(configs))
+        self._observe(samples, losses)
+        start, stop = self.__size, self.__size + len(losses)
+        if stop > len(self.__losses):
+            capacity = _grown_capacity(len(self.__losses), stop)
+            self.__samples = np.resize(self.__samples, (capacity, len(self.__space)))
+            self.__losses = np.resize(self.__losses, capacity)
+        self.__samples[start:stop] = samples
+        self.__losses[start:stop] = losses
+        self.__size = stop
+
+    def _observe(self, samples: np.ndarray, losses: np.ndarray):
+        """
+        Called with the new observations after each `tell`.
+
+        Subclasses can overwrite this to update their model incrementally.
+        If this raises an exception, the observations are not stored.
+
+        :param samples: The (n x d) matrix of the encoded configurations.
+        :param losses: The n losses of the configurations.
+        """
@@ -0,0 +1,339 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# Author: Torben Hansing
+#
+"""
+This module implements the covariance matrix adaptation evolution strategy
+(CMA-ES).
+
+The evolution strategy samples populations from a multivariate normal
+distribution on the unit hypercube encoding of the parameter space (see
+`CompiledSpace.from_unit`). Thus, bounded parameters are clipped to their
+bounds, quantized parameters are rounded and normal parameters are
+transformed by their quantile function.
+
+A whole population can be evaluated in parallel:
+
+.. code:: python
+
+    optimizer = CMAOptimizer(pipeline.parameter_space(), seed=42)
+    evaluator = ParallelEvaluator(pipeline)
+    for _ in range(50):
+        configs = optimizer.ask(optimizer.population_size)
+        results = evaluator.evaluate(input_data, configs)
+        optimizer.tell(configs, [loss(result.result) for result in results])
+"""
+import dataclasses
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Union
+
+import numpy as np
+
+from autoopt.pipelines.space import CompiledSpace
+from .base import _EPSILON, Optimizer
+
+
+def _expected_norm(dimensions: int) -> float:
+    """
+    Approximate the expected norm of a standard normally distributed vector.
+
+    :param dimensions: The number of dimensions of the vector.
+    :return: The expected norm.
+    """
+    return np.sqrt(dimensions) * (1 - 1 / (4 * dimensions) + 1 / (21 * dimensions**2))
+
+
+@dataclasses.dataclass(frozen=True)
+class _StrategyParameters:
+    """
+    The learning rates and weights of the evolution strategy.
+    """
+
+    weights: np.ndarray
+    c_sigma: float
+    d_sigma: float
+    c_c: float
+    c_1: float
+    c_mu: float
+    eigen_interval: int
+
+    @property
+    def mu_eff(self) -> float:
+        """
+        The variance effective selection mass of the weights.
+        """
+        return 1 / np.sum(self.weights**2)
+
+    @classmethod
+    def default(
+        cls, dimensions: int, population_size: int, eigen_interval: Optional[int]
+    ) -> "_StrategyParameters":
+        """
+        Create the default strategy parameters of Hansen's CMA-ES tutorial.
+
+        :param dimensions: The number of dimensions of the search space.
+        :param population_size: The number of points per generation.
+        :param eigen_interval: The number of generations between the
+                               eigendecompositions or None for the default.
+        :return: The strategy parameters.
+        """
+        num_parents = population_size // 2
+        weights = np.log(num_parents + 0.5) - np.log(np.arange(1, num_parents + 1))
+        weights = weights / weights.sum()
+        mu_eff, n = 1 / np.sum(weights**2), dimensions
+        c_sigma = (mu_eff + 2) / (n + mu_eff + 5)
+        c_1 = 2 / ((n + 1.3) ** 2 + mu_eff)
+        c_mu = min(1 - c_1, 2 * (mu_eff - 2 + 1 / mu_eff) / ((n + 2) ** 2 + mu_eff))
+        if eigen_interval is None:
+            eigen_interval = int(1 / (10 * n * (c_1 + c_mu)))
+        return cls(
+            weights=weights,
+            c_sigma=c_sigma,
+            d_sigma=1 + 2 * max(0.0, np.sqrt((mu_eff - 1) / (n + 1)) - 1) + c_sigma,
+            c_c=(4 + mu_eff / n) / (n + 4 + 2 * mu_eff / n),
+            c_1=c_1,
+            c_mu=c_mu,
+            eigen_interval=max(eigen_interval, 1),
+        )
+
+
+@dataclasses.dataclass
+class _SearchState:
+    """
+    The search distribution and the evolution paths of the evolution strategy.
+
+    The covariance matrix is kept together with its eigendecomposition
+    B diag(D^2) B^T (`basis` and `scales`).
+    """
+
+    mean: np.ndarray
+    sigma: float
+    covariance: np.ndarray
+    basis: np.ndarray
+    scales: np.ndarray
+    path_sigma: np.ndarray
+    path_c: np.ndarray
+
+    @classmethod
+    def initial(cls, dimensions: int, sigma: float) -> "_SearchState":
+        """
+        Create an isotropic search distribution in the center of the unit
+        hypercube.
+
+        :param dimensions: The number of dimensions of the search space.
+        :param sigma: The initial step size.
+        :return: The initial state.
+        """
+        return cls(
+            mean=np.full(dimensions, 0.5),
+            sigma=sigma,
+            covariance=np.eye(dimensions),
+            basis=np.eye(dimensions),
+            scales=np.ones(dimensions),
+            path_sigma=np.zeros(dimensions),
+            path_c=np.zeros(dimensions),
+        )
+
+
+class CMAOptimizer(Optimizer):
+    """
+    Optimizes a parameter space using the covariance matrix adaptation
+    evolution strategy.
+
+    The distribution is updated each time the losses of `population_size`
+    configurations have been told. Configurations suggested by `ask` are
+    remembered until they are told, so that the update uses the sampled
+    points instead of their quantized values.
+
+    The eigendecomposition of the covariance matrix costs O(d^3) and is
+    only updated every `eigen_interval` generations.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        space: Union[CompiledSpace, Dict[str, Dict[str, Any]]],
+        population_size: Optional[int] = None,
+        sigma: float = 0.3,
+        eigen_interval: Optional[int] = None,
+        seed=None,
+    ):
+        """
+        Create a new CMA-ES optimizer for the given parameter space.
+
+        :param space: The parameter space as returned by
+                      `Pipeline.parameter_space()` or a compiled space.
+        :param population_size: The number of configurations per generation.
+                                Defaults to 4 + 3 ln(d).
+        :param sigma: The initial step size in the unit hypercube.
+        :param eigen_interval: The number of generations between the
+                               eigendecompositions of the covariance matrix.
+                               Defaults to a value depending on the learning
+                               rates, such that the decomposition costs
+                               O(d^2) per configuration.
+        :param seed: The seed (or random number generator) of the optimizer.
+        """
+        super().__init__(space, seed)
+        dimensions = len(self.space)
+        if dimensions == 0:
+            raise ValueError(
+                "CMA-ES needs at least one parameter, but the parameter space is empty"
+            )
+        if population_size is None:
+            population_size = 4 + int(3 * np.log(dimensions))
+        if population_size < 2:
+            raise ValueError(
+                f"The population size has to be at least 2, but got {population_size}"
+            )
+        if sigma <= 0:
+            raise ValueError(f"The step size has to be positive, but got {sigma}")
+        self.__population_size = population_size
+        self.__parameters = _StrategyParameters.default(
+            dimensions, population_size, eigen_interval
+        )
+        self.__state = _SearchState.initial(dimensions, sigma)
+        self.__generation = 0
+        self.__pending = defaultdict(list)
+        self.__offspring = []
+
+    @property
+    def population_size(self) -> int:
+        """
+        The number of configurations per generation.
+        """
+        return self.__population_size
+
+    @property
+    def generation(self) -> int:
+        """
+        The number of generations, which have been completed.
+        """
+        return self.__generation
+
+    @property
+    def mean(self) -> np.ndarray:
+        """
+        The mean of the search distribution in the unit hypercube.
+        """
+        return self.__state.mean.copy()
+
+    @property
+    def sigma(self) -> float:
+        """
+        The step size of the search distribution.
+        """
+        return self.__state.sigma
+
+    @property
+    def covariance(self) -> np.ndarray:
+        """
+        The covariance matrix of the search distribution (without the step size).
+        """
+        return self.__state.covariance.copy()
+
+    @property
+    def num_pending(self) -> int:
+        """
+        The number of suggested configurations, which have not been told yet.
+        """
+        return sum(len(points) for points in self.__pending.values())
+
+    def ask(self, size: int = 1) -> List[Dict[str, Dict[str, Any]]]:
+        state = self.__state
+        normal = self.rng.standard_normal((size, len(self.space)))
+        points = state.mean + state.sigma * (normal * state.scales) @ state.basis.T
+        points = np.clip(points, _EPSILON, 1 - _EPSILON)
+        samples = self.space.from_unit(points)
+        for sample, point in zip(samples, points):
+            self.__pending[sample.tobytes()].append(point)
+        return self.space.decode(samples)
+
+    def _observe(self, samples, losses):
+        for sample, loss in zip(samples, losses):
+            key = sample.tobytes()
+            if self.__pending.get(key):
+                point = self.__pending[key].pop()
+                if not self.__pending[key]:
+                    del self.__pending[key]
+            else:
+                # The configuration has not been suggested by this optimizer
+                unit = self.space.to_unit(sample[None, :])[0]
+                point = np.clip(np.nan_to_num(unit, nan=0.5), _EPSILON, 1 - _EPSILON)
+            self.__offspring.append((loss, point))
+        while len(self.__offspring) >= self.__population_size:
+            population = self.__offspring[: self.__population_size]
+            del self.__offspring[: self.__population_size]
+            self._update(
+                np.array([loss for loss, _ in population]),
+                np.array([point for _, point in population]),
+            )
+
+    def _update(self, losses: np.ndarray, points: np.ndarray):
+        """
+        Update the search distribution with a complete generation.
+
+        :param losses: The losses of the population.
+        :param points: The (lambda x d) matrix of the points of the population.
+        """
+        parameters, state = self.__parameters, self.__state
+        parents = np.argsort(losses, kind="stable")[: len(parameters.weights)]
+        steps = (points[parents] - state.mean) / state.sigma
+        step = parameters.weights @ steps
+        state.mean = state.mean + state.sigma * step
+        h_sigma = self._update_paths(step)
+        self._adapt_covariance(steps, h_sigma)
+        norm = np.linalg.norm(state.path_sigma) / _expected_norm(len(state.mean))
+        state.sigma *= np.exp(parameters.c_sigma / parameters.d_sigma * (norm - 1))
+        self.__generation += 1
+        if self.__generation % parameters.eigen_interval == 0:
+            self._decompose()
+
+    def _update_paths(self, step: np.ndarray) -> float:
+        """
+        Update the evolution paths of the step size and the covariance matrix.
+
+        :param step: The weighted mean of the steps of the parents.
+        :return: 0, if the update of the covariance path stalled, otherwise 1.
+        """
+        parameters, state = self.__parameters, self.__state
+        c_sigma, c_c = parameters.c_sigma, parameters.c_c
+        # C^-1/2 y = B D^-1 B^T y
+        whitened = state.basis @ ((state.basis.T @ step) / state.scales)
+        state.path_sigma = (1 - c_sigma) * state.path_sigma + np.sqrt(
+            c_sigma * (2 - c_sigma) * parameters.mu_eff
+        ) * whitened
+        norm = np.linalg.norm(state.path_sigma)
+        correction = np.sqrt(1 - (1 - c_sigma) ** (2 * (self.__generation + 1)))
+        dimensions = len(state.mean)
+        threshold = (1.4 + 2 / (dimensions + 1)) * _expected_norm(dimensions)
+        h_sigma = 0.0 if norm / correction >= threshold else 1.0
+        state.path_c = (1 - c_c) * state.path_c + h_sigma * np.sqrt(
+            c_c * (2 - c_c) * parameters.mu_eff
+        ) * step
+        return h_sigma
+
+    def _adapt_covariance(self, steps: np.ndarray, h_sigma: float):
+        """
+        Apply the rank-one and the rank-mu update to the covariance matrix.
+
+        :param steps: The (mu x d) matrix of the steps of the parents.
+        :param h_sigma: 0, if the update of the covariance path stalled.
+        """
+        parameters, state = self.__parameters, self.__state
+        c_c, c_1, c_mu = parameters.c_c, parameters.c_1, parameters.c_mu
+        rank_one = np.outer(state.path_c, state.path_c)
+        rank_mu = (steps * parameters.weights[:, None]).T @ steps
+        state.covariance = (
+            (1 - c_1 - c_mu) * state.covariance
+            + c_1 * (rank_one + (1 - h_sigma) * c_c * (2 - c_c) * state.covariance)
+            + c_mu * rank_mu
+        )
+
+    def _decompose(self):
+        """
+        Update the eigendecomposition of the covariance matrix.
+        """
+        state = self.__state
+        # Enforce the symmetry, which suffers from rounding errors
+        state.covariance = np.triu(state.covariance) + np.triu(state.covariance, 1).T
+        eigenvalues, state.basis = np.linalg.eigh(state.covariance)
+        state.scales = np.sqrt(np.maximum(eigenvalues, 1e-20))
@@ -0,0 +1,250 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# Author: Torben Hansing
+#
+"""
+This module implements a Bayesian optimizer using a Gaussian process.
+
+The Gaussian process models the losses on the unit hypercube encoding of the
+parameter space (see `CompiledSpace.to_unit`) using a Matérn 5/2 kernel.
+The next configurations are the candidates with the highest expected
+improvement over the best loss observed so far.
+
+Conditioning the Gaussian process on n observations requires the Cholesky
+factor L of the (n x n) kernel matrix, which costs O(n^3) to compute.
+Instead of refactorizing it after each observation, the optimizer keeps the
+inverse of the Cholesky factor and extends it by the new observations:
+
+.. code::
+
+    L' = | L   0 |        L'^-1 = |  L^-1             0    |
+         | B^T C |                | -C^-1 B^T L^-1    C^-1 |
+
+    with B^T = K(new, old) L^-T and C C^T = K(new, new) - B^T B
+
+For m new observations, this costs O(n^2 m) using matrix products only.
+"""
+from typing import Any, Dict, List, Union
+
+import numpy as np
+
+from autoopt.distributions.normal import _norm_cdf
+from autoopt.pipelines.space import CompiledSpace
+from .base import _EPSILON, Optimizer, _grown_capacity
+
+_SQRT_5 = np.sqrt(5.0)
+_LOG_SQRT_2PI = 0.5 * np.log(2 * np.pi)
+
+
+def _matern52(first: np.ndarray, second: np.ndarray, lengthscale: float):
+    """
+    Calculate the Matérn 5/2 kernel between two sets of points.
+
+    :param first: A (n x d) matrix of points.
+    :param second: A (m x d) matrix of points.
+    :param lengthscale: The lengthscale of the kernel.
+    :return: The (n x m) kernel matrix.
+    """
+    squared = (
+        np.sum(first**2, axis=1)[:, None]
+        + np.sum(second**2, axis=1)[None, :]
+        - 2 * first @ second.T
+    )
+    scaled = _SQRT_5 * np.sqrt(np.maximum(squared, 0.0)) / lengthscale
+    return (1 + scaled + scaled**2 / 3) * np.exp(-scaled)
+
+
+def _jittered_cholesky(matrix: np.ndarray, jitter: float) -> np.ndarray:
+    """
+    Calculate the Cholesky factor of a matrix, whose diagonal is increased
+    by the jitter. The jitter is increased, until the factorization succeeds.
+
+    :param matrix: The symmetric (n x n) matrix to factorize.
+    :param jitter: The initial jitter to add to the diagonal.
+    :return: The lower triangular Cholesky factor.
+    """
+    while True:
+        try:
+            return np.linalg.cholesky(matrix + jitter * np.eye(len(matrix)))
+        except np.linalg.LinAlgError:
+            # The points are (nearly) duplicates of other points
+            jitter *= 10
+
+
+class GPOptimizer(Optimizer):
+    """
+    Optimizes a parameter space using a Gaussian process and the expected
+    improvement.
+
+    The Gaussian process works on the unit hypercube encoding of the space.
+    Thus, it's best suited for continuous parameters. The hyperparameters
+    of the kernel are fixed, which allows to update the model incrementally.
+    The losses are standardized before they are modeled.
+
+    The first `num_initial` configurations are sampled from the prior
+    distributions of the space.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        space: Union[CompiledSpace, Dict[str, Dict[str, Any]]],
+        num_initial: int = 10,
+        num_candidates: int = 1000,
+        lengthscale: float = 0.25,
+        noise: float = 1e-6,
+        seed=None,
+    ):
+        """
+        Create a new Gaussian process optimizer for the given parameter space.
+
+        :param space: The parameter space as returned by
+                      `Pipeline.parameter_space()` or a compiled space.
+        :param num_initial: The number of random configurations to sample,
+                            before the Gaussian process is used.
+        :param num_candidates: The number of random candidates, for which the
+                               expected improvement is calculated.
+        :param lengthscale: The lengthscale of the kernel in the unit hypercube.
+        :param noise: The variance of the noise of the losses, relative to
+                      the variance of the losses.
+        :param seed: The seed (or random number generator) of the optimizer.
+        """
+        super().__init__(space, seed)
+        if lengthscale <= 0:
+            raise ValueError(
+                f"The lengthscale has to be positive, but got {lengthscale}"
+            )
+        if noise <= 0:
+            raise ValueError(f"The noise has to be positive, but got {noise}")
+        self.__num_initial = num_initial
+        self.__num_candidates = num_candidates
+        self.__lengthscale = lengthscale
+        self.__noise = noise
+        self.__units = np.empty((0, len(self.space)))
+        self.__inverse = np.empty((0, 0))
+        self.__size = 0
+
+    @property
+    def cholesky_inverse(self) -> np.ndarray:
+        """
+        The inverse of the Cholesky factor of the kernel matrix of the
+        observations.
+        """
+        return self.__inverse[: self.__size, : self.__size]
+
+    def _kernel(self, first: np.ndarray, second: np.ndarray) -> np.ndarray:
+        return _matern52(first, second, self.__lengthscale)
+
+    def _reserve(self, size: int):
+        """
+        Grow the storage of the observations to hold at least `size` points.
+        """
+        if size <= len(self.__units):
+            return
+        capacity = _grown_capacity(len(self.__units), size)
+        grown_units = np.empty((capacity, len(self.space)))
+        grown_units[: self.__size] = self.__units[: self.__size]
+        grown_inverse = np.zeros((capacity, capacity))
+        grown_inverse[: self.__size, : self.__size] = self.cholesky_inverse
+        self.__units, self.__inverse = grown_units, grown_inverse
+
+    def _observe(self, samples, losses):
+        with np.errstate(invalid="ignore", divide="ignore"):
+            units = self.space.to_unit(samples)
+        invalid = np.isnan(units).any(axis=0)
+        if invalid.any():
+            names = [
+                f"{node_name}.{name}"
+                for (node_name, name), column in zip(self.space.keys, invalid)
+                if column
+            ]
+            raise ValueError(
+                "Can't observe configurations with values outside of the "
+                f"parameter space: {', '.join(names)}"
+            )
+        units = np.clip(units, 0.0, 1.0)
+        size, new = self.__size, len(units)
+        stop = size + new
+        self._reserve(stop)
+
+        inverse = self.__inverse[:size, :size]
+        # B^T = K(new, old) L^-T
+        cross = self._kernel(units, self.__units[:size]) @ inverse.T
+        factor = _jittered_cholesky(
+            self._kernel(units, units) - cross @ cross.T, self.__noise
+        )
+        factor_inverse = np.linalg.inv(factor)
+        self.__inverse[size:stop, :size] = -factor_inverse @ cross @ inverse
+        self.__inverse[size:stop, size:stop] = factor_inverse
+        self.__units[size:stop] = units
+        self.__size = stop
+
+    def _targets(self) -> np.ndarray:
+        """
+        Returns the standardized losses. Infinite losses are replaced by the
+        worst finite loss.
+        """
+        losses = self.losses
+        finite = np.isfinite(losses)
+        if not finite.any():
+            return np.zeros(len(losses))
+        losses = np.where(finite, losses, losses[finite].max())
+        deviation = losses.std()
+        return (losses - losses.mean()) / (deviation if deviation > 0 else 1.0)
+
+    def predict(self, units: np.ndarray):
+        """
+        Predict the standardized losses at points of the unit hypercube.
+
+        :param units: A (m x d) matrix of points in the unit hypercube.
+        :return: The means and the standard deviations of the predictions.
+        """
+        units = np.atleast_2d(np.asarray(units, dtype=float))
+        inverse = self.cholesky_inverse
+        targets = self._targets()
+        # K(units, X) L^-T, such that mean = A L^-1 y and var = 1 - |A|^2
+        projected = self._kernel(units, self.__units[: self.__size]) @ inverse.T
+        mean = projected @ (inverse @ targets)
+        variance = 1.0 - np.sum(projected**2, axis=1)
+        return mean, np.sqrt(np.maximum(variance, 1e-12))
+
+    def expected_improvement(self, units: np.ndarray) -> np.ndarray:
+        """
+        Calculate the expected improvement of points of the unit hypercube
+        over the best loss observed so far.
+
+        :param units: A (m x d) matrix of points in the unit hypercube.
+        :return: The expected improvement of each point.
+        """
+        mean, deviation = self.predict(units)
+        improvement = self._targets().min() - mean
+        z = improvement / deviation
+        density = np.exp(-0.5 * z**2 - _LOG_SQRT_2PI)
+        return improvement * _norm_cdf(z) + deviation * density
+
+    def ask(self, size: int = 1) -> List[Dict[str, Dict[str, Any]]]:
+        if self.__size < max(self.__num_initial, 1):
+            return self.space.decode(self.space.sample(size, rng=self.rng))
+
+        dimensions = len(self.space)
+        num_candidates = max(self.__num_candidates, size)
+        # Random candidates and perturbations of the best observations
+        best = self.__units[np.argsort(self.losses, kind="stable")[:5]]
+        local = best[self.rng.integers(len(best), size=num_candidates // 2)]
+        local = local + self.rng.normal(
+            scale=0.1 * self.__lengthscale, size=local.shape
+        )
+        candidates = np.concatenate(
+            [self.rng.random((num_candidates - len(local), dimensions)), local]
+        )
+        candidates = np.clip(candidates, _EPSILON, 1 - _EPSILON)
+        # Evaluate the candidates at their decoded (e.g. quantized) values
+        samples = self.space.from_unit(candidates)
+        candidates = np.clip(self.space.to_unit(samples), 0.0, 1.0)
+
+        scores = self.expected_improvement(candidates)
+        order = np.argsort(-np.nan_to_num(scores, nan=-np.inf), kind="stable")
+        _, first = np.unique(samples[order], axis=0, return_index=True)
+        chosen = order[np.sort(first)[:size]]
+        if len(chosen) < size:
+            chosen = order[:size]
+        return self.space.decode(samples[chosen])
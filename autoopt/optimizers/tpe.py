@@ -0,0 +1,359 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# Author: Torben Hansing
+#
+"""
+This module implements the Tree-structured Parzen Estimator (TPE).
+
+TPE splits the observed configurations into the fraction `gamma` of good
+configurations and the remaining bad ones. For each parameter, it fits a
+Parzen estimator (a mixture of kernels around the observed values and the
+prior distribution) to both groups: l(x) for the good and g(x) for the bad
+configurations. Then, it draws candidates from l(x) and suggests the
+candidates maximizing l(x) / g(x), which maximizes the expected improvement.
+
+The kernels follow the distributions of the parameters:
+
+* Uniform distributions use Gaussian kernels truncated to their bounds.
+* Logarithmic distributions use the kernels on the logarithm of the values.
+* Quantized distributions use the mass of the kernels in the bin
+  of width `q` around each value.
+* Choices use the smoothed counts of the observed choices.
+
+The densities of all candidates are evaluated as (candidates x kernels)
+matrices for each parameter. Thus, thousands of candidates can be scored
+within milliseconds.
+"""
+from typing import Any, Dict, List, Union
+
+import numpy as np
+
+from autoopt.distributions import WeightedChoice
+from autoopt.distributions.base import Distribution
+from autoopt.distributions.normal import _norm_cdf, _norm_ppf
+from autoopt.pipelines.space import _NORMAL_TYPES, _UNIFORM_TYPES, CompiledSpace
+from .base import Optimizer
+
+_LOG_SQRT_2PI = 0.5 * np.log(2 * np.pi)
+
+
+def _logsumexp(values: np.ndarray, axis: int) -> np.ndarray:
+    maximum = np.max(values, axis=axis, keepdims=True)
+    maximum = np.where(np.isfinite(maximum), maximum, 0.0)
+    with np.errstate(divide="ignore"):
+        summed = np.log(np.sum(np.exp(values - maximum), axis=axis))
+    return summed + np.squeeze(maximum, axis=axis)
+
+
+class _ParzenEstimator:
+    """
+    A mixture of Gaussian kernels truncated to [low, high].
+    """
+
+    def __init__(self, mus, sigmas, weights, bounds):
+        self.mus = mus
+        self.sigmas = sigmas
+        self.bounds = bounds
+        # The CDF of each kernel at the bounds
+        self.lower = _norm_cdf((bounds[0] - mus) / sigmas)
+        self.upper = _norm_cdf((bounds[1] - mus) / sigmas)
+        self.weights = weights / weights.sum()
+        with np.errstate(divide="ignore"):
+            self.log_weights = np.log(self.weights) - np.log(self.upper - self.lower)
+
+    def sample(self, size: int, rng: np.random.Generator) -> np.ndarray:
+        """
+        Draw `size` values from the mixture.
+        """
+        components = rng.choice(len(self.mus), size=size, p=self.weights)
+        lower = self.lower[components]
+        upper = self.upper[components]
+        units = lower + rng.random(size) * (upper - lower)
+        values = self.mus[components] + self.sigmas[components] * _norm_ppf(units)
+        return np.clip(values, *self.bounds)
+
+    def logpdf(self, values: np.ndarray) -> np.ndarray:
+        """
+        Calculate the log-density of the mixture for each value.
+        """
+        z = (values[:, None] - self.mus) / self.sigmas
+        log_kernels = -0.5 * z**2 - np.log(self.sigmas) - _LOG_SQRT_2PI
+        log_density = _logsumexp(log_kernels + self.log_weights, axis=1)
+        low, high = self.bounds
+        inside = (low <= values) & (values <= high)
+        return np.where(inside, log_density, -np.inf)
+
+    def log_mass(self, lower: np.ndarray, upper: np.ndarray) -> np.ndarray:
+        """
+        Calculate the logarithm of the mass of the mixture in [lower, upper].
+        """
+        lower = np.clip(lower, *self.bounds)[:, None]
+        upper = np.clip(upper, *self.bounds)[:, None]
+        mass = _norm_cdf((upper - self.mus) / self.sigmas) - _norm_cdf(
+            (lower - self.mus) / self.sigmas
+        )
+        with np.errstate(divide="ignore"):
+            return _logsumexp(np.log(np.maximum(mass, 0)) + self.log_weights, axis=1)
+
+
+class _NumericColumn:
+    """
+    The Parzen estimators of a (log-)uniform or (log-)normal parameter.
+
+    The kernels are placed in the transformed space, in which the prior is
+    uniform or normal (the logarithm of the values for logarithmic
+    distributions).
+    """
+
+    def __init__(self, dist: Distribution):
+        self.dist = dist
+        if type(dist) in _UNIFORM_TYPES:
+            self.log, self.quantized = _UNIFORM_TYPES[type(dist)]
+            transform = np.log if self.log else float
+            self.low = transform(dist.min_value)
+            self.high = transform(dist.max_value)
+            self.prior_mu = (self.low + self.high) / 2
+            self.prior_sigma = self.high - self.low
+        else:
+            self.log, self.quantized = _NORMAL_TYPES[type(dist)]
+            self.low, self.high = -np.inf, np.inf
+            self.prior_mu = dist.loc
+            self.prior_sigma = dist.scale
+
+    def _transform(self, values: np.ndarray) -> np.ndarray:
+        if not self.log:
+            return values
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.log(values)
+
+    def fit(self, values: np.ndarray, prior_weight: float) -> _ParzenEstimator:
+        """
+        Fit a Parzen estimator to the observed values.
+
+        The bandwidth of each kernel is the larger distance to its neighbors,
+        clipped to a range depending on the number of observations.
+        """
+        mus = self._transform(values)
+        mus = np.clip(mus[np.isfinite(mus)], self.low, self.high)
+        points = np.sort(np.concatenate([[self.prior_mu], mus]))
+        gaps = np.diff(points)
+        left = np.concatenate([[points[0] - self.low], gaps])
+        right = np.concatenate([gaps, [self.high - points[-1]]])
+        # Unbounded distributions only use the gap to the inner neighbor
+        bandwidths = np.maximum(
+            np.where(np.isfinite(left), left, 0.0),
+            np.where(np.isfinite(right), right, 0.0),
+        )
+        sigmas = bandwidths[np.searchsorted(points, mus)]
+        minimum = self.prior_sigma / min(100.0, 1.0 + len(mus))
+        sigmas = np.clip(sigmas, minimum, self.prior_sigma)
+        return _ParzenEstimator(
+            np.concatenate([[self.prior_mu], mus]),
+            np.concatenate([[self.prior_sigma], sigmas]),
+            np.concatenate([[prior_weight], np.ones(len(mus))]),
+            (self.low, self.high),
+        )
+
+    def sample(self, estimator: _ParzenEstimator, size, rng) -> np.ndarray:
+        """
+        Draw `size` values of the parameter from the estimator.
+        """
+        values = estimator.sample(size, rng)
+        if self.log:
+            values = np.exp(values)
+        if self.quantized:
+            values = self.dist.round_to_support(values)
+        return values
+
+    def log_likelihood(self, estimator: _ParzenEstimator, values) -> np.ndarray:
+        """
+        Calculate the log-likelihood of the values of the parameter.
+        """
+        if not self.quantized:
+            # The Jacobian of the logarithm is the same for all estimators
+            # and cancels out in the ratio of the likelihoods.
+            return estimator.logpdf(self._transform(values))
+        # Quantized values only take a few distinct values. Thus, the masses
+        # of the bins are only calculated once for each of these values.
+        bins, inverse = np.unique(values, return_inverse=True)
+        # The first and last bins contain all values beyond the bounds
+        q_low, q_high = self.dist.q_bounds
+        lower = np.where(bins <= q_low, -np.inf, bins - self.dist.q / 2)
+        upper = np.where(bins >= q_high, np.inf, bins + self.dist.q / 2)
+        lower = self._transform(lower)
+        upper = self._transform(upper)
+        lower = np.where(np.isnan(lower), -np.inf, lower)
+        return estimator.log_mass(lower, upper)[inverse.reshape(-1)]
+
+
+class _ChoiceColumn:
+    """
+    The smoothed counts of the observed choices of a choice parameter.
+    """
+
+    def __init__(self, dist: WeightedChoice):
+        self.prior = dist.probabilities
+
+    def fit(self, values: np.ndarray, prior_weight: float) -> np.ndarray:
+        """
+        Calculate the probabilities of the choices from the observed indices.
+        """
+        values = values[np.isfinite(values)].astype(int)
+        counts = np.bincount(values, minlength=len(self.prior))
+        weights = counts + prior_weight * self.prior
+        return weights / weights.sum()
+
+    def sample(self, probabilities: np.ndarray, size, rng) -> np.ndarray:
+        """
+        Draw `size` indices of choices with the given probabilities.
+        """
+        return rng.choice(len(probabilities), size=size, p=probabilities).astype(float)
+
+    def log_likelihood(self, probabilities: np.ndarray, values) -> np.ndarray:
+        """
+        Calculate the log-likelihood of the indices of choices.
+        """
+        with np.errstate(divide="ignore"):
+            return np.log(probabilities[values.astype(int)])
+
+
+class _PriorColumn:
+    """
+    Samples other distributions from their prior, without scoring them.
+    """
+
+    def __init__(self, dist: Distribution):
+        self.dist = dist
+
+    def fit(self, unused_values, unused_prior_weight):
+        """
+        Nothing is fitted, as the values are always drawn from the prior.
+        """
+        return None
+
+    def sample(self, unused_estimator, size, rng) -> np.ndarray:
+        """
+        Draw `size` values from the prior distribution.
+        """
+        return np.asarray(self.dist.sample(size=size, rng=rng), dtype=float)
+
+    def log_likelihood(self, unused_estimator, values) -> np.ndarray:
+        """
+        Returns the same log-likelihood of 0 for all values.
+        """
+        return np.zeros(len(values))
+
+
+class TPEOptimizer(Optimizer):
+    """
+    Optimizes a parameter space using the Tree-structured Parzen Estimator.
+
+    The first `num_initial` configurations are sampled from the prior
+    distributions of the space.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        space: Union[CompiledSpace, Dict[str, Dict[str, Any]]],
+        num_initial: int = 10,
+        num_candidates: int = 1000,
+        gamma: float = 0.25,
+        prior_weight: float = 1.0,
+        seed=None,
+    ):
+        """
+        Create a new TPE optimizer for the given parameter space.
+
+        :param space: The parameter space as returned by
+                      `Pipeline.parameter_space()` or a compiled space.
+        :param num_initial: The number of random configurations to sample,
+                            before the estimators are used.
+        :param num_candidates: The number of candidates drawn from the
+                               estimators of the good configurations.
+        :param gamma: The fraction of good configurations.
+        :param prior_weight: The weight of the prior in the estimators,
+                             relative to the weight of an observation.
+        :param seed: The seed (or random number generator) of the optimizer.
+        """
+        super().__init__(space, seed)
+        if not 0 < gamma < 1:
+            raise ValueError(f"Gamma has to be in (0, 1), but got {gamma}")
+        self.__num_initial = num_initial
+        self.__num_candidates = num_candidates
+        self.__gamma = gamma
+        self.__prior_weight = prior_weight
+        self.__columns = []
+        for dist in self.space.distributions:
+            if type(dist) in _UNIFORM_TYPES or type(dist) in _NORMAL_TYPES:
+                self.__columns.append(_NumericColumn(dist))
+            elif isinstance(dist, WeightedChoice):
+                self.__columns.append(_ChoiceColumn(dist))
+            else:
+                self.__columns.append(_PriorColumn(dist))
+
+    def _split(self) -> np.ndarray:
+        """
+        Returns a mask of the good observations.
+        """
+        losses = self.losses
+        num_good = max(1, int(np.ceil(self.__gamma * len(losses))))
+        good = np.zeros(len(losses), dtype=bool)
+        good[np.argsort(losses, kind="stable")[:num_good]] = True
+        return good
+
+    def _estimators(self) -> List[tuple]:
+        """
+        Fit the estimators of the good and the bad observations of each column.
+        """
+        good = self._split()
+        estimators = []
+        for column, handler in enumerate(self.__columns):
+            values = self.samples[:, column]
+            estimators.append(
+                (
+                    handler.fit(values[good], self.__prior_weight),
+                    handler.fit(values[~good], self.__prior_weight),
+                )
+            )
+        return estimators
+
+    def _score(self, candidates: np.ndarray, estimators: List[tuple]) -> np.ndarray:
+        scores = np.zeros(len(candidates))
+        for column, (handler, (below, above)) in enumerate(
+            zip(self.__columns, estimators)
+        ):
+            scores += handler.log_likelihood(below, candidates[:, column])
+            scores -= handler.log_likelihood(above, candidates[:, column])
+        # Candidates outside the support of both estimators are the worst
+        return np.nan_to_num(scores, nan=-np.inf)
+
+    def score(self, candidates: np.ndarray) -> np.ndarray:
+        """
+        Calculate the log-likelihood ratio log(l(x) / g(x)) of candidates.
+
+        :param candidates: A (N x d) matrix of encoded configurations.
+        :return: The scores of the candidates. Higher is better.
+        """
+        if len(self.losses) == 0:
+            raise ValueError("No configuration has been observed yet")
+        candidates = np.atleast_2d(np.asarray(candidates, dtype=float))
+        return self._score(candidates, self._estimators())
+
+    def ask(self, size: int = 1) -> List[Dict[str, Dict[str, Any]]]:
+        if len(self.losses) < max(self.__num_initial, 1):
+            return self.space.decode(self.space.sample(size, rng=self.rng))
+
+        estimators = self._estimators()
+        num_candidates = max(self.__num_candidates, size)
+        candidates = np.empty((num_candidates, len(self.space)))
+        for column, (handler, (below, _)) in enumerate(zip(self.__columns, estimators)):
+            candidates[:, column] = handler.sample(below, num_candidates, self.rng)
+        scores = self._score(candidates, estimators)
+
+        # Suggest the best distinct candidates
+        order = np.argsort(-scores, kind="stable")
+        _, first = np.unique(candidates[order], axis=0, return_index=True)
+        best = order[np.sort(first)[:size]]
+        if len(best) < size:
+            best = order[:size]
+        return self.space.decode(candidates[best])
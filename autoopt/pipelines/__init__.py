@@ -7,5 +7,12 @@ This module implements the classes required to define processing pipelines
 which can be used to process some input data and will be optimized during
 the process.
 """
-from .node import PipelineNode  # NOQA
+from .node import AsyncPipelineNode, PipelineNode  # NOQA
 from .pipeline import Pipeline  # NOQA
+from .space import CompiledSpace  # NOQA
+from .cache import DiskCache, MemoryCache, NodeCache  # NOQA
+from .parallel import ParallelEvaluator, TrialResult  # NOQA
+from .dag import DagPipeline  # NOQA
+from .registry import NodeRegistry  # NOQA
+from .profiling import NodeProfile, PipelineHook, Profiler  # NOQA
+from .pruning import MedianPruner, PrunedResult, TimeBudgetPruner, TrialPruned  # NOQA
@@ -0,0 +1,338 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# Author: Torben Hansing
+#
+"""
+This module implements caches for the intermediate results of pipelines.
+
+If two configurations of a pipeline share the parameters of the first nodes,
+these nodes produce the same results. By caching the results of each node,
+a pipeline only needs to execute the nodes after the longest prefix of nodes,
+whose results are already known.
+
+The results are identified by a key, which is derived from a fingerprint of
+the input data of the pipeline, the name and the parameters of the node and
+the key of the previous node. Results of input data or parameters, whose
+content can't be hashed, are not cached. The caches are thread-safe:
+
+.. code:: python
+
+    pipeline = Pipeline(cache=MemoryCache(max_entries=1000))
+
+Large array results can be stored on disk instead. These are memory-mapped
+when read and persist across runs:
+
+.. code:: python
+
+    pipeline = Pipeline(cache=DiskCache("cache", max_bytes=10 * 2**30))
+"""
+import abc
+import hashlib
+import os
+import pickle  # nosec
+import sys
+import tempfile
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from .locking import LockMixin
+
+
+def fingerprint(data: Any) -> Optional[str]:
+    """
+    Calculate a fingerprint of the given data.
+
+    The fingerprint is a hash of the content of the data. Thus, equal data
+    results in the same fingerprint, even across processes. If the content
+    can't be serialized, the data has no fingerprint. The identity of the
+    object is not used instead, as another object can get the same identity,
+    once the data has been garbage collected.
+
+    :param data: The data to calculate the fingerprint for.
+    :return: The fingerprint of the data as hex string, or None, if the
+             content of the data can't be hashed.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    # The raw bytes of object arrays are pointers, so these are pickled as well
+    if isinstance(data, np.ndarray) and not data.dtype.hasobject:
+        digest.update(f"ndarray:{data.dtype.str}:{data.shape}:".encode())
+        digest.update(np.ascontiguousarray(data).data)
+    elif isinstance(data, bytes):
+        digest.update(b"bytes:" + data)
+    else:
+        try:
+            digest.update(b"pickle:" + pickle.dumps(data, protocol=4))
+        except Exception:  # pylint: disable=broad-except
+            return None
+    return digest.hexdigest()
+
+
+def node_key(
+    previous_key: Optional[str], node_name: str, parameters: Dict[str, Any]
+) -> Optional[str]:
+    """
+    Calculate the key of the result of a node.
+
+    :param previous_key: The key of the result of the previous node, or the
+                         fingerprint of the input data for the first node.
+    :param node_name: The name of the node.
+    :param parameters: The parameters, the node gets executed with.
+    :return: The key of the result of the node, or None, if the previous key
+             is None or the parameters can't be hashed. Such results must
+             not be cached.
+    """
+    if previous_key is None:
+        return None
+    try:
+        serialized = pickle.dumps(sorted(parameters.items()), protocol=4)
+    except Exception:  # pylint: disable=broad-except
+        return None
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{previous_key}:{node_name}:".encode())
+    digest.update(serialized)
+    return digest.hexdigest()
+
+
+def _size_of(value: Any) -> int:
+    """
+    Estimate the memory used by the given value in bytes.
+    """
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    return sys.getsizeof(value)
+
+
+class NodeCache(metaclass=abc.ABCMeta):
+    """
+    The abstract base class of caches for the results of pipeline nodes.
+    """
+
+    @abc.abstractmethod
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Return the cached result for the given key.
+
+        :param key: The key of the result.
+        :param default: The value to return, if the result is not cached.
+        :return: The cached result or the default value
+        """
+        raise NotImplementedError("Has to be implemented by subclasses")
+
+    @abc.abstractmethod
+    def put(self, key: str, value: Any):
+        """
+        Store the result of a node in the cache.
+
+        :param key: The key of the result.
+        :param value: The result to store.
+        """
+        raise NotImplementedError("Has to be implemented by subclasses")
+
+    @abc.abstractmethod
+    def __len__(self) -> int:
+        raise NotImplementedError("Has to be implemented by subclasses")
+
+    def __contains__(self, key: str) -> bool:
+        missing = object()
+        return self.get(key, missing) is not missing
+
+
+class MemoryCache(NodeCache, LockMixin):
+    """
+    Caches the results of pipeline nodes in memory.
+
+    If the cache exceeds the maximum number of entries or the maximum
+    total size of the results, the least recently used results are evicted.
+
+    The cached results are shared between the executions of the pipeline.
+    Thus, nodes must not modify their input data in-place.
+
+    The cache can be used by several threads at once.
+    """
+
+    def __init__(
+        self, max_entries: Optional[int] = 128, max_bytes: Optional[int] = None
+    ):
+        """
+        Create a new in-memory cache.
+
+        :param max_entries: The maximum number of results to keep,
+                            ``None`` for no limit.
+        :param max_bytes: The maximum total size of the results to keep in bytes,
+                          ``None`` for no limit.
+        """
+        self.__max_entries = max_entries
+        self.__max_bytes = max_bytes
+        self.__entries = OrderedDict()
+        self.__bytes = 0
+        LockMixin.__init__(self)
+
+    @property
+    def num_bytes(self) -> int:
+        """
+        The estimated total size of the cached results in bytes.
+        """
+        return self.__bytes
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key not in self.__entries:
+                return default
+            self.__entries.move_to_end(key)
+            return self.__entries[key][0]
+
+    def put(self, key, value):
+        size = _size_of(value)
+        if self.__max_bytes is not None and size > self.__max_bytes:
+            return
+        with self._lock:
+            if key in self.__entries:
+                self.__bytes -= self.__entries.pop(key)[1]
+            self.__entries[key] = (value, size)
+            self.__bytes += size
+            while (
+                self.__max_entries is not None
+                and len(self.__entries) > self.__max_entries
+            ) or (self.__max_bytes is not None and self.__bytes > self.__max_bytes):
+                self.__bytes -= self.__entries.popitem(last=False)[1][1]
+
+    def clear(self):
+        """
+        Remove all results from the cache.
+        """
+        with self._lock:
+            self.__entries.clear()
+            self.__bytes = 0
+
+    def __len__(self):
+        return len(self.__entries)
+
+
+class DiskCache(NodeCache, LockMixin):
+    """
+    Caches the results of pipeline nodes as `.npy` files in a directory.
+
+    The files are named by the keys of the results. As the keys are derived
+    from the content of the input data and the parameters of the nodes,
+    the cached results can be reused by later runs. When a result is read,
+    it gets memory-mapped read-only instead of being loaded into memory.
+
+    Only numpy arrays (without python objects) can be cached. Other results
+    are silently not stored. If the files exceed the maximum total size, the
+    least recently used files are removed.
+
+    The cache can be used by several threads at once.
+    """
+
+    SUFFIX = ".npy"
+
+    def __init__(self, directory: str, max_bytes: Optional[int] = None):
+        """
+        Create a new cache in the given directory.
+
+        If the directory already contains cached results, they are reused.
+
+        :param directory: The directory to store the results in.
+        :param max_bytes: The maximum total size of the files in bytes,
+                          ``None`` for no limit.
+        """
+        self.__directory = directory
+        self.__max_bytes = max_bytes
+        self.__entries = OrderedDict()
+        self.__bytes = 0
+        LockMixin.__init__(self)
+        os.makedirs(directory, exist_ok=True)
+        files = []
+        for entry in os.scandir(directory):
+            if entry.is_file() and entry.name.endswith(self.SUFFIX):
+                stat = entry.stat()
+                files.append((stat.st_mtime, entry.name, stat.st_size))
+        for _, name, size in sorted(files):
+            self.__entries[name[: -len(self.SUFFIX)]] = size
+            self.__bytes += size
+        self._evict()
+
+    @property
+    def directory(self) -> str:
+        """
+        The directory, the results are stored in.
+        """
+        return self.__directory
+
+    @property
+    def num_bytes(self) -> int:
+        """
+        The total size of the cached files in bytes.
+        """
+        return self.__bytes
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.__directory, key + self.SUFFIX)
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key not in self.__entries:
+                return default
+            path = self._path(key)
+            try:
+                value = np.load(path, mmap_mode="r")
+                os.utime(path)
+            except FileNotFoundError:
+                # Removed by another process sharing the directory
+                self.__bytes -= self.__entries.pop(key)
+                return default
+            self.__entries.move_to_end(key)
+            return value
+
+    def put(self, key, value):
+        if not isinstance(value, np.ndarray) or value.dtype.hasobject:
+            return
+        handle, temporary = tempfile.mkstemp(dir=self.__directory, suffix=".tmp")
+        try:
+            with os.fdopen(handle, "wb") as stream:
+                np.save(stream, value, allow_pickle=False)
+            size = os.path.getsize(temporary)
+            # Replace the file and its entry at once, so that other threads
+            # don't evict the new file by the old entry
+            with self._lock:
+                os.replace(temporary, self._path(key))
+                if key in self.__entries:
+                    self.__bytes -= self.__entries.pop(key)
+                self.__entries[key] = size
+                self.__bytes += size
+                self._evict()
+        except BaseException:
+            if os.path.exists(temporary):
+                os.remove(temporary)
+            raise
+
+    def _evict(self):
+        """
+        Remove the least recently used files, until the cache fits
+        into the maximum size. The caller has to hold the lock.
+        """
+        while self.__max_bytes is not None and self.__bytes > self.__max_bytes:
+            key, size = self.__entries.popitem(last=False)
+            self.__bytes -= size
+            try:
+                os.remove(self._path(key))
+            except FileNotFoundError:
+                pass
+
+    def clear(self):
+        """
+        Remove all results from the cache.
+        """
+        with self._lock:
+            while self.__entries:
+                key, _ = self.__entries.popitem()
+                try:
+                    os.remove(self._path(key))
+                except FileNotFoundError:
+                    pass
+            self.__bytes = 0
+
+    def __len__(self):
+        return len(self.__entries)
@@ -0,0 +1,295 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# Author: Torben Hansing
+#
+"""
+This module implements processing pipelines with a directed acyclic
+graph of nodes.
+
+In contrast to the linear `Pipeline`, each node can get the results of
+several other nodes as input and its result can be used by several other
+nodes. This allows to define feature unions or ensembles:
+
+.. code:: python
+
+    pipeline = DagPipeline()
+    pipeline.add_node(load)
+    pipeline.add_node(first_features, inputs=["load"])
+    pipeline.add_node(second_features, inputs=["load"])
+    pipeline.add_node(union, inputs=["first_features", "second_features"])
+
+Independent branches of the graph are executed concurrently.
+"""
+from concurrent.futures import FIRST_COMPLETED, Executor, ThreadPoolExecutor, wait
+from typing import Any, Dict, List, Optional, Sequence
+
+from autoopt.distributions.base import Distribution
+from .node import PipelineNode, execute_node
+from .space import CompiledSpace
+
+
+class _DagRun:
+    """
+    The state of a single execution of a `DagPipeline`.
+
+    It tracks, which nodes are ready to be executed, and releases results,
+    which are not required by any other node anymore.
+    """
+
+    def __init__(self, names: List[str], inputs: Dict[str, List[str]], input_data: Any):
+        """
+        Prepare the execution of the given nodes.
+
+        :param names: The names of the nodes to execute in a topological order.
+        :param inputs: The names of the input nodes of each node.
+        :param input_data: The input data of the pipeline.
+        """
+        self.names = names
+        self.inputs = inputs
+        self.input_data = input_data
+        self.waiting = {name: len(set(inputs[name])) for name in names}
+        self.consumers = {name: [] for name in names}
+        for name in names:
+            for input_name in set(inputs[name]):
+                self.consumers[input_name].append(name)
+        self.remaining_consumers = {
+            name: len(consumers) for name, consumers in self.consumers.items()
+        }
+        self.results = {}
+
+    def ready(self) -> List[str]:
+        """
+        Returns the names of the nodes, which don't wait for any input.
+        """
+        return [name for name in self.names if self.waiting[name] == 0]
+
+    def input_of(self, name: str) -> Any:
+        """
+        Returns the input data of a node, whose inputs are available.
+        """
+        inputs = self.inputs[name]
+        if not inputs:
+            return self.input_data
+        if len(inputs) == 1:
+            return self.results[inputs[0]]
+        return tuple(self.results[input_name] for input_name in inputs)
+
+    def complete(self, name: str, result: Any) -> List[str]:
+        """
+        Store the result of a node and release the results of its inputs,
+        which are not required anymore.
+
+        :return: The names of the nodes, which got ready by this result
+        """
+        self.results[name] = result
+        for input_name in set(self.inputs[name]):
+            self.remaining_consumers[input_name] -= 1
+            if self.remaining_consumers[input_name] == 0:
+                del self.results[input_name]
+        ready = []
+        for consumer in self.consumers[name]:
+            self.waiting[consumer] -= 1
+            if self.waiting[consumer] == 0:
+                ready.append(consumer)
+        return ready
+
+    @property
+    def result(self) -> Any:
+        """
+        The result of the last node.
+        """
+        return self.results[self.names[-1]]
+
+
+class DagPipeline:
+    """
+    Implements a processing pipeline as directed acyclic graph of nodes.
+
+    Nodes without inputs get the input data of the pipeline. Nodes with
+    a single input get the result of this input node and nodes with multiple
+    inputs get a tuple of the results of their input nodes.
+    The last node added to the pipeline is its output.
+
+    The nodes are executed in a topological order. Nodes, whose inputs are
+    available, are executed concurrently on an executor.
+    """
+
+    def __init__(self, executor: Optional[Executor] = None):
+        """
+        Create a new, empty pipeline.
+
+        :param executor: The executor to run the nodes on. If None, a new
+                         thread pool is used for each execution. To run the
+                         nodes on a process pool, they need to be picklable.
+        """
+        self.__nodes = {}
+        self.__inputs = {}
+        self.__executor = executor
+
+    def add_node(self, node: PipelineNode, inputs: Sequence[str] = ()):
+        """
+        Add a new node to this pipeline.
+
+        The inputs have to be added to the pipeline before. This assures,
+        that the graph stays acyclic. The output type of each input node has
+        to match the corresponding type of the `input_types` of the node.
+
+        A node without inputs gets the input data of the pipeline. Thus, it
+        must have a single input, whose type matches the `input_type` of the
+        pipeline.
+
+        :param node: The node to add to this pipeline.
+        :param inputs: The names of the nodes, whose results are the inputs
+                       of the node. If empty, the node gets the input data
+                       of the pipeline.
+        """
+        if node.name in self.__nodes:
+            raise ValueError(f"Can't add node '{node.name}': The name is not unique")
+        inputs = list(inputs)
+        if not inputs:
+            if len(node.input_types) != 1:
+                raise ValueError(
+                    f"Can't add node '{node.name}': "
+                    f"Expected {len(node.input_types)} inputs but got none"
+                )
+            if self.input_type not in ("Any", node.input_type):
+                raise ValueError(
+                    f"Can't add node '{node.name}': "
+                    "The input type of the pipeline doesn't match. "
+                    f"Expected '{self.input_type}' but got '{node.input_type}'"
+                )
+        elif len(inputs) != len(node.input_types):
+            raise ValueError(
+                f"Can't add node '{node.name}': "
+                f"Expected {len(node.input_types)} inputs but got {len(inputs)}"
+            )
+        for input_name, input_type in zip(inputs, node.input_types):
+            if input_name not in self.__nodes:
+                raise ValueError(
+                    f"Can't add node '{node.name}': Unknown input '{input_name}'"
+                )
+            output_type = self.__nodes[input_name].output_type
+            if output_type not in ("Any", input_type):
+                raise ValueError(
+                    f"Can't add node '{node.name}': "
+                    f"The input types of '{input_name}' don't match. "
+                    f"Expected '{output_type}' but got '{input_type}'"
+                )
+        self.__nodes[node.name] = node
+        self.__inputs[node.name] = inputs
+
+    def inputs(self, name: str) -> List[str]:
+        """
+        Returns the names of the input nodes of a node.
+
+        :param name: The name of the node.
+        :return: The names of the input nodes
+        """
+        return list(self.__inputs[name])
+
+    def parameter_space(self) -> Dict[str, Dict[str, Distribution]]:
+        """
+        Returns the parameter space of the pipeline.
+
+        The parameter space of the pipeline is defined as the
+        parameter spaces of all nodes.
+
+        :return: The parameter space of the whole pipeline
+        """
+        return {name: node.parameter_space() for name, node in self.__nodes.items()}
+
+    def compiled_space(self) -> CompiledSpace:
+        """
+        Returns the parameter space of the pipeline compiled into
+        an array-backed representation.
+
+        :return: The compiled parameter space of the whole pipeline
+        """
+        return CompiledSpace(self.parameter_space())
+
+    @property
+    def input_type(self) -> str:
+        """
+        The data type of the input this pipeline can process.
+
+        This is the input data type of the first node defined in this
+        pipeline, or "Any" if no node is added to the pipeline.
+
+        :return: The data type of the input data
+        """
+        if not self.__nodes:
+            return "Any"
+        return next(iter(self.__nodes.values())).input_type
+
+    @property
+    def output_type(self) -> str:
+        """
+        The data type of the result this pipelines returns.
+
+        This is the output data type of the last node defined in this
+        pipeline, or "Any" if no node is added to the pipeline.
+
+        :return: The data type of the output data
+        """
+        if not self.__nodes:
+            return "Any"
+        return list(self.__nodes.values())[-1].output_type
+
+    def _required_nodes(self) -> List[str]:
+        """
+        Returns the names of all nodes, the output depends on.
+        """
+        if not self.__nodes:
+            return []
+        required = set()
+        pending = [list(self.__nodes)[-1]]
+        while pending:
+            name = pending.pop()
+            if name not in required:
+                required.add(name)
+                pending.extend(self.__inputs[name])
+        return [name for name in self.__nodes if name in required]
+
+    def execute(self, input_data: Any, **kwargs: Dict[str, Any]) -> Any:
+        """
+        Execute the pipeline.
+
+        All nodes, the last node depends on, are executed in a topological
+        order. As soon as the inputs of a node are available, it gets
+        submitted to the executor. Results, which are not required anymore,
+        are released.
+
+        :param input_data: The input data to execute the pipeline on.
+        :param kwargs: The parameters to initialize the different nodes with.
+        :return: The result of the last node of the pipeline
+        """
+        names = self._required_nodes()
+        if not names:
+            return input_data
+        run = _DagRun(names, self.__inputs, input_data)
+        executor = self.__executor or ThreadPoolExecutor()
+        running = {}
+
+        def submit(name):
+            future = executor.submit(
+                execute_node,
+                self.__nodes[name],
+                run.input_of(name),
+                kwargs.get(name, {}),
+            )
+            running[future] = name
+
+        try:
+            for name in run.ready():
+                submit(name)
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    for consumer in run.complete(running.pop(future), future.result()):
+                        submit(consumer)
+        finally:
+            for future in running:
+                future.cancel()
+            if self.__executor is None:
+                executor.shutdown()
+        return run.result
@@ -0,0 +1,33 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# Author: Torben Hansing
+#
+"""
+This module implements a mixin for objects, which guard their state with a lock,
+but still have to be picklable, e.g. to pass them to worker processes.
+"""
+import threading
+
+
+class LockMixin:  # pylint: disable=too-few-public-methods
+    """
+    This mixin adds the lock `_lock` to guard the state of an object.
+
+    Locks can't be pickled. Thus, the lock is dropped from the pickled state
+    and unpickled objects get a new lock.
+    """
+
+    def __init__(self):
+        """
+        Create the lock of this object.
+        """
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
@@ -10,7 +10,8 @@ input and output type and the parameter space which can be used
 to optimize the algorithm.
 """
 import abc
-from typing import Dict, Any
+import asyncio
+from typing import Dict, Any, Tuple
 
 from autoopt.distributions.base import Distribution
 
@@ -74,6 +75,33 @@ class PipelineNode(metaclass=abc.ABCMeta):
         """
         raise NotImplementedError("Has to be implemented by subclasses")
 
+    @property
+    def input_types(self) -> Tuple[str, ...]:
+        """
+        The data types of the inputs of this node in a `DagPipeline`.
+
+        Nodes with multiple inputs get a tuple of the input data in the order
+        of these types. By default, a node has a single input of the
+        type `input_type`.
+
+        :return: The data types of the inputs
+        """
+        return (self.input_type,)
+
+    @property
+    def streaming(self) -> bool:
+        """
+        Whether this node processes a stream of chunks.
+
+        If True, the `execute` method of this node gets an iterator over
+        the chunks of the input data in `Pipeline.execute_stream` and has to
+        return an iterator over the chunks of its result.
+        Otherwise, the node is executed for each chunk separately.
+
+        :return: True, if the node processes streams of chunks
+        """
+        return False
+
     @abc.abstractmethod
     def execute(self, input_data: Any, **kwargs: Dict[str, Any]) -> Any:
         """
@@ -102,3 +130,56 @@ class PipelineNode(metaclass=abc.ABCMeta):
 
     def __hash__(self) -> int:
         return hash(self.name)
+
+
+class AsyncPipelineNode(PipelineNode, metaclass=abc.ABCMeta):
+    """
+    The abstract base class to implement nodes with an asynchronous algorithm.
+
+    This is useful for I/O bound algorithms, like requests to model servers
+    or reading from remote storage. Many of these nodes can then be executed
+    concurrently using `Pipeline.aexecute`.
+
+    Subclasses implement the coroutine `aexecute`. The synchronous `execute`
+    runs it in a new event loop.
+    """
+
+    @abc.abstractmethod
+    async def aexecute(self, input_data: Any, **kwargs: Dict[str, Any]) -> Any:
+        """
+        Execute the algorithm this node implements on the given `input_data`
+        asynchronously.
+
+        :param input_data: The input data to execute the algorithm on.
+        :param kwargs: The parameters to initialize the algorithm with.
+        :return: The result of the algorithm
+        """
+        raise NotImplementedError("Has to be implemented by subclasses")
+
+    def execute(self, input_data: Any, **kwargs: Dict[str, Any]) -> Any:
+        """
+        Execute the algorithm this node implements on the given `input_data`
+        in a new event loop.
+
+        This can't be called from within a running event loop.
+        Use `aexecute` there instead.
+
+        :param input_data: The input data to execute the algorithm on.
+        :param kwargs: The parameters to initialize the algorithm with.
+        :return: The result of the algorithm
+        """
+        return asyncio.run(self.aexecute(input_data, **kwargs))
+
+
+def execute_node(node: PipelineNode, data: Any, parameters: Dict[str, Any]) -> Any:
+    """
+    Execute a single node synchronously.
+
+    Nodes implementing `AsyncPipelineNode` are run in a new event loop.
+
+    :param node: The node to execute.
+    :param data: The input data of the node.
+    :param parameters: The parameters to initialize the node with.
+    :return: The result of the node
+    """
+    return node.execute(data, **parameters)
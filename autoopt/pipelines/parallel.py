@@ -0,0 +1,162 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# Author: Torben Hansing
+#
+"""
+This module implements the parallel evaluation of pipeline configurations.
+
+The configurations are split into chunks, which are executed by a pool of
+worker processes. The pipeline and the input data are sent to each worker
+only once, when the worker is started.
+
+.. code:: python
+
+    evaluator = ParallelEvaluator(pipeline, max_workers=8, chunksize=4)
+    for trial in evaluator.evaluate(input_data, configs, ordered=False):
+        if trial.error is None:
+            ...
+"""
+import multiprocessing
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Union
+
+from .pipeline import Pipeline
+
+# The pipeline and input data of the current worker process
+_WORKER_STATE = {}
+
+
+class TrialResult(NamedTuple):
+    """
+    The result of the execution of a single configuration.
+    """
+
+    index: int
+    """The index of the configuration in the evaluated batch"""
+    config: Dict[str, Dict[str, Any]]
+    """The parameters of the nodes"""
+    result: Any
+    """The result of the pipeline, or None if the execution failed"""
+    error: Optional[str]
+    """The formatted traceback, if the execution failed, otherwise None"""
+
+
+def _initialize_worker(pipeline: Pipeline, input_data: Any):
+    _WORKER_STATE["pipeline"] = pipeline
+    _WORKER_STATE["input_data"] = input_data
+
+
+def _execute_chunk(chunk: List[tuple]) -> List[tuple]:
+    """
+    Execute a chunk of configurations in a worker process.
+
+    :param chunk: A list of (index, config) tuples.
+    :return: A list of (index, result, error) tuples.
+    """
+    pipeline = _WORKER_STATE["pipeline"]
+    input_data = _WORKER_STATE["input_data"]
+    results = []
+    for index, config in chunk:
+        try:
+            results.append((index, pipeline.execute(input_data, **config), None))
+        except Exception:  # pylint: disable=broad-except
+            results.append((index, None, traceback.format_exc()))
+    return results
+
+
+class ParallelEvaluator:
+    """
+    Evaluates configurations of a pipeline in parallel on a pool of processes.
+
+    The nodes of the pipeline, the input data and the results need to be
+    picklable. Errors raised by the pipeline are captured for each
+    configuration and don't stop the evaluation of the others.
+    """
+
+    def __init__(
+        self,
+        pipeline: Pipeline,
+        max_workers: Optional[int] = None,
+        chunksize: int = 1,
+        mp_context: Union[None, str, multiprocessing.context.BaseContext] = None,
+    ):
+        """
+        Create a new evaluator for the pipeline.
+
+        :param pipeline: The pipeline to execute.
+        :param max_workers: The number of worker processes.
+                            Defaults to the number of CPUs.
+        :param chunksize: The number of configurations, which are sent to
+                          a worker at once.
+        :param mp_context: The multiprocessing context or the name of the
+                           start method ("fork", "spawn" or "forkserver")
+                           to start the workers with.
+        """
+        if chunksize < 1:
+            raise ValueError(f"The chunksize has to be positive, but got {chunksize}")
+        if isinstance(mp_context, str):
+            mp_context = multiprocessing.get_context(mp_context)
+        self.__pipeline = pipeline
+        self.__max_workers = max_workers
+        self.__chunksize = chunksize
+        self.__mp_context = mp_context
+
+    @property
+    def pipeline(self) -> Pipeline:
+        """
+        The pipeline, which is evaluated.
+        """
+        return self.__pipeline
+
+    def evaluate(
+        self,
+        input_data: Any,
+        configs: Iterable[Dict[str, Dict[str, Any]]],
+        ordered: bool = True,
+    ) -> Iterator[TrialResult]:
+        """
+        Execute the pipeline for each configuration.
+
+        The results are streamed as soon as they are available. Either in
+        the order of the configurations or in the order of their completion.
+
+        :param input_data: The input data to execute the pipeline on.
+        :param configs: The parameters of the nodes for each configuration,
+                        like the `kwargs` of `Pipeline.execute`.
+        :param ordered: If True, the results are returned in the order of the
+                        configurations. Otherwise, as soon as they complete.
+        :return: An iterator over the results of the configurations.
+        """
+        configs = list(configs)
+        chunks = [[]]
+        for trial in enumerate(configs):
+            if len(chunks[-1]) == self.__chunksize:
+                chunks.append([])
+            chunks[-1].append(trial)
+        if not configs:
+            return
+        with ProcessPoolExecutor(
+            max_workers=self.__max_workers,
+            mp_context=self.__mp_context,
+            initializer=_initialize_worker,
+            initargs=(self.__pipeline, input_data),
+        ) as executor:
+            futures = {
+                executor.submit(_execute_chunk, chunk): chunk for chunk in chunks
+            }
+            try:
+                completed = futures if ordered else as_completed(futures)
+                for future in completed:
+                    try:
+                        results = future.result()
+                    except Exception:  # pylint: disable=broad-except
+                        # e.g. a result of the chunk could not be pickled
+                        error = traceback.format_exc()
+                        results = [(index, None, error) for index, _ in futures[future]]
+                    for index, result, error in results:
+                        yield TrialResult(index, configs[index], result, error)
+            finally:
+                # Don't execute the remaining chunks, if the iteration is stopped
+                for future in futures:
+                    future.cancel()
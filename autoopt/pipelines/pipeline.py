@@ -14,10 +14,48 @@ These pipelines can then be executed to process the input data
 and calculate a loss. This loss will then be used to optimize the
 parameters of the algorithms in the pipeline.
 """
-from typing import Dict, Any
+import asyncio
+import dataclasses
+import functools
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Sequence, Tuple
 
 from autoopt.distributions.base import Distribution
-from .node import PipelineNode
+from .cache import NodeCache, fingerprint, node_key
+from .node import AsyncPipelineNode, PipelineNode, execute_node
+from .profiling import _TRIAL_STATE, PipelineHook
+from .pruning import PrunedResult, TrialPruned
+from .streaming import prefetch
+from .space import CompiledSpace
+
+
+@dataclasses.dataclass
+class _TrieNode:
+    """
+    A node in the prefix tree of a batch of configurations.
+
+    Each node of the tree represents the execution of a pipeline node with
+    specific parameters, after all executions on the path from the root.
+    The `key` identifies the path within the batch, while the `cache_key`
+    identifies the result in the cache of the pipeline (None, if the result
+    must not be cached).
+    """
+
+    key: str
+    cache_key: Optional[str]
+    parameters: Dict[str, Any]
+    children: Dict[str, "_TrieNode"] = dataclasses.field(default_factory=dict)
+    indices: List[int] = dataclasses.field(default_factory=list)
+    result: Any = None
+
+
+class _PrunedStream(Exception):
+    """
+    Passes the pruning of a stream through the remaining nodes of the stream.
+    """
+
+    def __init__(self, result: PrunedResult):
+        super().__init__(result.reason)
+        self.result = result
 
 
 class Pipeline:
@@ -32,10 +70,56 @@ class Pipeline:
     It can then be executed to process the input data and calculate
     a loss. This loss will then be used to optimize the parameters
     of the algorithms in this pipeline.
+
+    Optionally, the results of the nodes can be cached. Then, an execution
+    reuses the result of the longest prefix of nodes, which was already
+    executed on the same input data with the same parameters.
     """
 
-    def __init__(self):
+    def __init__(self, cache: Optional[NodeCache] = None):
+        """
+        Create a new, empty pipeline.
+
+        :param cache: The cache to store the results of the nodes in.
+                      If None, the results are not cached.
+        """
         self.__nodes = []
+        self.__cache = cache
+        self.__hooks = []
+
+    @property
+    def cache(self) -> Optional[NodeCache]:
+        """
+        The cache of the results of the nodes, or None if caching is disabled.
+        """
+        return self.__cache
+
+    @property
+    def hooks(self) -> List[PipelineHook]:
+        """
+        The hooks, which are notified about the executions of this pipeline.
+        """
+        return list(self.__hooks)
+
+    def add_hook(self, hook: PipelineHook):
+        """
+        Add a hook, which gets notified about the executions of this pipeline.
+
+        The hooks are called by `execute`, `aexecute`, `aexecute_many` and
+        `execute_many` in the order they are added. Streams can't be executed
+        with hooks.
+
+        :param hook: The hook to add.
+        """
+        self.__hooks.append(hook)
+
+    def remove_hook(self, hook: PipelineHook):
+        """
+        Remove a hook from this pipeline.
+
+        :param hook: The hook to remove.
+        """
+        self.__hooks.remove(hook)
 
     def add_node(self, node: PipelineNode):
         """
@@ -69,6 +153,19 @@ class Pipeline:
         """
         return {node.name: node.parameter_space() for node in self.__nodes}
 
+    def compiled_space(self) -> CompiledSpace:
+        """
+        Returns the parameter space of the pipeline compiled into
+        an array-backed representation.
+
+        This allows to sample and evaluate whole batches of configurations
+        as matrices, instead of walking the nested dictionaries of
+        `parameter_space` for each configuration.
+
+        :return: The compiled parameter space of the whole pipeline
+        """
+        return CompiledSpace(self.parameter_space())
+
     @property
     def input_type(self) -> str:
         """
@@ -120,12 +217,376 @@ class Pipeline:
         The result of this method will match the output type of the last
         node in the pipeline as returned by the `output_type` property.
 
+        If the pipeline has a cache, the results of the longest prefix of
+        nodes, which is found in the cache, are reused and only the remaining
+        nodes are executed.
+
+        Nodes implementing `AsyncPipelineNode` are run in a new event loop.
+        Use `aexecute` to execute them within a running event loop.
+
+        The hooks of the pipeline are notified about the start and the end
+        of the execution and of each executed node. If the execution fails
+        with an exception, the hooks are notified about the error instead of
+        the end of the execution.
+
+        If a node or a hook raises `TrialPruned`, the remaining nodes are
+        skipped and a `PrunedResult` is returned instead of the result.
+
         :param input_data: The input data to execute the pipeline on.
         :param kwargs: The parameters to initialize the different nodes with.
         :return: The result of the pipeline
         """
+        # Each execution gets its own state of the hooks
+        token = _TRIAL_STATE.set({})
+        node_name = None
         data = input_data
+        try:
+            try:
+                self._notify("on_trial_start", input_data, kwargs)
+                keys, start, data = self._cached_prefix(input_data, kwargs)
+                for position in range(start, len(self.__nodes)):
+                    node = self.__nodes[position]
+                    node_name = node.name
+                    parameters = kwargs.get(node.name, {})
+                    self._notify("on_node_start", node, parameters)
+                    data = execute_node(node, data, parameters)
+                    if keys[position] is not None:
+                        self.__cache.put(keys[position], data)
+                    self._notify("on_node_end", node, parameters, data)
+            except TrialPruned as pruned:
+                data = PrunedResult(node_name, str(pruned), data)
+            self._notify("on_trial_end", data)
+        except Exception as error:
+            self._notify("on_trial_error", error)
+            raise
+        finally:
+            _TRIAL_STATE.reset(token)
+        return data
+
+    async def aexecute(self, input_data: Any, **kwargs: Dict[str, Any]) -> Any:
+        """
+        Execute the pipeline asynchronously.
+
+        This works like `execute`, but awaits the nodes implementing
+        `AsyncPipelineNode`. The other nodes are executed in the default
+        executor of the event loop, so that they don't block it.
+
+        The hooks are notified and pruned executions return a `PrunedResult`
+        like in `execute`. The hooks are called in the event loop.
+
+        :param input_data: The input data to execute the pipeline on.
+        :param kwargs: The parameters to initialize the different nodes with.
+        :return: The result of the pipeline
+        """
+        loop = asyncio.get_running_loop()
+        token = _TRIAL_STATE.set({})
+        node_name = None
+        data = input_data
+        try:
+            try:
+                self._notify("on_trial_start", input_data, kwargs)
+                keys, start, data = self._cached_prefix(input_data, kwargs)
+                for position in range(start, len(self.__nodes)):
+                    node = self.__nodes[position]
+                    node_name = node.name
+                    parameters = kwargs.get(node.name, {})
+                    self._notify("on_node_start", node, parameters)
+                    if isinstance(node, AsyncPipelineNode):
+                        data = await node.aexecute(data, **parameters)
+                    else:
+                        data = await loop.run_in_executor(
+                            None, functools.partial(node.execute, data, **parameters)
+                        )
+                    if keys[position] is not None:
+                        self.__cache.put(keys[position], data)
+                    self._notify("on_node_end", node, parameters, data)
+            except TrialPruned as pruned:
+                data = PrunedResult(node_name, str(pruned), data)
+            self._notify("on_trial_end", data)
+        except Exception as error:
+            self._notify("on_trial_error", error)
+            raise
+        finally:
+            _TRIAL_STATE.reset(token)
+        return data
+
+    async def aexecute_many(
+        self,
+        input_data: Any,
+        configs: Sequence[Dict[str, Dict[str, Any]]],
+        max_concurrency: int = 100,
+        return_exceptions: bool = False,
+    ) -> List[Any]:
+        """
+        Execute the pipeline asynchronously for a batch of configurations.
+
+        Up to `max_concurrency` configurations are executed concurrently
+        using `aexecute`.
+
+        :param input_data: The input data to execute the pipeline on.
+        :param configs: The parameters of the nodes for each configuration,
+                        like the `kwargs` of `execute`.
+        :param max_concurrency: The maximum number of configurations
+                                executed at the same time.
+        :param return_exceptions: If True, exceptions are returned as the
+                                  result of the failed configurations.
+                                  Otherwise, the first exception is raised.
+        :return: The results of the pipeline in the order of the configurations
+        """
+        if max_concurrency < 1:
+            raise ValueError(
+                f"The concurrency has to be positive, but got {max_concurrency}"
+            )
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def execute(config):
+            async with semaphore:
+                return await self.aexecute(input_data, **config)
+
+        return await asyncio.gather(
+            *(execute(config) for config in configs),
+            return_exceptions=return_exceptions,
+        )
+
+    def execute_stream(
+        self, chunks: Iterable[Any], buffer_size: int = 0, **kwargs: Dict[str, Any]
+    ) -> Iterator[Any]:
+        """
+        Execute the pipeline on a stream of chunks of the input data.
+
+        The nodes are chained lazily. Nodes, which are `streaming`, get the
+        iterator over the chunks of the previous node. All other nodes are
+        executed for each chunk separately, which is only valid for nodes
+        processing each part of the data independently. As only a few chunks
+        are in memory at once, data larger than the memory can be processed.
+
+        If `buffer_size` is positive, the chunks of each node are produced
+        in a background thread with up to `buffer_size` chunks in advance.
+        Thus, the nodes process different chunks concurrently.
+
+        The results of the nodes are not cached in this mode. As the nodes
+        don't run one after another, pipelines with hooks can't be executed
+        on streams.
+
+        If a node raises `TrialPruned`, the stream ends with a `PrunedResult`,
+        whose `result` is None.
+
+        :param chunks: The chunks of the input data.
+        :param buffer_size: The number of chunks to buffer between the nodes.
+                            If 0, the chunks are not buffered.
+        :param kwargs: The parameters to initialize the different nodes with.
+        :return: An iterator over the chunks of the result of the pipeline.
+        """
+        if buffer_size < 0:
+            raise ValueError(
+                f"The buffer size must not be negative, but got {buffer_size}"
+            )
+        if self.__hooks:
+            raise ValueError("Pipelines with hooks can't be executed on streams")
+        stream = iter(chunks)
         for node in self.__nodes:
             parameters = kwargs.get(node.name, {})
-            data = node.execute(data, **parameters)
-        return data
+            if node.streaming:
+                stream = node.execute(stream, **parameters)
+            else:
+                stream = self._execute_chunks(node, stream, parameters)
+            stream = self._prunable_stage(node, stream)
+            if buffer_size > 0:
+                stream = prefetch(stream, buffer_size)
+        return self._pruned_stream(stream)
+
+    def execute_many(
+        self,
+        input_data: Any,
+        configs: Sequence[Dict[str, Dict[str, Any]]],
+        release: bool = True,
+    ) -> List[Any]:
+        """
+        Execute the pipeline for a batch of configurations.
+
+        The configurations are organized in a prefix tree, which is keyed on
+        the parameters of each node. The tree is executed depth first. Thus,
+        each prefix of nodes, which is shared by several configurations,
+        gets executed only once on the input data.
+
+        If the pipeline has a cache, it is used for the prefixes as well.
+        Configurations with parameters, which can't be hashed, don't share
+        their prefix with other configurations.
+
+        If a node raises `TrialPruned`, all configurations sharing the prefix
+        up to this node get a `PrunedResult`.
+
+        The hooks need to observe each execution separately. Thus, if the
+        pipeline has hooks, the configurations are executed one after another
+        using `execute` and only share their prefixes through the cache.
+
+        :param input_data: The input data to execute the pipeline on.
+        :param configs: The parameters of the nodes for each configuration,
+                        like the `kwargs` of `execute`.
+        :param release: If True, the result of a prefix is released as soon as
+                        all configurations sharing this prefix are executed.
+                        Otherwise, all results are kept until the whole batch
+                        is executed.
+        :return: The results of the pipeline in the order of the configurations
+        """
+        if self.__hooks:
+            return [self.execute(input_data, **config) for config in configs]
+        root = _TrieNode(
+            "", fingerprint(input_data) if self.__cache is not None else None, {}
+        )
+        root.result = input_data
+        for index, config in enumerate(configs):
+            trie = root
+            for node in self.__nodes:
+                parameters = config.get(node.name, {})
+                key = node_key(trie.key, node.name, parameters)
+                if key is None:
+                    # The parameters can't be compared to other configurations
+                    key = f"{trie.key}:{node.name}:unique:{index}"
+                if key not in trie.children:
+                    cache_key = node_key(trie.cache_key, node.name, parameters)
+                    trie.children[key] = _TrieNode(key, cache_key, parameters)
+                trie = trie.children[key]
+            trie.indices.append(index)
+
+        results = [None] * len(configs)
+        self._execute_trie(root, 0, results, release)
+        return results
+
+    def _execute_trie(
+        self, trie: _TrieNode, depth: int, results: List[Any], release: bool
+    ):
+        """
+        Execute the subtree below a node of the prefix tree.
+
+        :param trie: The node of the prefix tree, whose result is known.
+        :param depth: The number of pipeline nodes executed to get the result.
+        :param results: The list to store the results of the configurations in.
+        :param release: Whether to release the results of the subtree.
+        """
+        for index in trie.indices:
+            results[index] = trie.result
+        if depth == len(self.__nodes):
+            return
+        node = self.__nodes[depth]
+        missing = object()
+        for child in trie.children.values():
+            cached = missing
+            if child.cache_key is not None:
+                cached = self.__cache.get(child.cache_key, missing)
+            if cached is missing:
+                try:
+                    child.result = execute_node(node, trie.result, child.parameters)
+                except TrialPruned as pruned:
+                    result = PrunedResult(node.name, str(pruned), trie.result)
+                    self._prune_trie(child, result, results)
+                    continue
+                if child.cache_key is not None:
+                    self.__cache.put(child.cache_key, child.result)
+            else:
+                child.result = cached
+            self._execute_trie(child, depth + 1, results, release)
+            if release:
+                child.result = None
+
+    @staticmethod
+    def _prune_trie(trie: _TrieNode, pruned: PrunedResult, results: List[Any]):
+        """
+        Set the result of all configurations in a subtree of the prefix tree.
+
+        :param trie: The root of the subtree, whose execution was pruned.
+        :param pruned: The result of the pruned configurations.
+        :param results: The list to store the results of the configurations in.
+        """
+        nodes = [trie]
+        while nodes:
+            node = nodes.pop()
+            for index in node.indices:
+                results[index] = pruned
+            nodes.extend(node.children.values())
+
+    def _notify(self, event: str, *args: Any):
+        """
+        Call a method of all hooks of this pipeline.
+
+        :param event: The name of the method of `PipelineHook` to call.
+        :param args: The arguments of the method.
+        """
+        for hook in self.__hooks:
+            getattr(hook, event)(*args)
+
+    @staticmethod
+    def _execute_chunks(
+        node: PipelineNode, chunks: Iterator[Any], parameters: Dict[str, Any]
+    ) -> Iterator[Any]:
+        """
+        Execute a node, which is not streaming, for each chunk of a stream.
+        """
+        for chunk in chunks:
+            yield execute_node(node, chunk, parameters)
+
+    @staticmethod
+    def _prunable_stage(node: PipelineNode, chunks: Iterator[Any]) -> Iterator[Any]:
+        """
+        Tag the pruning of a stream with the node, which pruned it.
+        """
+        try:
+            yield from chunks
+        except TrialPruned as pruned:
+            raise _PrunedStream(PrunedResult(node.name, str(pruned), None)) from pruned
+
+    @staticmethod
+    def _pruned_stream(chunks: Iterator[Any]) -> Iterator[Any]:
+        """
+        End a stream with a `PrunedResult`, if one of its nodes pruned it.
+        """
+        try:
+            yield from chunks
+        except _PrunedStream as pruned:
+            yield pruned.result
+
+    def _cached_prefix(
+        self, input_data: Any, kwargs: Dict[str, Any]
+    ) -> Tuple[List[Optional[str]], int, Any]:
+        """
+        Find the longest prefix of nodes, whose result is cached.
+
+        :param input_data: The input data of the pipeline.
+        :param kwargs: The parameters of the nodes.
+        :return: The cache keys of all nodes, the number of nodes of the prefix
+                 and the result of the prefix. The key of a result, which must
+                 not be cached, is None.
+        """
+        if self.__cache is None:
+            return [None] * len(self.__nodes), 0, input_data
+        keys = self._cache_keys(input_data, kwargs)
+        missing = object()
+        for position in reversed(range(len(self.__nodes))):
+            if keys[position] is None:
+                continue
+            cached = self.__cache.get(keys[position], missing)
+            if cached is not missing:
+                return keys, position + 1, cached
+        return keys, 0, input_data
+
+    def _cache_keys(
+        self, input_data: Any, kwargs: Dict[str, Any]
+    ) -> List[Optional[str]]:
+        """
+        Calculate the cache keys of the results of all nodes.
+
+        The key of each node depends on the keys of all previous nodes.
+        Thus, equal keys identify equal prefixes of the pipeline. If the input
+        data or the parameters of a node can't be hashed, the keys of this node
+        and all following nodes are None.
+
+        :param input_data: The input data of the pipeline.
+        :param kwargs: The parameters of the nodes.
+        :return: The cache key of the result of each node.
+        """
+        keys = []
+        key = fingerprint(input_data)
+        for node in self.__nodes:
+            key = node_key(key, node.name, kwargs.get(node.name, {}))
+            keys.append(key)
+        return keys
@@ -0,0 +1,259 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# Author: Torben Hansing
+#
+"""
+This module implements hooks to instrument the execution of pipelines.
+
+Hooks are added to a pipeline and get notified by `Pipeline.execute` about
+the start and the end of each execution (trial) and of each executed node.
+The `Profiler` uses this to measure the resources used by each node:
+
+.. code:: python
+
+    profiler = Profiler()
+    pipeline.add_hook(profiler)
+    for config in configs:
+        pipeline.execute(input_data, **config)
+    print(profiler.report())
+"""
+import contextvars
+import time
+import tracemalloc
+from collections import defaultdict
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from .cache import _size_of
+from .locking import LockMixin
+from .node import PipelineNode
+
+# tracemalloc.reset_peak is available since Python 3.9
+_reset_peak = getattr(tracemalloc, "reset_peak", tracemalloc.clear_traces)
+
+# The states of the hooks for the execution, which runs in the current thread
+# or asyncio task. The pipeline sets a new dictionary for each execution.
+_TRIAL_STATE = contextvars.ContextVar("trial_state")
+
+
+class PipelineHook:
+    """
+    The base class of hooks, which get notified about the execution
+    of a pipeline.
+
+    All methods do nothing by default. Thus, subclasses only need to
+    overwrite the methods for the events they are interested in.
+
+    A pipeline can run several executions concurrently, e.g. in
+    `Pipeline.aexecute_many` or on a thread pool. Thus, hooks should keep
+    the state of an execution in `trial_state` instead of their attributes.
+    """
+
+    def trial_state(self) -> Dict[str, Any]:
+        """
+        Returns the state of this hook for the current execution.
+
+        Each execution of a pipeline gets a new, empty state, which is only
+        visible to the thread or asyncio task running the execution.
+
+        :return: A dictionary to store the state of the execution in.
+        """
+        try:
+            states = _TRIAL_STATE.get()
+        except LookupError:
+            # The hook is called outside of the execution of a pipeline
+            states = {}
+            _TRIAL_STATE.set(states)
+        return states.setdefault(self, {})
+
+    def on_trial_start(self, input_data: Any, config: Dict[str, Dict[str, Any]]):
+        """
+        Called before a pipeline gets executed.
+
+        :param input_data: The input data of the pipeline.
+        :param config: The parameters of the nodes.
+        """
+
+    def on_node_start(self, node: PipelineNode, parameters: Dict[str, Any]):
+        """
+        Called before a node gets executed.
+
+        Nodes, whose results are taken from the cache of the pipeline,
+        are not executed.
+
+        :param node: The node, which gets executed.
+        :param parameters: The parameters of the node.
+        """
+
+    def on_node_end(self, node: PipelineNode, parameters: Dict[str, Any], result: Any):
+        """
+        Called after a node has been executed.
+
+        :param node: The node, which has been executed.
+        :param parameters: The parameters of the node.
+        :param result: The result of the node.
+        """
+
+    def on_trial_end(self, result: Any):
+        """
+        Called after a pipeline has been executed.
+
+        :param result: The result of the pipeline.
+        """
+
+    def on_trial_error(self, error: Exception):
+        """
+        Called instead of `on_trial_end`, if the execution of a pipeline
+        failed with an exception. The exception is raised afterwards.
+
+        :param error: The exception raised by a node or hook.
+        """
+
+
+class NodeProfile(NamedTuple):
+    """
+    The resources used by a single execution of a node.
+    """
+
+    node: str
+    """The name of the node"""
+    wall_time: float
+    """The elapsed time in seconds"""
+    cpu_time: float
+    """The CPU time of the process in seconds"""
+    peak_memory: Optional[int]
+    """The peak of the memory allocated while executing the node in bytes,
+    or None, if the memory is not traced"""
+    output_bytes: int
+    """The estimated size of the result of the node in bytes"""
+
+
+class Profiler(PipelineHook, LockMixin):
+    """
+    Measures the time and memory used by each node of a pipeline.
+
+    The peak memory is traced using `tracemalloc`, which only accounts for
+    memory allocated by python and slows down the execution. It can be
+    disabled by setting `trace_memory` to False.
+
+    Concurrent executions are profiled separately, but they share the
+    tracing of the memory. Thus, their peak memories are only exact, if the
+    executions don't overlap.
+    """
+
+    def __init__(self, trace_memory: bool = True):
+        """
+        Create a new profiler.
+
+        :param trace_memory: Whether to trace the peak memory of the nodes.
+        """
+        self.__trace_memory = trace_memory
+        self.__profiles = []
+        LockMixin.__init__(self)
+        # The number of running executions, which trace the memory
+        self.__tracing = 0
+        self.__started_tracing = False
+
+    def __setstate__(self, state):
+        super().__setstate__(state)
+        # The executions in this process don't trace the memory yet
+        self.__tracing = 0
+        self.__started_tracing = False
+
+    @property
+    def profiles(self) -> List[NodeProfile]:
+        """
+        The profiles of all node executions in the order of their completion.
+        """
+        with self._lock:
+            return list(self.__profiles)
+
+    def clear(self):
+        """
+        Remove all recorded profiles.
+        """
+        with self._lock:
+            self.__profiles.clear()
+
+    def on_trial_start(self, input_data, config):
+        if not self.__trace_memory:
+            return
+        with self._lock:
+            if self.__tracing == 0 and not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self.__started_tracing = True
+            self.__tracing += 1
+        self.trial_state()["tracing"] = True
+
+    def on_node_start(self, node, parameters):
+        memory = None
+        if self.__trace_memory:
+            _reset_peak()
+            memory = tracemalloc.get_traced_memory()[0]
+        self.trial_state()["start"] = (time.perf_counter(), time.process_time(), memory)
+
+    def on_node_end(self, node, parameters, result):
+        start = self.trial_state()["start"]
+        wall_time = time.perf_counter() - start[0]
+        cpu_time = time.process_time() - start[1]
+        peak_memory = None
+        if start[2] is not None:
+            peak_memory = tracemalloc.get_traced_memory()[1] - start[2]
+        profile = NodeProfile(
+            node.name, wall_time, cpu_time, peak_memory, _size_of(result)
+        )
+        with self._lock:
+            self.__profiles.append(profile)
+
+    def on_trial_end(self, result):
+        self._stop_tracing()
+
+    def on_trial_error(self, error):
+        self._stop_tracing()
+
+    def _stop_tracing(self):
+        """
+        Stop tracing the memory, if it has been started by this profiler
+        and no other execution traces it anymore.
+        """
+        if not self.trial_state().pop("tracing", False):
+            return
+        with self._lock:
+            self.__tracing -= 1
+            if self.__tracing == 0 and self.__started_tracing:
+                tracemalloc.stop()
+                self.__started_tracing = False
+
+    def report(self) -> Dict[str, Dict[str, float]]:
+        """
+        Aggregate the profiles of each node across all executions.
+
+        :return: A dictionary with the names of the nodes as keys and
+                 the statistics of their executions as values. These are
+                 the number of executions (``count``), the total and mean
+                 wall and CPU times, the maximum peak memory and the mean
+                 output size.
+        """
+        profiles = defaultdict(list)
+        for profile in self.profiles:
+            profiles[profile.node].append(profile)
+        report = {}
+        for node, executions in profiles.items():
+            count = len(executions)
+            wall_time = sum(profile.wall_time for profile in executions)
+            cpu_time = sum(profile.cpu_time for profile in executions)
+            output_bytes = sum(profile.output_bytes for profile in executions)
+            peak_memory = [
+                profile.peak_memory
+                for profile in executions
+                if profile.peak_memory is not None
+            ]
+            report[node] = {
+                "count": count,
+                "wall_time": wall_time,
+                "mean_wall_time": wall_time / count,
+                "cpu_time": cpu_time,
+                "mean_cpu_time": cpu_time / count,
+                "max_peak_memory": max(peak_memory) if peak_memory else None,
+                "mean_output_bytes": output_bytes / count,
+            }
+        return report
@@ -0,0 +1,167 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# Author: Torben Hansing
+#
+"""
+This module implements the early abort (pruning) of unpromising pipeline
+executions.
+
+A node or a hook of the pipeline can raise `TrialPruned` to stop an
+execution. Then, the remaining nodes are skipped and `Pipeline.execute`
+(like the other execution methods of the pipeline) returns a `PrunedResult`
+instead of the result of the pipeline:
+
+.. code:: python
+
+    pipeline.add_hook(TimeBudgetPruner(budget=60))
+    result = pipeline.execute(input_data, **config)
+    if isinstance(result, PrunedResult):
+        ...
+"""
+import heapq
+import time
+from typing import Any, Callable, NamedTuple, Optional
+
+from .locking import LockMixin
+from .node import PipelineNode
+from .profiling import PipelineHook
+
+
+class TrialPruned(Exception):
+    """
+    Raised by nodes or hooks to stop the execution of a pipeline.
+    """
+
+
+class PrunedResult(NamedTuple):
+    """
+    The result of a pipeline execution, which has been pruned.
+    """
+
+    node: Optional[str]
+    """The name of the node, which was executed when the execution was pruned,
+    or None, if it was pruned before the first node"""
+    reason: str
+    """The reason, why the execution was pruned"""
+    result: Any
+    """The last intermediate result before the execution was pruned"""
+
+
+class _RunningMedian:
+    """
+    Maintains the median of a growing collection of values.
+
+    The lower half of the values is stored in a max-heap and the upper half
+    in a min-heap. Thus, adding a value takes O(log n) time.
+    """
+
+    def __init__(self):
+        self.__lower = []
+        self.__upper = []
+
+    def __len__(self) -> int:
+        return len(self.__lower) + len(self.__upper)
+
+    def add(self, value: float):
+        """
+        Add a value and rebalance the two halves.
+
+        :param value: The value to add.
+        """
+        if self.__lower and value > -self.__lower[0]:
+            heapq.heappush(self.__upper, value)
+        else:
+            heapq.heappush(self.__lower, -value)
+        # Keep the lower half as large as or one larger than the upper half
+        if len(self.__lower) > len(self.__upper) + 1:
+            heapq.heappush(self.__upper, -heapq.heappop(self.__lower))
+        elif len(self.__upper) > len(self.__lower):
+            heapq.heappush(self.__lower, -heapq.heappop(self.__upper))
+
+    @property
+    def median(self) -> float:
+        """
+        The median of all added values.
+        """
+        if len(self.__lower) > len(self.__upper):
+            return -self.__lower[0]
+        return (self.__upper[0] - self.__lower[0]) / 2
+
+
+class MedianPruner(PipelineHook, LockMixin):
+    """
+    Prunes executions, whose intermediate metric is worse than the median
+    of the metrics of the previous executions at the same node.
+    """
+
+    def __init__(
+        self,
+        metric: Callable[[PipelineNode, Any], Optional[float]],
+        min_trials: int = 5,
+        minimize: bool = True,
+    ):
+        """
+        Create a new median pruner.
+
+        :param metric: Calculates the metric of the result of a node.
+                       For nodes without a metric it returns None.
+        :param min_trials: The number of executions, which need to report
+                           a metric at a node, before the node prunes.
+        :param minimize: Whether lower metrics are better.
+        """
+        if min_trials < 1:
+            raise ValueError(
+                f"The minimum number of trials has to be positive, but got {min_trials}"
+            )
+        self.__metric = metric
+        self.__min_trials = min_trials
+        self.__minimize = minimize
+        self.__medians = {}
+        LockMixin.__init__(self)
+
+    def on_node_end(self, node, parameters, result):
+        value = self.__metric(node, result)
+        if value is None:
+            return
+        prune = False
+        with self._lock:
+            median = self.__medians.setdefault(node.name, _RunningMedian())
+            if len(median) >= self.__min_trials:
+                threshold = median.median
+                prune = value > threshold if self.__minimize else value < threshold
+            median.add(value)
+        if prune:
+            raise TrialPruned(
+                f"The metric {value} of node '{node.name}' is worse than "
+                f"the median {threshold}"
+            )
+
+
+class TimeBudgetPruner(PipelineHook):
+    """
+    Prunes executions, which exceed a time budget.
+
+    The time is checked after each node. Thus, a running node is not
+    interrupted, but the remaining nodes are skipped.
+    """
+
+    def __init__(self, budget: float):
+        """
+        Create a new time budget pruner.
+
+        :param budget: The maximum time of an execution in seconds.
+        """
+        if budget <= 0:
+            raise ValueError(f"The budget has to be positive, but got {budget}")
+        self.__budget = budget
+
+    def on_trial_start(self, input_data, config):
+        self.trial_state()["start"] = time.perf_counter()
+
+    def on_node_end(self, node, parameters, result):
+        elapsed = time.perf_counter() - self.trial_state()["start"]
+        if elapsed > self.__budget:
+            raise TrialPruned(
+                f"The time budget of {self.__budget}s was exceeded "
+                f"after node '{node.name}' ({elapsed:.3f}s)"
+            )
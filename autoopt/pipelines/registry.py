@@ -0,0 +1,191 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# Author: Torben Hansing
+#
+"""
+This module implements a registry of pipeline nodes, which allows to
+synthesize all pipelines converting data of a source type into a target type.
+
+The nodes are indexed by their input and output types. Thus, the search only
+looks up the nodes, which can follow the current end of a pipeline, instead
+of scanning all registered nodes in each step.
+
+.. code:: python
+
+    registry = NodeRegistry()
+    for node in nodes:
+        registry.register(node)
+    for pipeline in registry.pipelines("path", "loss", max_length=4):
+        ...
+"""
+from collections import defaultdict, deque
+from typing import Dict, Iterator, List, Optional
+
+from .node import PipelineNode
+from .pipeline import Pipeline
+
+
+class NodeRegistry:
+    """
+    A registry of pipeline nodes indexed by their input and output types.
+
+    As in `Pipeline.add_node`, a node can follow a node with the output type
+    "Any" or with an output type equal to its input type.
+    """
+
+    def __init__(self):
+        self.__nodes = {}
+        self.__by_input_type = defaultdict(list)
+        self.__by_output_type = defaultdict(list)
+
+    def register(self, node: PipelineNode):
+        """
+        Register a new node.
+
+        :param node: The node to register.
+        :raises ValueError: If a node with the same name is already registered.
+        """
+        if node.name in self.__nodes:
+            raise ValueError(f"A node named '{node.name}' is already registered")
+        self.__nodes[node.name] = node
+        self.__by_input_type[node.input_type].append(node)
+        self.__by_output_type[node.output_type].append(node)
+
+    def __len__(self) -> int:
+        return len(self.__nodes)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.__nodes
+
+    def __iter__(self) -> Iterator[PipelineNode]:
+        return iter(self.__nodes.values())
+
+    def by_input_type(self, input_type: str) -> List[PipelineNode]:
+        """
+        Returns all registered nodes with the given input type.
+
+        :param input_type: The data type of the input.
+        :return: The nodes in the order of their registration
+        """
+        return list(self.__by_input_type.get(input_type, []))
+
+    def by_output_type(self, output_type: str) -> List[PipelineNode]:
+        """
+        Returns all registered nodes with the given output type.
+
+        :param output_type: The data type of the output.
+        :return: The nodes in the order of their registration
+        """
+        return list(self.__by_output_type.get(output_type, []))
+
+    def _successors(self, data_type: str) -> List[PipelineNode]:
+        """
+        Returns all nodes, which can process data of the given type.
+        """
+        if data_type == "Any":
+            return list(self.__nodes.values())
+        return self.__by_input_type.get(data_type, [])
+
+    def _distances(self, target_type: str) -> Optional[Dict[str, int]]:
+        """
+        Calculate the minimal number of nodes required to convert data
+        of each type into the target type.
+
+        This is a breadth first search from the target type along the
+        reversed edges. Types, which can't be converted into the target type,
+        are missing in the result. As all chains are valid for the target type
+        "Any", None is returned for it.
+        """
+        if target_type == "Any":
+            return None
+        distances = {target_type: 0}
+        pending = deque([target_type])
+        while pending:
+            data_type = pending.popleft()
+            distance = distances[data_type] + 1
+            # Data of type "Any" can be processed by all nodes
+            if "Any" not in distances and self.__by_output_type.get(data_type):
+                distances["Any"] = distance
+                pending.append("Any")
+            for node in self.__by_output_type.get(data_type, []):
+                if node.input_type not in distances:
+                    distances[node.input_type] = distance
+                    pending.append(node.input_type)
+        return distances
+
+    def chains(
+        self,
+        source_type: str,
+        target_type: str,
+        max_length: int = 3,
+        beam_width: Optional[int] = None,
+    ) -> Iterator[List[PipelineNode]]:
+        """
+        Enumerate the chains of nodes converting the source into the target type.
+
+        The chains are searched breadth first. Thus, shorter chains are returned
+        first. Each node is used at most once in a chain. Partial chains, which
+        can't reach the target type within the maximum length, are pruned.
+
+        If `beam_width` is given, only this number of partial chains is kept
+        for each length. These are the chains closest to the target type.
+
+        :param source_type: The data type of the input data.
+                            "Any" allows all nodes as the first node.
+        :param target_type: The data type of the result.
+                            "Any" accepts all chains.
+        :param max_length: The maximum number of nodes in a chain.
+        :param beam_width: The maximum number of partial chains of each length.
+                           If None, all partial chains are expanded.
+        :return: An iterator over the chains of nodes.
+        """
+        if beam_width is not None and beam_width < 1:
+            raise ValueError(f"The beam width has to be positive, but got {beam_width}")
+        distances = self._distances(target_type)
+
+        def remaining(data_type):
+            if distances is None:
+                return 0
+            return distances.get(data_type)
+
+        beam = [((), source_type)]
+        for length in range(1, max_length + 1):
+            expanded = []
+            for chain, data_type in beam:
+                for node in self._successors(data_type):
+                    output_type = node.output_type
+                    distance = remaining(output_type)
+                    if distance is None or length + distance > max_length:
+                        continue
+                    if node in chain:
+                        continue
+                    expanded.append((chain + (node,), output_type))
+            if beam_width is not None and len(expanded) > beam_width:
+                expanded.sort(key=lambda state: remaining(state[1]))
+                expanded = expanded[:beam_width]
+            for chain, output_type in expanded:
+                if target_type in ("Any", output_type):
+                    yield list(chain)
+            beam = expanded
+            if not beam:
+                return
+
+    def pipelines(
+        self,
+        source_type: str,
+        target_type: str,
+        max_length: int = 3,
+        beam_width: Optional[int] = None,
+    ) -> Iterator[Pipeline]:
+        """
+        Enumerate the pipelines converting the source into the target type.
+
+        See `chains` for the description of the parameters.
+
+        :return: An iterator over the pipelines.
+        """
+        for chain in self.chains(source_type, target_type, max_length, beam_width):
+            pipeline = Pipeline()
+            for node in chain:
+                pipeline.add_node(node)
+            yield pipeline
@@ -0,0 +1,528 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# Author: Torben Hansing
+#
+"""
+This module implements a compiled, array-backed representation of the
+parameter space of a pipeline.
+
+The parameter space of a pipeline is a nested dictionary of distributions
+(node name -> parameter name -> distribution). Evaluating many configurations
+on it would require to walk these dictionaries and to call each distribution
+for each configuration.
+
+Instead, the compiled space flattens the parameters into the columns of
+a matrix, such that a batch of N configurations is a (N x d) matrix.
+The distributions are grouped into families (uniform-like, normal-like,
+choices), which keep their parameters (bounds, loc/scale, q) in arrays.
+Thus, sampling and evaluating the densities of a whole batch only takes
+a few NumPy operations per family.
+
+.. code:: python
+
+    space = CompiledSpace(pipeline.parameter_space())
+    samples = space.sample(1000, rng=42)
+    log_densities = space.logpdf(samples)
+    configurations = space.decode(samples)
+
+Additionally, the compiled space can transform batches of configurations
+into the unit hypercube [0, 1]^d and back, in which most optimizers work best:
+
+.. code:: python
+
+    units = space.to_unit(space.encode(configurations))
+    configurations = space.decode(space.from_unit(units))
+"""
+
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+from autoopt.distributions import (
+    LogNormal,
+    LogUniform,
+    Normal,
+    QLogNormal,
+    QLogUniform,
+    QNormal,
+    QUniform,
+    Uniform,
+    WeightedChoice,
+)
+from autoopt.distributions.base import Distribution
+from autoopt.distributions.normal import _norm_cdf, _norm_ppf
+
+# The (log, quantized) flags of the distributions of the vectorized families
+_UNIFORM_TYPES = {
+    Uniform: (False, False),
+    QUniform: (False, True),
+    LogUniform: (True, False),
+    QLogUniform: (True, True),
+}
+_NORMAL_TYPES = {
+    Normal: (False, False),
+    QNormal: (False, True),
+    LogNormal: (True, False),
+    QLogNormal: (True, True),
+}
+
+
+def split_space(
+    space: Dict[str, Dict[str, Any]]
+) -> Tuple[List[Tuple[str, str]], List[Distribution], Dict[str, Dict[str, Any]]]:
+    """
+    Split a parameter space into its distributions and its fixed parameters.
+
+    :param space: The parameter space as returned by
+                  `Pipeline.parameter_space()`
+    :return: The (node name, parameter name) of each distribution,
+             the distributions and the fixed parameters of each node.
+    """
+    keys = []
+    distributions = []
+    constants = {}
+    for node_name, parameters in space.items():
+        constants[node_name] = {}
+        for name, value in parameters.items():
+            if isinstance(value, Distribution):
+                keys.append((node_name, name))
+                distributions.append(value)
+            else:
+                constants[node_name][name] = value
+    return keys, distributions, constants
+
+
+class _Family:
+    """
+    A group of columns of the space, whose distributions
+    can be handled together.
+    """
+
+    def __init__(self, columns: List[int], distributions: List[Distribution]):
+        self.columns = np.asarray(columns, dtype=int)
+        self.distributions = distributions
+
+    def sample(self, size: int, rng: np.random.Generator) -> np.ndarray:
+        """
+        Draw `size` values for each column of this family.
+
+        :return: A (size x k) matrix of values.
+        """
+        raise NotImplementedError("Has to be implemented by subclasses")
+
+    def logpdf(self, values: np.ndarray) -> np.ndarray:
+        """
+        Calculate the joint log-density of the columns of this family.
+
+        :param values: A (N x k) matrix of the values of this family.
+        :return: The summed log-densities of each row.
+        """
+        raise NotImplementedError("Has to be implemented by subclasses")
+
+    def to_unit(self, values: np.ndarray) -> np.ndarray:
+        """
+        Transform the values of this family into the unit hypercube.
+
+        :param values: A (N x k) matrix of the values of this family.
+        :return: A (N x k) matrix of the encoded values in [0, 1].
+        """
+        raise NotImplementedError("Has to be implemented by subclasses")
+
+    def from_unit(self, units: np.ndarray) -> np.ndarray:
+        """
+        Transform points of the unit hypercube into values of this family.
+
+        :param units: A (N x k) matrix of the encoded values in [0, 1].
+        :return: A (N x k) matrix of the values of this family.
+        """
+        raise NotImplementedError("Has to be implemented by subclasses")
+
+    def encode(self, unused_column: int, values: List[Any]) -> np.ndarray:
+        """
+        Convert the values of one parameter into a column of the matrix.
+        """
+        return np.asarray(values, dtype=float)
+
+    def decode(self, unused_column: int, values: np.ndarray) -> List[Any]:
+        """
+        Convert a column of the matrix into the values of one parameter.
+        """
+        return values.tolist()
+
+
+class _QuantizedMixin:
+    """
+    This mixin adds the handling of (optionally) logarithmic and quantized
+    distributions to a family.
+    """
+
+    def __init__(self, distributions, types):
+        flags = [types[type(dist)] for dist in distributions]
+        self.log = np.array([log for log, _ in flags], dtype=bool)
+        self.quantized = np.array([quantized for _, quantized in flags], dtype=bool)
+        self.q = np.array(
+            [
+                dist.q if quantized else 1.0
+                for dist, (_, quantized) in zip(distributions, flags)
+            ],
+            dtype=float,
+        )
+        # The smallest and largest multiples of q, which can be sampled
+        bounds = np.array(
+            [
+                dist.q_bounds if quantized else (-np.inf, np.inf)
+                for dist, (_, quantized) in zip(distributions, flags)
+            ],
+            dtype=float,
+        ).reshape(-1, 2)
+        self.q_low, self.q_high = bounds[:, 0], bounds[:, 1]
+
+    def round_to_q(self, values: np.ndarray) -> np.ndarray:
+        """
+        Round the values of the quantized columns to the next multiple of `q`.
+        """
+        return np.where(self.quantized, np.round(values / self.q) * self.q, values)
+
+    def round_to_support(self, values: np.ndarray) -> np.ndarray:
+        """
+        Round the values of the quantized columns to the nearest multiple
+        of `q` within the bounds of their distributions.
+        """
+        return np.clip(self.round_to_q(values), self.q_low, self.q_high)
+
+
+class _UniformFamily(_Family, _QuantizedMixin):
+    """
+    The family of Uniform, QUniform, LogUniform and QLogUniform distributions.
+    """
+
+    def __init__(self, columns, distributions):
+        super().__init__(columns, distributions)
+        _QuantizedMixin.__init__(self, distributions, _UNIFORM_TYPES)
+        self.low = np.array([dist.min_value for dist in distributions], dtype=float)
+        self.high = np.array([dist.max_value for dist in distributions], dtype=float)
+        # The bounds of the space, in which the values are uniformly distributed
+        self.low_t = self.low.copy()
+        self.low_t[self.log] = np.log(self.low[self.log])
+        self.high_t = self.high.copy()
+        self.high_t[self.log] = np.log(self.high[self.log])
+        self.log_width = np.log(self.high_t - self.low_t)
+
+    def sample(self, size, rng):
+        uniform = rng.uniform(self.low_t, self.high_t, size=(size, len(self.columns)))
+        return self.round_to_support(np.where(self.log, np.exp(uniform), uniform))
+
+    def logpdf(self, values):
+        values = self.round_to_q(values)
+        inside = (self.low <= values) & (values <= self.high)
+        # The lower bound of logarithmic distributions is always positive
+        log_values = np.log(np.where(inside & self.log, values, 1.0))
+        log_density = -self.log_width - np.where(self.log, log_values, 0.0)
+        return np.where(inside, log_density, -np.inf).sum(axis=1)
+
+    def to_unit(self, values):
+        values = self.round_to_q(values)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            values = np.where(self.log, np.log(values), values)
+        return (values - self.low_t) / (self.high_t - self.low_t)
+
+    def from_unit(self, units):
+        values = self.low_t + units * (self.high_t - self.low_t)
+        return self.round_to_support(np.where(self.log, np.exp(values), values))
+
+
+class _NormalFamily(_Family, _QuantizedMixin):
+    """
+    The family of Normal, QNormal, LogNormal and QLogNormal distributions.
+    """
+
+    def __init__(self, columns, distributions):
+        super().__init__(columns, distributions)
+        _QuantizedMixin.__init__(self, distributions, _NORMAL_TYPES)
+        self.loc = np.array([dist.loc for dist in distributions], dtype=float)
+        self.scale = np.array([dist.scale for dist in distributions], dtype=float)
+
+    def sample(self, size, rng):
+        normal = rng.normal(self.loc, self.scale, size=(size, len(self.columns)))
+        return self.round_to_support(np.where(self.log, np.exp(normal), normal))
+
+    def logpdf(self, values):
+        values = self.round_to_q(values)
+        undefined = self.log & (values <= 0)
+        log_values = np.log(np.where(self.log & ~undefined, values, 1.0))
+        normal = np.where(self.log, log_values, values)
+        log_density = (
+            -0.5 * ((normal - self.loc) / self.scale) ** 2
+            - np.log(self.scale)
+            - 0.5 * np.log(2 * np.pi)
+            - log_values
+        )
+        return np.where(undefined, -np.inf, log_density).sum(axis=1)
+
+    def to_unit(self, values):
+        values = self.round_to_q(values)
+        undefined = self.log & (values <= 0)
+        log_values = np.log(np.where(self.log & ~undefined, values, 1.0))
+        normal = np.where(self.log, log_values, values)
+        units = _norm_cdf((normal - self.loc) / self.scale)
+        return np.where(undefined, 0.0, units)
+
+    def from_unit(self, units):
+        normal = self.loc + self.scale * _norm_ppf(units)
+        return self.round_to_support(np.where(self.log, np.exp(normal), normal))
+
+
+class _ChoiceFamily(_Family):
+    """
+    The family of choice distributions.
+
+    The columns of choices contain the indices of the chosen values.
+    As the number of choices differs between the parameters,
+    each column is processed on its own.
+    """
+
+    def __init__(self, columns, distributions):
+        super().__init__(columns, distributions)
+        self.values = []
+        self.log_probabilities = []
+        self.num_choices = np.array([len(dist.choices) for dist in distributions])
+        for dist in distributions:
+            values = np.empty(len(dist.choices), dtype=object)
+            values[:] = list(dist.choices)
+            self.values.append(values)
+            with np.errstate(divide="ignore"):
+                self.log_probabilities.append(np.log(dist.probabilities))
+
+    def sample(self, size, rng):
+        return np.column_stack(
+            [dist.sample_index(size=size, rng=rng) for dist in self.distributions]
+        ).astype(float)
+
+    def logpdf(self, values):
+        log_density = np.zeros(len(values))
+        for i, log_probabilities in enumerate(self.log_probabilities):
+            indices = values[:, i]
+            valid = (indices >= 0) & (indices < len(log_probabilities))
+            valid &= indices == np.round(indices)
+            safe = np.where(valid, indices, 0).astype(int)
+            log_density += np.where(valid, log_probabilities[safe], -np.inf)
+        return log_density
+
+    def to_unit(self, values):
+        return (values + 0.5) / self.num_choices
+
+    def from_unit(self, units):
+        indices = np.floor(units * self.num_choices)
+        return np.clip(indices, 0, self.num_choices - 1)
+
+    def encode(self, column, values):
+        index = np.searchsorted(self.columns, column)
+        indices = self.distributions[index].index(values).astype(float)
+        return np.where(indices >= 0, indices, np.nan)
+
+    def decode(self, column, values):
+        index = np.searchsorted(self.columns, column)
+        return self.values[index][values.astype(int)].tolist()
+
+
+class _GenericFamily(_Family):
+    """
+    The family of all other distributions.
+
+    Each column is handled by the distribution itself,
+    which has to support numerical values only.
+    """
+
+    def sample(self, size, rng):
+        return np.column_stack(
+            [dist.sample(size=size, rng=rng) for dist in self.distributions]
+        ).astype(float)
+
+    def logpdf(self, values):
+        log_density = np.zeros(len(values))
+        for i, dist in enumerate(self.distributions):
+            log_density += dist.logpdf(values[:, i])
+        return log_density
+
+    def to_unit(self, values):
+        return np.column_stack(
+            [dist.to_unit(values[:, i]) for i, dist in enumerate(self.distributions)]
+        ).astype(float)
+
+    def from_unit(self, units):
+        return np.column_stack(
+            [dist.from_unit(units[:, i]) for i, dist in enumerate(self.distributions)]
+        ).astype(float)
+
+
+class CompiledSpace:
+    """
+    An array-backed representation of the parameter space of a pipeline.
+
+    Each parameter of the space is a column of a (N x d) matrix,
+    which holds a batch of N configurations. The values of choice parameters
+    are stored as the index of the choice.
+
+    Values of the space, that are not distributions, are considered to be
+    fixed parameters. They are not part of the matrix, but are added to each
+    decoded configuration.
+    """
+
+    def __init__(self, space: Dict[str, Dict[str, Any]]):
+        """
+        Compile the given parameter space.
+
+        :param space: The parameter space as returned by
+                      `Pipeline.parameter_space()`
+        """
+        self.__keys, self.__distributions, self.__constants = split_space(space)
+
+        groups = {
+            _UniformFamily: [],
+            _NormalFamily: [],
+            _ChoiceFamily: [],
+            _GenericFamily: [],
+        }
+        for column, dist in enumerate(self.__distributions):
+            if type(dist) in _UNIFORM_TYPES:
+                groups[_UniformFamily].append(column)
+            elif type(dist) in _NORMAL_TYPES:
+                groups[_NormalFamily].append(column)
+            elif isinstance(dist, WeightedChoice):
+                groups[_ChoiceFamily].append(column)
+            else:
+                groups[_GenericFamily].append(column)
+        self.__families = [
+            family(columns, [self.__distributions[column] for column in columns])
+            for family, columns in groups.items()
+            if columns
+        ]
+        self.__column_families = [None] * len(self.__distributions)
+        for family in self.__families:
+            for column in family.columns:
+                self.__column_families[column] = family
+
+    @property
+    def keys(self) -> List[Tuple[str, str]]:
+        """
+        The (node name, parameter name) of each column of the space.
+        """
+        return list(self.__keys)
+
+    @property
+    def distributions(self) -> List[Distribution]:
+        """
+        The distribution of each column of the space.
+        """
+        return list(self.__distributions)
+
+    def __len__(self) -> int:
+        return len(self.__keys)
+
+    def sample(self, size: int, rng=None) -> np.ndarray:
+        """
+        Draw `size` configurations from the space.
+
+        :param size: The number of configurations to draw.
+        :param rng: The random number generator (or seed) to draw the values from.
+        :return: A (size x d) matrix of configurations.
+        """
+        rng = np.random.default_rng(rng)
+        samples = np.empty((size, len(self)))
+        for family in self.__families:
+            samples[:, family.columns] = family.sample(size, rng)
+        return samples
+
+    def logpdf(self, samples: np.ndarray) -> np.ndarray:
+        """
+        Calculate the joint log-density of a batch of configurations.
+
+        :param samples: A (N x d) matrix of configurations.
+        :return: An array with the log-density of each of the N configurations.
+        """
+        samples = np.atleast_2d(np.asarray(samples, dtype=float))
+        log_density = np.zeros(len(samples))
+        for family in self.__families:
+            log_density += family.logpdf(samples[:, family.columns])
+        return log_density
+
+    def pdf(self, samples: np.ndarray) -> np.ndarray:
+        """
+        Calculate the joint density of a batch of configurations.
+
+        :param samples: A (N x d) matrix of configurations.
+        :return: An array with the density of each of the N configurations.
+        """
+        return np.exp(self.logpdf(samples))
+
+    def to_unit(self, samples: np.ndarray) -> np.ndarray:
+        """
+        Transform a batch of configurations into the unit hypercube.
+
+        The values are transformed linearly for uniform, logarithmically
+        for log-uniform and by the CDF for normal distributions. Choices are
+        encoded by their ordinal index.
+
+        :param samples: A (N x d) matrix of configurations.
+        :return: A (N x d) matrix of the configurations in [0, 1]^d.
+        """
+        samples = np.atleast_2d(np.asarray(samples, dtype=float))
+        units = np.empty_like(samples)
+        for family in self.__families:
+            units[:, family.columns] = family.to_unit(samples[:, family.columns])
+        return units
+
+    def from_unit(self, units: np.ndarray) -> np.ndarray:
+        """
+        Transform points of the unit hypercube into a batch of configurations.
+
+        This is the inverse of `to_unit`. Quantized values are snapped to
+        the nearest multiple of `q`.
+
+        :param units: A (N x d) matrix of points in [0, 1]^d.
+        :return: A (N x d) matrix of configurations.
+        """
+        units = np.atleast_2d(np.asarray(units, dtype=float))
+        samples = np.empty_like(units)
+        for family in self.__families:
+            samples[:, family.columns] = family.from_unit(units[:, family.columns])
+        return samples
+
+    def encode(self, configurations: List[Dict[str, Dict[str, Any]]]) -> np.ndarray:
+        """
+        Convert a batch of configurations into a matrix.
+
+        Choices, which are not part of the distribution, are encoded as NaN.
+
+        :param configurations: The configurations as passed to `Pipeline.execute`
+        :return: A (N x d) matrix of the configurations.
+        """
+        samples = np.empty((len(configurations), len(self)))
+        for column, (node_name, name) in enumerate(self.__keys):
+            values = [config[node_name][name] for config in configurations]
+            samples[:, column] = self.__column_families[column].encode(column, values)
+        return samples
+
+    def decode(self, samples: np.ndarray) -> List[Dict[str, Dict[str, Any]]]:
+        """
+        Convert a matrix into a batch of configurations.
+
+        :param samples: A (N x d) matrix of configurations.
+        :return: The configurations, which can be passed to `Pipeline.execute`.
+        """
+        samples = np.atleast_2d(np.asarray(samples, dtype=float))
+        columns = [
+            self.__column_families[column].decode(column, samples[:, column])
+            for column in range(len(self))
+        ]
+        rows = zip(*columns) if columns else [()] * len(samples)
+        configurations = []
+        for row in rows:
+            config = {
+                node_name: dict(constants)
+                for node_name, constants in self.__constants.items()
+            }
+            for (node_name, name), value in zip(self.__keys, row):
+                config[node_name][name] = value
+            configurations.append(config)
+        return configurations
@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# Author: Torben Hansing
+#
+"""
+This module implements helpers to process streams of chunks in pipelines.
+"""
+import queue
+import threading
+from typing import Any, Iterable, Iterator, NamedTuple
+
+# Marks the end of a prefetched stream
+_END = object()
+
+
+class _Failure(NamedTuple):
+    """
+    Wraps an exception raised while producing a prefetched stream.
+    """
+
+    exception: BaseException
+
+
+def prefetch(iterable: Iterable[Any], buffer_size: int) -> Iterator[Any]:
+    """
+    Produce the items of an iterable in a background thread.
+
+    At most `buffer_size` items are produced in advance. Thus, the producer
+    and the consumer of the stream run concurrently, while the memory used
+    by the buffer stays bounded. Exceptions of the producer are re-raised
+    in the consumer.
+
+    :param iterable: The stream to prefetch.
+    :param buffer_size: The maximum number of buffered items.
+    :return: An iterator over the items of the stream.
+    """
+    if buffer_size < 1:
+        raise ValueError(f"The buffer size has to be positive, but got {buffer_size}")
+    buffer = queue.Queue(maxsize=buffer_size)
+    stopped = threading.Event()
+
+    def put(item) -> bool:
+        while not stopped.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def produce():
+        try:
+            for item in iterable:
+                if not put(item):
+                    return
+        except BaseException as exception:  # pylint: disable=broad-except
+            put(_Failure(exception))
+            return
+        put(_END)
+
+    thread = threading.Thread(target=produce, daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = buffer.get()
+            if item is _END:
+                return
+            if isinstance(item, _Failure):
+                raise item.exception
+            yield item
+    finally:
+        # Let the producer stop, if the stream is not consumed completely
+        stopped.set()
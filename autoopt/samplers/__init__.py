@@ -0,0 +1,14 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# Author: Torben Hansing
+#
+"""
+This module implements the different samplers, which generate configurations
+from the parameter space of a pipeline without any feedback of the results.
+
+They can be used to explore a parameter space or to generate the initial
+design for an optimizer.
+"""
+from .halton import HaltonSampler  # NOQA
+from .grid import GridSampler  # NOQA
+from .latin_hypercube import LatinHypercubeSampler  # NOQA
@@ -0,0 +1,173 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# Author: Torben Hansing
+#
+"""
+This module implements a lazy grid search over discrete parameter spaces.
+
+Quantized uniform distributions (QUniform, QLogUniform) and choices have
+a finite support. Thus, all combinations of their values can be enumerated.
+
+The grid is never materialized. Instead, each point of the grid is identified
+by its index, whose mixed-radix digits are the indices of the values of the
+parameters (the last parameter changes fastest). This allows to split the
+grid across workers and to resume an enumeration at any index.
+
+.. code:: python
+
+    grid = GridSampler(pipeline.parameter_space())
+    for index, config in grid.iterate(start=cursor, shard=k, num_shards=n):
+        ...
+"""
+import math
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from autoopt.distributions import QLogUniform, QUniform, WeightedChoice
+from autoopt.distributions.base import Distribution
+from autoopt.pipelines.space import split_space
+
+
+def _support(dist: Distribution) -> List[Any]:
+    """
+    Return all values of a discrete distribution, which have a
+    positive probability.
+
+    :param dist: The distribution to get the support of.
+    :return: The list of values.
+    :raises ValueError: If the distribution is not discrete or unbounded.
+    """
+    if isinstance(dist, WeightedChoice):
+        return [
+            choice
+            for choice, probability in zip(dist.choices, dist.probabilities)
+            if probability > 0
+        ]
+    if isinstance(dist, (QUniform, QLogUniform)):
+        first, last = (int(step) for step in np.round(np.divide(dist.q_bounds, dist.q)))
+        return (np.arange(first, last + 1) * dist.q).tolist()
+    raise ValueError(
+        f"Can't enumerate a '{type(dist).__name__}' distribution. "
+        "Only quantized uniform distributions and choices are supported."
+    )
+
+
+class GridSampler:
+    """
+    Enumerates the Cartesian product of the values of a discrete
+    parameter space lazily.
+
+    Values of the space, that are not distributions, are considered to be
+    fixed parameters and are added to each configuration.
+    """
+
+    def __init__(self, space: Dict[str, Dict[str, Any]]):
+        """
+        Create a new grid for the given parameter space.
+
+        :param space: The parameter space as returned by
+                      `Pipeline.parameter_space()`
+        :raises ValueError: If the space contains continuous distributions.
+        """
+        self.__keys, distributions, self.__constants = split_space(space)
+        self.__values = [_support(dist) for dist in distributions]
+        self.__radices = [len(values) for values in self.__values]
+        self.__size = math.prod(self.__radices)
+
+    @property
+    def keys(self) -> List[Tuple[str, str]]:
+        """
+        The (node name, parameter name) of each parameter of the grid.
+        """
+        return list(self.__keys)
+
+    @property
+    def radices(self) -> List[int]:
+        """
+        The number of values of each parameter of the grid.
+        """
+        return list(self.__radices)
+
+    def __len__(self) -> int:
+        return self.__size
+
+    def _digits(self, index: int) -> List[int]:
+        """
+        Split an index of the grid into the indices of the values.
+        """
+        if not 0 <= index < self.__size:
+            raise IndexError(f"Index {index} is out of range of the grid")
+        digits = [0] * len(self.__radices)
+        for position in reversed(range(len(self.__radices))):
+            index, digits[position] = divmod(index, self.__radices[position])
+        return digits
+
+    def _configuration(self, digits: List[int]) -> Dict[str, Dict[str, Any]]:
+        config = {
+            node_name: dict(constants)
+            for node_name, constants in self.__constants.items()
+        }
+        for (node_name, name), values, digit in zip(
+            self.__keys, self.__values, digits
+        ):
+            config[node_name][name] = values[digit]
+        return config
+
+    def configuration(self, index: int) -> Dict[str, Dict[str, Any]]:
+        """
+        Return the configuration at the given index of the grid.
+
+        :param index: The index of the point in the grid.
+        :return: The configuration, which can be passed to `Pipeline.execute`.
+        """
+        return self._configuration(self._digits(index))
+
+    def iterate(
+        self,
+        start: int = 0,
+        stop: Optional[int] = None,
+        shard: int = 0,
+        num_shards: int = 1,
+    ) -> Iterator[Tuple[int, Dict[str, Dict[str, Any]]]]:
+        """
+        Lazily enumerate the configurations of the grid.
+
+        To split the grid across `num_shards` workers, each worker enumerates
+        the indices, which are congruent to its `shard` modulo `num_shards`.
+        The enumeration yields the index of each configuration as well.
+        Thus, a stopped enumeration can be resumed at the next index.
+
+        :param start: The first index to enumerate.
+        :param stop: The index to stop at (exclusive). Defaults to the size
+                     of the grid.
+        :param shard: The shard of the grid to enumerate, in [0, num_shards).
+        :param num_shards: The number of shards, the grid is split into.
+        :return: An iterator over tuples of the index and the configuration.
+        """
+        if not 0 <= shard < num_shards:
+            raise ValueError(
+                f"The shard has to be in [0, {num_shards}), but got {shard}"
+            )
+        stop = self.__size if stop is None else min(stop, self.__size)
+        # The first index >= start, which belongs to the shard
+        index = max(start, 0)
+        index += (shard - index) % num_shards
+        if index >= stop:
+            return
+        digits = self._digits(index)
+        while index < stop:
+            yield index, self._configuration(digits)
+            index += num_shards
+            # Add the step to the digits like an odometer
+            carry = num_shards
+            for position in reversed(range(len(digits))):
+                carry, digits[position] = divmod(
+                    digits[position] + carry, self.__radices[position]
+                )
+                if carry == 0:
+                    break
+
+    def __iter__(self) -> Iterator[Dict[str, Dict[str, Any]]]:
+        for _, config in self.iterate():
+            yield config
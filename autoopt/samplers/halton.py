@@ -0,0 +1,157 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# Author: Torben Hansing
+#
+"""
+This module implements a quasi-random sampler based on the Halton sequence.
+
+In contrast to independently drawn random samples, the points of a
+low-discrepancy sequence cover the parameter space evenly. Thus, for the same
+number of (expensive) pipeline evaluations, the space is explored much better.
+
+The points of the sequence are generated in the unit hypercube and are mapped
+to the distributions of the parameters using their `from_unit` transformation.
+
+.. code:: python
+
+    sampler = HaltonSampler(pipeline.parameter_space(), seed=42)
+    for configurations in sampler.blocks(block_size=64):
+        ...
+"""
+from typing import Any, Dict, Iterator, List
+
+import numpy as np
+
+from autoopt.pipelines.space import CompiledSpace
+
+
+def _primes(count: int) -> List[int]:
+    """
+    Return the first `count` prime numbers.
+    """
+    primes = []
+    candidate = 2
+    while len(primes) < count:
+        if all(candidate % prime != 0 for prime in primes if prime**2 <= candidate):
+            primes.append(candidate)
+        candidate += 1
+    return primes
+
+
+def _radical_inverse(
+    indices: np.ndarray, base: int, permutation: np.ndarray
+) -> np.ndarray:
+    """
+    Calculate the (scrambled) radical inverse of the given indices.
+
+    The digits of the indices in the given base are mirrored at the decimal
+    point and each digit is replaced by the given permutation of the digits.
+
+    :param indices: The indices of the points of the sequence.
+    :param base: The base of the sequence.
+    :param permutation: The permutation of the digits in [0, base).
+    :return: The points of the sequence in [0, 1).
+    """
+    result = np.zeros(len(indices))
+    remaining = indices.copy()
+    factor = 1.0 / base
+    while np.any(remaining > 0):
+        remaining, digits = np.divmod(remaining, base)
+        result += permutation[digits] * factor
+        factor /= base
+    return result
+
+
+class HaltonSampler:
+    """
+    Samples configurations from a parameter space using a scrambled
+    Halton sequence.
+
+    Each parameter of the space uses the Halton sequence of another prime
+    base. To break the correlations between the sequences of large bases,
+    the digits of each base are randomly permuted (scrambled).
+
+    The sampler is streaming: each call continues the sequence where the
+    previous one stopped. The position in the sequence is available as
+    `index` and can be passed to a new sampler to resume the sequence.
+    """
+
+    def __init__(
+        self,
+        space: Dict[str, Dict[str, Any]],
+        scramble: bool = True,
+        seed=None,
+        index: int = 0,
+    ):
+        """
+        Create a new sampler for the given parameter space.
+
+        :param space: The parameter space as returned by
+                      `Pipeline.parameter_space()`
+        :param scramble: Whether to randomly permute the digits of the sequences.
+        :param seed: The seed (or random number generator) for the scrambling.
+        :param index: The position in the sequence to start at.
+        """
+        self.__space = CompiledSpace(space)
+        self.__bases = _primes(len(self.__space))
+        rng = np.random.default_rng(seed)
+        self.__permutations = []
+        for base in self.__bases:
+            permutation = np.arange(base)
+            if scramble:
+                # Keeping 0 in place ensures, that the trailing zeros of the
+                # digits do not change the value and no point is exactly 0.
+                permutation[1:] = rng.permutation(permutation[1:])
+            self.__permutations.append(permutation)
+        self.__index = index
+
+    @property
+    def space(self) -> CompiledSpace:
+        """
+        The compiled parameter space, the configurations are sampled from.
+        """
+        return self.__space
+
+    @property
+    def index(self) -> int:
+        """
+        The position of the next point in the sequence.
+        """
+        return self.__index
+
+    def points(self, size: int) -> np.ndarray:
+        """
+        Generate the next `size` points of the sequence in the unit hypercube.
+
+        :param size: The number of points to generate.
+        :return: A (size x d) matrix of points in (0, 1)^d.
+        """
+        # The first point of the sequence is 0, which is skipped, as it's
+        # mapped to an infinite value by unbound distributions.
+        indices = np.arange(self.__index + 1, self.__index + size + 1)
+        self.__index += size
+        points = np.empty((size, len(self.__space)))
+        for column, (base, permutation) in enumerate(
+            zip(self.__bases, self.__permutations)
+        ):
+            points[:, column] = _radical_inverse(indices, base, permutation)
+        return points
+
+    def sample(self, size: int) -> List[Dict[str, Dict[str, Any]]]:
+        """
+        Generate the next `size` configurations.
+
+        :param size: The number of configurations to generate.
+        :return: The configurations, which can be passed to `Pipeline.execute`.
+        """
+        return self.__space.decode(self.__space.from_unit(self.points(size)))
+
+    def blocks(self, block_size: int) -> Iterator[List[Dict[str, Dict[str, Any]]]]:
+        """
+        Generate the configurations of the sequence in blocks on demand.
+
+        :param block_size: The number of configurations in each block.
+        :return: An infinite iterator over the blocks of configurations.
+        """
+        while True:
+            yield self.sample(block_size)
@@ -0,0 +1,137 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# Author: Torben Hansing
+#
+"""
+This module implements a generator for Latin hypercube designs.
+
+A Latin hypercube design of N points divides the range of each parameter into
+N strata of equal probability and places exactly one point into each stratum.
+Thus, even small designs cover the range of every single parameter.
+This makes them a good choice for the initial design of an optimization.
+
+Optionally, the design is improved to maximize the minimal distance between
+its points (maximin), which spreads the points more evenly across the space.
+
+.. code:: python
+
+    sampler = LatinHypercubeSampler(pipeline.parameter_space(), seed=42)
+    configurations = sampler.sample(20)
+"""
+from typing import Any, Dict, List
+
+import numpy as np
+
+from autoopt.pipelines.space import CompiledSpace
+
+
+def _squared_distances(points: np.ndarray, rows: np.ndarray) -> np.ndarray:
+    """
+    Calculate the squared euclidean distances of the given rows to all points.
+
+    :param points: A (N x d) matrix of points.
+    :param rows: The indices of k rows to calculate the distances for.
+    :return: A (k x N) matrix of squared distances.
+    """
+    return ((points[rows, None, :] - points[None, :, :]) ** 2).sum(axis=-1)
+
+
+def _maximin(points: np.ndarray, iterations: int, rng: np.random.Generator):
+    """
+    Improve the minimal distance between the points of a design in-place.
+
+    In each iteration, one point of the closest pair swaps the value of
+    a random parameter with another random point. This keeps the Latin
+    hypercube property. The swap is kept only if it increases the minimal
+    distance between the points. As only the distances of the two swapped
+    points change, they are updated instead of recalculated.
+
+    :param points: The (N x d) design to improve.
+    :param iterations: The number of swaps to try.
+    :param rng: The random number generator to choose the swaps.
+    """
+    size, dimensions = points.shape
+    if size < 3 or dimensions == 0:
+        return
+    distances = _squared_distances(points, np.arange(size))
+    np.fill_diagonal(distances, np.inf)
+    for _ in range(iterations):
+        closest = np.unravel_index(np.argmin(distances), distances.shape)
+        minimum = distances[closest]
+        first = closest[rng.integers(2)]
+        second = rng.integers(size - 1)
+        second += second >= first
+        column = rng.integers(dimensions)
+        rows = np.array([first, second])
+
+        points[rows, column] = points[rows[::-1], column]
+        old = distances[rows].copy()
+        new = _squared_distances(points, rows)
+        new[0, first] = new[1, second] = np.inf
+        distances[rows] = new
+        distances[:, rows] = new.T
+        if distances.min() <= minimum:
+            # Revert the swap
+            points[rows, column] = points[rows[::-1], column]
+            distances[rows] = old
+            distances[:, rows] = old.T
+
+
+class LatinHypercubeSampler:
+    """
+    Samples batches of stratified configurations from a parameter space
+    using Latin hypercube designs.
+
+    The designs are created in the unit hypercube and are mapped to the
+    distributions of the parameters using their `from_unit` transformation.
+    Thus, the strata have equal probabilities under the distributions.
+    """
+
+    def __init__(
+        self,
+        space: Dict[str, Dict[str, Any]],
+        maximin_iterations: int = 0,
+        seed=None,
+    ):
+        """
+        Create a new sampler for the given parameter space.
+
+        :param space: The parameter space as returned by
+                      `Pipeline.parameter_space()`
+        :param maximin_iterations: The number of iterations to maximize the
+                                   minimal distance between the points.
+                                   If 0, the design is not optimized.
+        :param seed: The seed (or random number generator) of the sampler.
+        """
+        self.__space = CompiledSpace(space)
+        self.__maximin_iterations = maximin_iterations
+        self.__rng = np.random.default_rng(seed)
+
+    @property
+    def space(self) -> CompiledSpace:
+        """
+        The compiled parameter space, the configurations are sampled from.
+        """
+        return self.__space
+
+    def points(self, size: int) -> np.ndarray:
+        """
+        Generate a Latin hypercube design of `size` points in the unit hypercube.
+
+        :param size: The number of points of the design.
+        :return: A (size x d) matrix of points in [0, 1)^d.
+        """
+        shape = (size, len(self.__space))
+        strata = np.argsort(self.__rng.random(shape), axis=0)
+        points = (strata + self.__rng.random(shape)) / size
+        _maximin(points, self.__maximin_iterations, self.__rng)
+        return points
+
+    def sample(self, size: int) -> List[Dict[str, Dict[str, Any]]]:
+        """
+        Generate a batch of `size` stratified configurations.
+
+        :param size: The number of configurations to generate.
+        :return: The configurations, which can be passed to `Pipeline.execute`.
+        """
+        return self.__space.decode(self.__space.from_unit(self.points(size)))
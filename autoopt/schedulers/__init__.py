@@ -0,0 +1,12 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# Author: Torben Hansing
+#
+"""
+This module implements the multi-fidelity schedulers, which evaluate many
+configurations with a small budget and only the most promising ones with
+the full budget (see `autoopt.tasks.Fidelity`).
+"""
+from .base import Evaluation, Scheduler  # NOQA
+from .asha import ASHAScheduler  # NOQA
+from .hyperband import HyperbandScheduler  # NOQA
@@ -0,0 +1,249 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# Author: Torben Hansing
+#
+"""
+This module implements the asynchronous successive halving algorithm (ASHA).
+
+Unlike the rungs of `HyperbandScheduler`, the rungs of ASHA are never
+complete. A configuration is promoted to the next rung as soon as it is
+among the best 1 / eta of the configurations evaluated at its rung so far.
+Thus, a worker never waits for other evaluations. If no configuration can
+be promoted, the worker evaluates a new configuration at the smallest
+budget:
+
+.. code:: python
+
+    fidelity = Fidelity("train", "epochs", min_budget=1, max_budget=81)
+    optimizer = TPEOptimizer(fidelity.strip(pipeline.parameter_space()))
+    scheduler = ASHAScheduler(pipeline, optimizer, fidelity, loss, max_workers=8)
+    best = scheduler.run(input_data, max_evaluations=1000)
+"""
+import contextlib
+import heapq
+import logging
+import math
+import os
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+from typing import Any, Callable, Optional, Tuple
+
+from autoopt.optimizers import Optimizer
+from autoopt.pipelines import Pipeline
+from autoopt.tasks import Fidelity
+from .base import Evaluation, Scheduler
+
+
+class _Rung:
+    """
+    The completed evaluations of one rung.
+
+    The best floor(n / eta) of the n evaluations are stored in a max-heap
+    and all others in a min-heap. The promotable trials are kept in a
+    min-heap, whose entries are validated lazily when they are popped.
+    Thus, adding an evaluation and promoting a trial take O(log n) time.
+    """
+
+    def __init__(self, eta: float):
+        self.__eta = eta
+        self.__top = []
+        self.__rest = []
+        self.__candidates = []
+        self.__in_top = set()
+        self.__promoted = set()
+
+    def __len__(self) -> int:
+        return len(self.__top) + len(self.__rest)
+
+    def __enter_top(self, loss: float, trial: int):
+        heapq.heappush(self.__top, (-loss, -trial))
+        self.__in_top.add(trial)
+        if trial not in self.__promoted:
+            heapq.heappush(self.__candidates, (loss, trial))
+
+    def add(self, trial: int, loss: float):
+        """
+        Add the loss of a trial evaluated at this rung.
+
+        :param trial: The id of the trial.
+        :param loss: The loss of the trial.
+        """
+        if self.__top and (loss, trial) < (-self.__top[0][0], -self.__top[0][1]):
+            self.__enter_top(loss, trial)
+        else:
+            heapq.heappush(self.__rest, (loss, trial))
+        size = int(math.floor(len(self) / self.__eta + 1e-9))
+        while len(self.__top) > size:
+            loss, trial = heapq.heappop(self.__top)
+            self.__in_top.discard(-trial)
+            heapq.heappush(self.__rest, (-loss, -trial))
+        while len(self.__top) < size:
+            self.__enter_top(*heapq.heappop(self.__rest))
+
+    def pop_promotable(self) -> Optional[int]:
+        """
+        Mark the best trial among the top 1 / eta, which has not been
+        promoted yet, as promoted.
+
+        :return: The id of the trial, or None, if no trial can be promoted.
+        """
+        while self.__candidates:
+            _, trial = heapq.heappop(self.__candidates)
+            if trial in self.__in_top and trial not in self.__promoted:
+                self.__promoted.add(trial)
+                return trial
+        return None
+
+
+class ASHAScheduler(Scheduler):
+    """
+    Schedules the evaluation of configurations suggested by an optimizer
+    using asynchronous successive halving.
+
+    The evaluations are executed on an executor, which keeps up to
+    `max_workers` evaluations running. The optimizer is told the loss of
+    each evaluation as soon as it completes. Thus, promoted configurations
+    are told once per rung.
+
+    With the default thread pool, all evaluations share the pipeline. Its
+    hooks keep their state per execution (see `PipelineHook.trial_state`)
+    and its cache is thread-safe. Then, the results of the nodes in front
+    of the budget node are reused, when a configuration is promoted.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        pipeline: Pipeline,
+        optimizer: Optimizer,
+        fidelity: Fidelity,
+        loss: Callable[[Any], float],
+        eta: float = 3,
+        max_workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+    ):
+        """
+        Create a new ASHA scheduler.
+
+        :param pipeline: The pipeline to evaluate the configurations with.
+        :param optimizer: The optimizer, which suggests the configurations.
+                          Its space must not contain the budget parameter.
+        :param fidelity: The budget parameter of the pipeline.
+        :param loss: Calculates the loss of a result of the pipeline.
+                     Exceptions raised by it stop the run.
+        :param eta: The factor, by which the budget increases and the number
+                    of configurations decreases from one rung to the next.
+        :param max_workers: The number of concurrent evaluations.
+                            Defaults to the number of CPUs.
+        :param executor: The executor to run the evaluations on. If None, a new
+                         thread pool is used for each run.
+        """
+        super().__init__(pipeline, optimizer, fidelity, loss, eta)
+        if max_workers is not None and max_workers < 1:
+            raise ValueError(
+                f"The number of workers has to be positive, but got {max_workers}"
+            )
+        self.__max_workers = max_workers or os.cpu_count() or 1
+        self.__executor = executor
+        self.__rungs = [_Rung(eta) for _ in self.budgets]
+        self.__configs = []
+
+    @property
+    def best(self) -> Evaluation:
+        """
+        The evaluation with the lowest loss at the largest budget, with which
+        a configuration has been evaluated so far.
+        """
+        history = self.history
+        if not history:
+            raise ValueError("No configuration has been evaluated yet")
+        budget = max(evaluation.budget for evaluation in history)
+        evaluations = [
+            evaluation for evaluation in history if evaluation.budget == budget
+        ]
+        return min(evaluations, key=lambda evaluation: evaluation.loss)
+
+    def _next_job(self) -> Tuple[int, int]:
+        """
+        Select the next evaluation as the best promotable trial of the
+        highest possible rung or a new trial at the first rung.
+
+        :return: The id of the trial and the rung to evaluate it at.
+        """
+        for rung in reversed(range(len(self.__rungs) - 1)):
+            trial = self.__rungs[rung].pop_promotable()
+            if trial is not None:
+                return trial, rung + 1
+        self.__configs.append(self.optimizer.ask()[0])
+        return len(self.__configs) - 1, 0
+
+    def _report(self, trial: int, rung: int, loss: float):
+        """
+        Record the loss of a completed evaluation.
+        """
+        config = self.__configs[trial]
+        self._record([Evaluation(config, self.budgets[rung], loss)])
+        self.__rungs[rung].add(trial, loss)
+        self.optimizer.tell([config], [loss])
+
+    def _evaluate(self, input_data: Any, trial: int, rung: int) -> Any:
+        config = self.fidelity.inject(self.__configs[trial], self.budgets[rung])
+        return self.pipeline.execute(input_data, **config)
+
+    def run(self, input_data: Any, max_evaluations: int) -> Evaluation:
+        """
+        Evaluate configurations until `max_evaluations` evaluations (at any
+        budget) have been completed.
+
+        A failed or pruned evaluation gets an infinite loss. The exceptions
+        of failed evaluations are logged.
+
+        :param input_data: The input data of the pipeline.
+        :param max_evaluations: The number of evaluations to run.
+        :return: The best evaluation at the largest budget (see `best`).
+        """
+        running = {}
+        submitted = 0
+        with contextlib.ExitStack() as stack:
+            executor = self.__executor or stack.enter_context(
+                ThreadPoolExecutor(self.__max_workers)
+            )
+            try:
+                while running or submitted < max_evaluations:
+                    free = min(
+                        self.__max_workers - len(running), max_evaluations - submitted
+                    )
+                    for _ in range(free):
+                        job = self._next_job()
+                        running[executor.submit(self._evaluate, input_data, *job)] = job
+                    submitted += free
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        self._complete(future, *running.pop(future))
+            finally:
+                # Evaluations, which have not been started, are dropped
+                for future in running:
+                    future.cancel()
+        return self.best
+
+    def _complete(self, future: Future, trial: int, rung: int):
+        """
+        Report the loss of a completed evaluation. The exception of
+        a failed evaluation is logged.
+        """
+        try:
+            result = future.result()
+        except Exception:  # pylint: disable=broad-except
+            logging.getLogger().exception(
+                "The evaluation of trial %d at budget %s failed",
+                trial,
+                self.budgets[rung],
+            )
+            loss = math.inf
+        else:
+            loss = self.loss_of(result)
+        self._report(trial, rung, loss)
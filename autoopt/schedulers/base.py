@@ -0,0 +1,145 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# Author: Torben Hansing
+#
+"""
+This module implements the base class of the multi-fidelity schedulers.
+
+The schedulers evaluate the configurations suggested by an optimizer with
+the budgets of a geometric series of rungs. The budget of each rung is eta
+times the budget of the previous one, from the minimum up to the maximum
+budget of the fidelity.
+"""
+import math
+from typing import Any, Callable, Dict, List, NamedTuple, Union
+
+from autoopt.optimizers import Optimizer
+from autoopt.pipelines import Pipeline, PrunedResult
+from autoopt.tasks import Fidelity
+
+
+class Evaluation(NamedTuple):
+    """
+    The evaluation of a configuration with a budget.
+    """
+
+    config: Dict[str, Dict[str, Any]]
+    """The configuration without the budget parameter"""
+    budget: Union[int, float]
+    """The budget, which has been used"""
+    loss: float
+    """The loss of the result of the pipeline"""
+
+
+def _rung_budgets(fidelity: Fidelity, eta: float) -> List[Union[int, float]]:
+    """
+    Calculate the budgets of the rungs, which increase by a factor of `eta`
+    from the minimum budget up to the maximum budget.
+    """
+    ratio = fidelity.max_budget / fidelity.min_budget
+    # The small offset protects against rounding errors of exact powers of eta
+    num_rungs = int(math.floor(math.log(ratio) / math.log(eta) + 1e-9)) + 1
+    return [
+        fidelity.budget(fidelity.max_budget * eta ** (rung - num_rungs + 1))
+        for rung in range(num_rungs)
+    ]
+
+
+class Scheduler:
+    """
+    The base class of the multi-fidelity schedulers.
+
+    It keeps the pipeline, the optimizer and the fidelity of the scheduler,
+    the budgets of its rungs and the history of its evaluations.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        pipeline: Pipeline,
+        optimizer: Optimizer,
+        fidelity: Fidelity,
+        loss: Callable[[Any], float],
+        eta: float = 3,
+    ):
+        """
+        Create a new scheduler.
+
+        :param pipeline: The pipeline to evaluate the configurations with.
+        :param optimizer: The optimizer, which suggests the configurations.
+                          Its space must not contain the budget parameter.
+        :param fidelity: The budget parameter of the pipeline.
+        :param loss: Calculates the loss of a result of the pipeline.
+                     Exceptions raised by it stop the run.
+        :param eta: The factor, by which the budget increases and the number
+                    of configurations decreases from one rung to the next.
+        """
+        if eta <= 1:
+            raise ValueError(f"eta has to be larger than 1, but got {eta}")
+        self.__pipeline = pipeline
+        self.__optimizer = optimizer
+        self.__fidelity = fidelity
+        self.__loss = loss
+        self.__eta = eta
+        self.__budgets = _rung_budgets(fidelity, eta)
+        self.__history = []
+
+    @property
+    def pipeline(self) -> Pipeline:
+        """
+        The pipeline, which evaluates the configurations.
+        """
+        return self.__pipeline
+
+    @property
+    def optimizer(self) -> Optimizer:
+        """
+        The optimizer, which suggests the configurations.
+        """
+        return self.__optimizer
+
+    @property
+    def fidelity(self) -> Fidelity:
+        """
+        The budget parameter of the pipeline.
+        """
+        return self.__fidelity
+
+    @property
+    def eta(self) -> float:
+        """
+        The factor between the budgets of consecutive rungs.
+        """
+        return self.__eta
+
+    @property
+    def budgets(self) -> List[Any]:
+        """
+        The budget of each rung.
+        """
+        return list(self.__budgets)
+
+    @property
+    def history(self) -> List[Evaluation]:
+        """
+        All evaluations in the order of their completion.
+        """
+        return list(self.__history)
+
+    def loss_of(self, result: Any) -> float:
+        """
+        Calculate the loss of a result of the pipeline. Pruned results and NaN
+        losses are mapped to an infinite loss.
+
+        :param result: The result of the pipeline.
+        :return: The loss of the result.
+        """
+        if isinstance(result, PrunedResult):
+            return math.inf
+        value = float(self.__loss(result))
+        return math.inf if math.isnan(value) else value
+
+    def _record(self, evaluations: List[Evaluation]):
+        """
+        Append completed evaluations to the history.
+        """
+        self.__history.extend(evaluations)
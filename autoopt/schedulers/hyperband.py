@@ -0,0 +1,144 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# Author: Torben Hansing
+#
+"""
+This module implements the Hyperband scheduler.
+
+Hyperband runs several brackets of successive halving. Each bracket starts
+with many configurations evaluated at a small budget, keeps the best
+1 / eta of them and evaluates these with an eta times larger budget, until
+the full budget is reached. The brackets differ in the number of
+configurations and the initial budget, which hedges against budgets too
+small to tell good and bad configurations apart:
+
+.. code:: python
+
+    fidelity = Fidelity("train", "epochs", min_budget=1, max_budget=81)
+    optimizer = TPEOptimizer(fidelity.strip(pipeline.parameter_space()))
+    scheduler = HyperbandScheduler(pipeline, optimizer, fidelity, loss)
+    best = scheduler.run(input_data)
+
+The budget is passed to the pipeline as a parameter of its node. Thus, the
+results of the nodes in front of this node do not depend on the budget and
+are reused from the cache of the pipeline, when a configuration is promoted.
+"""
+import logging
+import math
+from typing import Any, Dict, List, Tuple, Union
+
+import numpy as np
+
+from .base import Evaluation, Scheduler
+
+
+class HyperbandScheduler(Scheduler):
+    """
+    Schedules the evaluation of configurations suggested by an optimizer
+    using Hyperband.
+
+    The configurations of a rung are executed one after another. A failed
+    or pruned evaluation gets an infinite loss, without affecting the other
+    evaluations of the bracket. The optimizer is told the loss of each
+    configuration at the largest budget it has been evaluated with.
+    """
+
+    @property
+    def brackets(self) -> List[List[Tuple[int, Union[int, float]]]]:
+        """
+        The rungs of each bracket as the number of configurations and their
+        budget. The first bracket is the most exploratory one.
+        """
+        budgets = self.budgets
+        num_brackets = len(budgets)
+        brackets = []
+        for bracket in range(num_brackets):
+            rungs = budgets[bracket:]
+            size = int(
+                math.ceil(num_brackets / len(rungs) * self.eta ** (len(rungs) - 1))
+            )
+            brackets.append(
+                [
+                    (max(int(size * self.eta**-rung), 1), budget)
+                    for rung, budget in enumerate(rungs)
+                ]
+            )
+        return brackets
+
+    @property
+    def best(self) -> Evaluation:
+        """
+        The evaluation with the lowest loss at the full budget.
+        """
+        budget = self.budgets[-1]
+        full = [
+            evaluation for evaluation in self.history if evaluation.budget == budget
+        ]
+        if not full:
+            raise ValueError("No configuration has been evaluated with the full budget")
+        return min(full, key=lambda evaluation: evaluation.loss)
+
+    def _evaluate(
+        self, input_data: Any, configs: List[Dict[str, Dict[str, Any]]], budget
+    ) -> np.ndarray:
+        """
+        Evaluate a batch of configurations with the same budget.
+
+        The exceptions of failed evaluations are logged.
+        """
+        losses = np.empty(len(configs))
+        for index, config in enumerate(configs):
+            try:
+                result = self.pipeline.execute(
+                    input_data, **self.fidelity.inject(config, budget)
+                )
+            except Exception:  # pylint: disable=broad-except
+                logging.getLogger().exception(
+                    "The evaluation of configuration %d at budget %s failed",
+                    index,
+                    budget,
+                )
+                losses[index] = math.inf
+            else:
+                losses[index] = self.loss_of(result)
+        self._record(
+            [Evaluation(config, budget, loss) for config, loss in zip(configs, losses)]
+        )
+        return losses
+
+    def run_bracket(self, input_data: Any, bracket: int) -> List[Evaluation]:
+        """
+        Run one bracket of successive halving.
+
+        :param input_data: The input data of the pipeline.
+        :param bracket: The index of the bracket (see `brackets`).
+        :return: The evaluations of the bracket.
+        """
+        rungs = self.brackets[bracket]
+        start = len(self.history)
+        configs = self.optimizer.ask(rungs[0][0])
+        final_losses = np.full(len(configs), np.inf)
+        survivors = np.arange(len(configs))
+        for rung, (_, budget) in enumerate(rungs):
+            losses = self._evaluate(
+                input_data, [configs[index] for index in survivors], budget
+            )
+            final_losses[survivors] = losses
+            if rung + 1 < len(rungs):
+                order = np.argsort(losses, kind="stable")
+                survivors = survivors[order[: rungs[rung + 1][0]]]
+        self.optimizer.tell(configs, final_losses)
+        return self.history[start:]
+
+    def run(self, input_data: Any, num_iterations: int = 1) -> Evaluation:
+        """
+        Run all brackets of Hyperband.
+
+        :param input_data: The input data of the pipeline.
+        :param num_iterations: The number of times all brackets are run.
+        :return: The best evaluation with the full budget.
+        """
+        for _ in range(num_iterations):
+            for bracket in range(len(self.budgets)):
+                self.run_bracket(input_data, bracket)
+        return self.best
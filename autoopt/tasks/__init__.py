@@ -6,6 +6,7 @@
 This module implements the different types of optimization task available.
 
 Currently it implements only the base class, which can be used to implement
-additional optimization tasks in other packages.
+additional optimization tasks in other packages, and the fidelity of a task.
 """
 from .base_task import BaseTask  # NOQA
+from .fidelity import Fidelity  # NOQA
@@ -19,9 +19,10 @@ class BaseTask:
     It can be used as base in addons to implement other optimization tasks.
     """
 
-    def __init__(self, input_path, optimizer):
+    def __init__(self, input_path, optimizer, fidelity=None):
         self.__input_path = input_path
         self.__optimizer = optimizer
+        self.__fidelity = fidelity
 
     @property
     def input_path(self):
@@ -37,9 +38,23 @@ class BaseTask:
         """
         return self.__optimizer
 
+    @property
+    def fidelity(self):
+        """
+        The fidelity (budget) parameter of the pipelines, which can be used by
+        multi-fidelity schedulers, or None, if all configurations are
+        evaluated with the full budget.
+        """
+        return self.__fidelity
+
     def __getstate__(self):
-        return {"input_path": self.input_path, "optimizer": self.optimizer}
+        return {
+            "input_path": self.input_path,
+            "optimizer": self.optimizer,
+            "fidelity": self.fidelity,
+        }
 
     def __setstate__(self, state):
         self.__input_path = state["input_path"]
         self.__optimizer = state["optimizer"]
+        self.__fidelity = state.get("fidelity")
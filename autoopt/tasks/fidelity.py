@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# Author: Torben Hansing
+#
+"""
+This module implements the fidelity of an optimization task.
+
+The fidelity is a parameter of a pipeline node, which controls the cost of
+an execution, like the number of epochs or the fraction of the data used.
+Multi-fidelity schedulers evaluate many configurations with a small budget
+and only the most promising ones with the full budget.
+"""
+import copy
+from typing import Any, Dict, Union
+
+__all__ = ["Fidelity"]
+
+
+class Fidelity:
+    """
+    The budget parameter of a pipeline node.
+
+    The budget is not optimized, but set by the scheduler. Thus, it has to be
+    removed from the parameter space of the optimizer (see `strip`).
+
+    If both bounds are integers, the budgets are rounded to integers.
+    """
+
+    def __init__(
+        self,
+        node: str,
+        parameter: str,
+        min_budget: Union[int, float],
+        max_budget: Union[int, float],
+    ):
+        """
+        Create a new fidelity.
+
+        :param node: The name of the node, which has the budget parameter.
+        :param parameter: The name of the budget parameter.
+        :param min_budget: The smallest budget to evaluate configurations with.
+        :param max_budget: The full budget.
+        """
+        if not 0 < min_budget < max_budget:
+            raise ValueError(
+                "The budgets have to satisfy 0 < min_budget < max_budget, "
+                f"but got {min_budget} and {max_budget}"
+            )
+        self.__node = node
+        self.__parameter = parameter
+        self.__min_budget = min_budget
+        self.__max_budget = max_budget
+
+    @property
+    def node(self) -> str:
+        """
+        The name of the node, which has the budget parameter.
+        """
+        return self.__node
+
+    @property
+    def parameter(self) -> str:
+        """
+        The name of the budget parameter.
+        """
+        return self.__parameter
+
+    @property
+    def min_budget(self) -> Union[int, float]:
+        """
+        The smallest budget to evaluate configurations with.
+        """
+        return self.__min_budget
+
+    @property
+    def max_budget(self) -> Union[int, float]:
+        """
+        The full budget.
+        """
+        return self.__max_budget
+
+    @property
+    def integer(self) -> bool:
+        """
+        Whether the budgets are integers.
+        """
+        return isinstance(self.__min_budget, int) and isinstance(self.__max_budget, int)
+
+    def budget(self, value: float) -> Union[int, float]:
+        """
+        Convert a value into a valid budget.
+
+        :param value: The budget, which might be fractional.
+        :return: The budget clipped to the bounds and rounded for integers.
+        """
+        value = min(max(value, self.__min_budget), self.__max_budget)
+        return int(round(value)) if self.integer else float(value)
+
+    def strip(self, space: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Remove the budget parameter from a parameter space.
+
+        :param space: The parameter space as returned by
+                      `Pipeline.parameter_space()`.
+        :return: A copy of the space without the budget parameter.
+        """
+        space = {node: dict(parameters) for node, parameters in space.items()}
+        space.get(self.__node, {}).pop(self.__parameter, None)
+        return space
+
+    def inject(
+        self, config: Dict[str, Dict[str, Any]], budget: Union[int, float]
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Set the budget parameter of a configuration.
+
+        :param config: The configuration of the pipeline.
+        :param budget: The budget to evaluate the configuration with.
+        :return: A copy of the configuration with the budget.
+        """
+        config = copy.copy(config)
+        config[self.__node] = {**config.get(self.__node, {}), self.__parameter: budget}
+        return config
@@ -0,0 +1,9 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# Author: Torben Hansing
+#
+import os
+import sys
+
+# The test nodes of the pipelines are used by the tests of other packages, too
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "pipelines"))
@@ -9,6 +9,21 @@ class MyDistribution(Distribution):
     def pdf(self, x: object):
         return super(MyDistribution, self).pdf(x)
 
+    def cdf(self, x: object):
+        return super(MyDistribution, self).cdf(x)
+
+    def ppf(self, q: float):
+        return super(MyDistribution, self).ppf(q)
+
+    def to_unit(self, x: object):
+        return super(MyDistribution, self).to_unit(x)
+
+    def from_unit(self, u: float):
+        return super(MyDistribution, self).from_unit(u)
+
+    def sample(self, size=None, rng=None):
+        return super(MyDistribution, self).sample(size, rng)
+
     def _plot_min_value(self):
         return super()._plot_min_value()
 
@@ -36,6 +51,26 @@ def test_pdf():
     call_method("pdf", 1)
 
 
+def test_cdf():
+    call_method("cdf", 1)
+
+
+def test_ppf():
+    call_method("ppf", 0.5)
+
+
+def test_to_unit():
+    call_method("to_unit", 1)
+
+
+def test_from_unit():
+    call_method("from_unit", 0.5)
+
+
+def test_sample():
+    call_method("sample")
+
+
 def test_plot_min_value():
     call_method("_plot_min_value")
 
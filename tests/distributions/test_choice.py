@@ -1,5 +1,6 @@
 import random
 import unittest
+import numpy as np
 import pytest
 from autoopt.distributions import WeightedChoice, Choice
 from autoopt.distributions.base import _get_matplotlib
@@ -40,6 +41,73 @@ class WeightedChoiceTestCase(unittest.TestCase):
     def test_pdf_not_in(self):
         self.assertEqual(self.dist.pdf("__not_in_set__"), 0.0)
 
+    def test_pdf_array(self):
+        values = list(self.choices.keys()) + ["__not_in_set__"]
+        check = [self.dist.pdf(value) for value in values]
+        self.assertListEqual(check, list(self.dist.pdf(values)))
+        self.assertListEqual(check, list(self.dist.pdf(np.array(values))))
+
+    def test_logpdf(self):
+        values = list(self.choices.keys()) + ["__not_in_set__"]
+        with np.errstate(divide="ignore"):
+            check = np.log(self.dist.pdf(values))
+        np.testing.assert_array_equal(check, self.dist.logpdf(values))
+
+    def test_cdf(self):
+        weight_sum = sum(self.choices.values())
+        check = np.cumsum(list(self.choices.values())) / weight_sum
+        np.testing.assert_allclose(check, self.dist.cdf(list(self.choices)))
+        self.assertTrue(np.isnan(self.dist.cdf("__not_in_set__")))
+
+    def test_ppf(self):
+        cdf = self.dist.cdf(list(self.choices))
+        self.assertListEqual(list(self.choices), list(self.dist.ppf(cdf)))
+        self.assertEqual(list(self.choices)[0], self.dist.ppf(0.0))
+        self.assertEqual(list(self.choices)[-1], self.dist.ppf(1.0))
+
+    def test_sample(self):
+        samples = self.dist.sample(size=1000, rng=42)
+        self.assertEqual((1000,), samples.shape)
+        self.assertTrue(set(samples).issubset(self.choices))
+        self.assertIn(self.dist.sample(rng=42), self.choices)
+
+    def test_sample_frequencies(self):
+        weights = np.random.default_rng(42).random(1000)
+        dist = WeightedChoice(choices=dict(enumerate(weights)))
+        samples = dist.sample(size=1000000, rng=42).astype(int)
+        frequencies = np.bincount(samples, minlength=len(weights)) / len(samples)
+        np.testing.assert_allclose(weights / weights.sum(), frequencies, atol=5e-4)
+
+    def test_probabilities(self):
+        weight_sum = sum(self.choices.values())
+        check = [weight / weight_sum for weight in self.choices.values()]
+        np.testing.assert_array_equal(check, self.dist.probabilities)
+
+    def test_index(self):
+        values = list(self.choices.keys())
+        self.assertListEqual(list(range(len(values))), list(self.dist.index(values)))
+        self.assertEqual(len(values) - 1, self.dist.index(values[-1]))
+        self.assertEqual(-1, self.dist.index("__not_in_set__"))
+
+    def test_unit(self):
+        values = list(self.choices.keys())
+        units = self.dist.to_unit(values)
+        check = (np.arange(len(values)) + 0.5) / len(values)
+        np.testing.assert_allclose(check, units)
+        self.assertListEqual(values, list(self.dist.from_unit(units)))
+        self.assertEqual(values[0], self.dist.from_unit(0.0))
+        self.assertEqual(values[-1], self.dist.from_unit(1.0))
+        self.assertTrue(np.isnan(self.dist.to_unit("__not_in_set__")))
+
+    def test_sample_index(self):
+        indices = self.dist.sample_index(size=1000, rng=42)
+        values = np.array(list(self.choices), dtype=object)
+        np.testing.assert_array_equal(values[indices], self.dist.sample(1000, rng=42))
+
+    def test_sample_zero_weight(self):
+        dist = WeightedChoice(choices={"a": 0, "b": 1, "c": 0})
+        self.assertSetEqual({"b"}, set(dist.sample(size=1000, rng=42)))
+
     @pytest.mark.skipif(_get_matplotlib() is None, reason="No matplotlib installed")
     def test_plot(self):
         try:
@@ -65,3 +133,10 @@ class ChoiceTestCase(unittest.TestCase):
         dist = Choice(choices=choices)
         for name in choices:
             self.assertIn(name, dist.choices)
+
+    def test_sample_tuples(self):
+        choices = [(1, 2), (3, 4)]
+        dist = Choice(choices=choices)
+        samples = dist.sample(size=10, rng=42)
+        self.assertEqual((10,), samples.shape)
+        self.assertTrue(all(sample in choices for sample in samples))
@@ -6,7 +6,7 @@ import random
 
 import numpy as np
 
-from autoopt.distributions import LogNormal
+from autoopt.distributions import LogNormal, Normal
 
 
 def create_dist(loc=None, scale=None):
@@ -49,6 +49,56 @@ def test_pdf():
     assert np.allclose(y, np.vectorize(dist.pdf)(x))
 
 
+def test_pdf_array():
+    dist = create_dist(loc=0, scale=1.0)
+    x = np.linspace(-1, 4, num=1000)
+    check = np.array([dist.pdf(x_) for x_ in x])
+    assert np.allclose(check, dist.pdf(x))
+    assert np.isscalar(dist.pdf(x[0]))
+
+
+def test_logpdf():
+    dist = create_dist(loc=0, scale=1.0)
+    x = np.linspace(-1, 4, num=1000)
+    with np.errstate(divide="ignore"):
+        check = np.log(dist.pdf(x))
+    assert np.allclose(check, dist.logpdf(x))
+
+
+def test_logpdf_not_positive():
+    dist = create_dist()
+    assert np.all(np.isneginf(dist.logpdf(np.array([-1.0, 0.0]))))
+
+
+def test_cdf():
+    dist = create_dist(loc=0, scale=1.0)
+    x = np.linspace(0.1, 5, num=100)
+    assert np.allclose(Normal(loc=0, scale=1.0).cdf(np.log(x)), dist.cdf(x))
+    assert np.array_equal([0.0, 0.0], dist.cdf([-1.0, 0.0]))
+
+
+def test_ppf():
+    dist = create_dist(loc=0, scale=1.0)
+    q = np.linspace(0.01, 0.99, num=99)
+    assert np.allclose(q, dist.cdf(dist.ppf(q)))
+
+
+def test_unit():
+    dist = create_dist(loc=0, scale=1.0)
+    u = np.linspace(0.01, 0.99, num=99)
+    x = dist.from_unit(u)
+    assert np.allclose(u, dist.to_unit(x))
+    assert np.allclose(dist.cdf(x), dist.to_unit(x))
+
+
+def test_sample():
+    dist = create_dist(loc=1, scale=0.5)
+    samples = dist.sample(size=10000, rng=42)
+    assert samples.shape == (10000,)
+    assert np.all(samples > 0)
+    assert abs(np.mean(np.log(samples)) - 1) < 0.05
+
+
 def test_plot():
     loc = 0
     scale = 1.0
@@ -32,6 +32,45 @@ class LogUniformTestCase(unittest.TestCase):
             )
             self.assertEqual(check, y)
 
+    def test_pdf_array(self):
+        dist = LogUniform(min_value=1, max_value=3)
+        x_space = np.linspace(-1, 4, num=1000)
+        check = np.array([dist.pdf(x) for x in x_space])
+        np.testing.assert_array_equal(check, dist.pdf(x_space))
+
+    def test_logpdf(self):
+        dist = LogUniform(min_value=1, max_value=3)
+        x_space = np.linspace(-1, 4, num=1000)
+        with np.errstate(divide="ignore"):
+            check = np.log(dist.pdf(x_space))
+        np.testing.assert_allclose(check, dist.logpdf(x_space))
+
+    def test_cdf(self):
+        dist = LogUniform(min_value=1, max_value=100)
+        np.testing.assert_allclose(
+            [0.0, 0.0, 0.5, 1.0, 1.0], dist.cdf([-1.0, 1.0, 10.0, 100.0, 1000.0])
+        )
+
+    def test_ppf(self):
+        dist = LogUniform(min_value=1, max_value=100)
+        q = np.linspace(0, 1, num=101)
+        np.testing.assert_allclose(q, dist.cdf(dist.ppf(q)))
+        self.assertTrue(np.all(np.isnan(dist.ppf([-0.1, 1.1]))))
+
+    def test_unit(self):
+        dist = LogUniform(min_value=1, max_value=100)
+        np.testing.assert_allclose([0.0, 0.5, 1.0], dist.to_unit([1.0, 10.0, 100.0]))
+        u = np.linspace(0, 1, num=101)
+        np.testing.assert_allclose(u, dist.to_unit(dist.from_unit(u)))
+
+    def test_sample(self):
+        dist = LogUniform(min_value=1, max_value=1000)
+        samples = dist.sample(size=10000, rng=42)
+        self.assertEqual((10000,), samples.shape)
+        self.assertTrue(np.all((samples >= 1) & (samples <= 1000)))
+        # the logarithm of the samples is uniformly distributed
+        self.assertAlmostEqual(np.log(1000) / 2, np.mean(np.log(samples)), delta=0.1)
+
     def test_mean(self):
         max_value = random.randint(2, 10)
         min_value = random.randint(1, max_value - 1)
@@ -84,6 +123,60 @@ class QLogUniformTestCase(unittest.TestCase):
             )
             self.assertEqual(check, y)
 
+    def test_pdf_array(self):
+        dist = QLogUniform(min_value=1, max_value=3, q=0.5)
+        x_space = np.linspace(-1, 4, num=1000)
+        check = np.array([dist.pdf(x) for x in x_space])
+        np.testing.assert_array_equal(check, dist.pdf(x_space))
+
+    def test_logpdf(self):
+        dist = QLogUniform(min_value=1, max_value=3, q=0.5)
+        x_space = np.linspace(-1, 4, num=1000)
+        with np.errstate(divide="ignore"):
+            check = np.log(dist.pdf(x_space))
+        np.testing.assert_allclose(check, dist.logpdf(x_space))
+
+    def test_cdf(self):
+        dist = QLogUniform(min_value=1, max_value=100, q=1)
+        samples = dist.sample(size=100000, rng=42)
+        for x in (1, 5, 10, 50):
+            self.assertAlmostEqual(np.mean(samples <= x), dist.cdf(x), delta=0.01)
+
+    def test_ppf(self):
+        dist = QLogUniform(min_value=1, max_value=100, q=1)
+        q = np.linspace(0, 1, num=101)
+        x = dist.ppf(q)
+        np.testing.assert_array_equal(x, dist.round_to_q(x))
+        self.assertTrue(np.all(dist.cdf(x) >= q))
+
+    def test_unit(self):
+        dist = QLogUniform(min_value=1, max_value=100, q=1)
+        x = dist.from_unit(np.linspace(0, 1, num=101))
+        np.testing.assert_array_equal(x, dist.round_to_q(x))
+        np.testing.assert_array_equal(x, dist.from_unit(dist.to_unit(x)))
+
+    def test_sample(self):
+        dist = QLogUniform(min_value=1, max_value=3, q=0.5)
+        samples = dist.sample(size=1000, rng=42)
+        np.testing.assert_array_equal(samples, dist.round_to_q(samples))
+        self.assertTrue(np.all(dist.pdf(samples) > 0))
+
+    def test_bounds(self):
+        # Rounding values below 2.5 to a multiple of 5 would result in 0
+        dist = QLogUniform(min_value=1, max_value=100, q=5)
+        self.assertEqual((5, 100), dist.q_bounds)
+        values = np.concatenate(
+            [
+                dist.sample(size=1000, rng=0),
+                dist.ppf(np.linspace(0, 1, num=101)),
+                dist.from_unit(np.linspace(0, 1, num=101)),
+            ]
+        )
+        self.assertTrue(np.all(dist.pdf(values) > 0))
+        self.assertEqual(0, dist.cdf(4))
+        samples = dist.sample(size=100000, rng=42)
+        self.assertAlmostEqual(np.mean(samples <= 5), dist.cdf(5), delta=0.01)
+
     def test_mean(self):
         max_value = random.randint(2, 10)
         min_value = random.randint(1, max_value - 1)
@@ -2,8 +2,10 @@
 # -*- coding: UTF-8 -*-
 # Author: Torben Hansing
 #
+import math
 import numpy as np
 import random
+from statistics import NormalDist
 
 from autoopt.distributions.normal import Normal
 
@@ -39,6 +41,76 @@ def test_pdf():
     assert np.allclose(y, np.vectorize(dist.pdf)(x))
 
 
+def test_pdf_array():
+    dist = create_dist(loc=0, scale=1.0)
+    x = np.linspace(-3, 3, num=1000)
+    check = np.array([dist.pdf(x_) for x_ in x])
+    assert np.allclose(check, dist.pdf(x))
+    assert np.isscalar(dist.pdf(x[0]))
+
+
+def test_logpdf():
+    dist = create_dist(loc=0, scale=1.0)
+    x = np.linspace(-3, 3, num=1000)
+    with np.errstate(divide="ignore"):
+        check = np.log(dist.pdf(x))
+    assert np.allclose(check, dist.logpdf(x))
+
+
+def test_logpdf_no_underflow():
+    dist = create_dist(loc=0, scale=1.0)
+    assert dist.pdf(100) == 0.0
+    assert np.isclose(dist.logpdf(100), -5000 - 0.5 * np.log(2 * np.pi))
+
+
+def test_cdf():
+    dist = create_dist(loc=1, scale=2)
+    x = np.linspace(-15, 15, num=1001)
+    check = np.array([0.5 * math.erfc(-(x_ - 1) / (2 * math.sqrt(2))) for x_ in x])
+    assert np.allclose(check, dist.cdf(x), rtol=1e-12, atol=0)
+
+
+def test_cdf_scalar():
+    dist = create_dist(loc=1, scale=2)
+    value = dist.cdf(2.0)
+    assert np.ndim(value) == 0
+    assert np.isclose(value, 0.5 * math.erfc(-1 / (2 * math.sqrt(2))), rtol=1e-12)
+    assert dist.cdf(np.array([[1.0, np.inf]])).shape == (1, 2)
+
+
+def test_ppf():
+    dist = create_dist(loc=1, scale=2)
+    normal = NormalDist(mu=1, sigma=2)
+    q = np.concatenate(
+        [
+            np.logspace(-300, -1, num=100),
+            np.linspace(0.1, 0.9, num=81),
+            1 - np.logspace(-15, -1, num=50),
+        ]
+    )
+    check = np.array([normal.inv_cdf(q_) for q_ in q])
+    assert np.allclose(check, dist.ppf(q), rtol=1e-12, atol=1e-12)
+    assert np.array_equal([-np.inf, np.inf], dist.ppf([0, 1]))
+    assert np.all(np.isnan(dist.ppf([-0.1, 1.1])))
+
+
+def test_unit():
+    dist = create_dist(loc=1, scale=2)
+    u = np.linspace(0.01, 0.99, num=99)
+    x = dist.from_unit(u)
+    assert np.allclose(u, dist.to_unit(x))
+    assert np.allclose(dist.cdf(x), dist.to_unit(x))
+
+
+def test_sample():
+    dist = create_dist(loc=2, scale=0.5)
+    samples = dist.sample(size=10000, rng=42)
+    assert samples.shape == (10000,)
+    assert abs(np.mean(samples) - 2) < 0.05
+    assert abs(np.std(samples) - 0.5) < 0.05
+    assert np.array_equal(samples, dist.sample(size=10000, rng=42))
+
+
 def test_plot():
     loc = 0
     scale = 1.0
@@ -51,7 +51,63 @@ def test_pdf():
     assert np.allclose(y, np.vectorize(dist.pdf)(x))
 
 
-def test_plot():
+def test_pdf_array():
+    dist = create_dist(loc=0, scale=1.0, q=0.5)
+    x = np.linspace(-1, 4, num=1000)
+    check = np.array([dist.pdf(x_) for x_ in x])
+    assert np.allclose(check, dist.pdf(x))
+    assert np.isscalar(dist.pdf(x[0]))
+
+
+def test_logpdf():
+    dist = create_dist(loc=0, scale=1.0, q=0.5)
+    x = np.linspace(-1, 4, num=1000)
+    with np.errstate(divide="ignore"):
+        check = np.log(dist.pdf(x))
+    assert np.allclose(check, dist.logpdf(x))
+
+
+def test_cdf():
+    dist = create_dist(loc=0, scale=1.0, q=0.5)
+    samples = dist.sample(size=100000, rng=42)
+    for x in (0, 0.5, 1, 2.2):
+        assert abs(np.mean(samples <= x) - dist.cdf(x)) < 0.01
+
+
+def test_ppf():
+    dist = create_dist(loc=0, scale=1.0, q=0.5)
+    q = np.linspace(0.01, 0.99, num=99)
+    x = dist.ppf(q)
+    assert np.array_equal(x, dist.round_to_q(x))
+    assert np.all(dist.cdf(x) >= q)
+
+
+def test_unit():
+    dist = create_dist(loc=0, scale=1.0, q=0.5)
+    u = np.linspace(0.01, 0.99, num=99)
+    x = dist.from_unit(u)
+    assert np.array_equal(x, dist.round_to_q(x))
+    assert np.array_equal(x, dist.from_unit(dist.to_unit(x)))
+
+
+def test_sample():
+    dist = create_dist(loc=2, scale=0.5, q=0.5)
+    samples = dist.sample(size=1000, rng=42)
+    assert samples.shape == (1000,)
+    assert np.array_equal(samples, dist.round_to_q(samples))
+
+
+def test_bounds():
+    # Most values of the underlying distribution would be rounded to 0
+    dist = create_dist(loc=-2, scale=1.0, q=1)
+    assert dist.q_bounds == (1, np.inf)
+    values = np.concatenate(
+        [dist.sample(size=1000, rng=42), dist.from_unit(np.linspace(0, 0.99, num=100))]
+    )
+    assert np.all(values >= 1)
+    assert np.all(dist.pdf(values) > 0)
+    assert dist.cdf(0.5) == 0
+
     loc = 0
     scale = 1.0
     dist = create_dist(loc=loc, scale=scale)
@@ -44,6 +44,52 @@ def test_pdf():
     assert all(y == np.vectorize(dist.pdf)(x))
 
 
+def test_pdf_array():
+    dist = create_dist(loc=0, scale=1.0, q=0.5)
+    x = np.linspace(-3, 3, num=1000)
+    check = np.array([dist.pdf(x_) for x_ in x])
+    assert np.allclose(check, dist.pdf(x))
+    assert np.isscalar(dist.pdf(x[0]))
+
+
+def test_logpdf():
+    dist = create_dist(loc=0, scale=1.0, q=0.5)
+    x = np.linspace(-3, 3, num=1000)
+    with np.errstate(divide="ignore"):
+        check = np.log(dist.pdf(x))
+    assert np.allclose(check, dist.logpdf(x))
+
+
+def test_cdf():
+    dist = create_dist(loc=0, scale=1.0, q=0.5)
+    samples = dist.sample(size=100000, rng=42)
+    for x in (-1, -0.5, 0, 0.5, 1.2):
+        assert abs(np.mean(samples <= x) - dist.cdf(x)) < 0.01
+
+
+def test_ppf():
+    dist = create_dist(loc=0, scale=1.0, q=0.5)
+    q = np.linspace(0.01, 0.99, num=99)
+    x = dist.ppf(q)
+    assert np.array_equal(x, dist.round_to_q(x))
+    assert np.all(dist.cdf(x) >= q)
+
+
+def test_unit():
+    dist = create_dist(loc=0, scale=1.0, q=0.5)
+    u = np.linspace(0.01, 0.99, num=99)
+    x = dist.from_unit(u)
+    assert np.array_equal(x, dist.round_to_q(x))
+    assert np.array_equal(x, dist.from_unit(dist.to_unit(x)))
+
+
+def test_sample():
+    dist = create_dist(loc=2, scale=3, q=0.5)
+    samples = dist.sample(size=1000, rng=42)
+    assert samples.shape == (1000,)
+    assert np.array_equal(samples, dist.round_to_q(samples))
+
+
 def test_plot():
     loc = 0
     scale = 1.0
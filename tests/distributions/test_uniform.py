@@ -26,6 +26,45 @@ class UniformTestCase(unittest.TestCase):
             check = 1 / (max_value - min_value) if min_value <= x <= max_value else 0
             self.assertEqual(check, y)
 
+    def test_pdf_array(self):
+        dist = Uniform(min_value=1, max_value=3)
+        x_space = np.linspace(0, 4, num=1000)
+        check = np.array([dist.pdf(x) for x in x_space])
+        np.testing.assert_array_equal(check, dist.pdf(x_space))
+
+    def test_logpdf(self):
+        dist = Uniform(min_value=1, max_value=3)
+        x_space = np.linspace(0, 4, num=1000)
+        with np.errstate(divide="ignore"):
+            check = np.log(dist.pdf(x_space))
+        np.testing.assert_allclose(check, dist.logpdf(x_space))
+
+    def test_cdf(self):
+        dist = Uniform(min_value=1, max_value=3)
+        np.testing.assert_allclose(
+            [0.0, 0.0, 0.25, 1.0, 1.0], dist.cdf([0.0, 1.0, 1.5, 3.0, 4.0])
+        )
+
+    def test_ppf(self):
+        dist = Uniform(min_value=1, max_value=3)
+        q = np.linspace(0, 1, num=101)
+        np.testing.assert_allclose(q, dist.cdf(dist.ppf(q)))
+        self.assertTrue(np.all(np.isnan(dist.ppf([-0.1, 1.1]))))
+
+    def test_unit(self):
+        dist = Uniform(min_value=1, max_value=3)
+        np.testing.assert_allclose([0.0, 0.25, 1.0], dist.to_unit([1.0, 1.5, 3.0]))
+        u = np.linspace(0, 1, num=101)
+        np.testing.assert_allclose(u, dist.to_unit(dist.from_unit(u)))
+
+    def test_sample(self):
+        dist = Uniform(min_value=1, max_value=3)
+        samples = dist.sample(size=1000, rng=42)
+        self.assertEqual((1000,), samples.shape)
+        self.assertTrue(np.all((samples >= 1) & (samples <= 3)))
+        np.testing.assert_array_equal(samples, dist.sample(size=1000, rng=42))
+        self.assertTrue(np.isscalar(dist.sample(rng=42)))
+
     def test_mean(self):
         max_value = random.randint(1, 10)
         min_value = random.randint(0, max_value - 1)
@@ -65,6 +104,60 @@ class QUniformTestCase(unittest.TestCase):
             )
             self.assertEqual(check, y)
 
+    def test_pdf_array(self):
+        dist = QUniform(min_value=1, max_value=3, q=0.5)
+        x_space = np.linspace(0, 4, num=1000)
+        check = np.array([dist.pdf(x) for x in x_space])
+        np.testing.assert_array_equal(check, dist.pdf(x_space))
+
+    def test_logpdf(self):
+        dist = QUniform(min_value=1, max_value=3, q=0.5)
+        x_space = np.linspace(0, 4, num=1000)
+        with np.errstate(divide="ignore"):
+            check = np.log(dist.pdf(x_space))
+        np.testing.assert_allclose(check, dist.logpdf(x_space))
+
+    def test_cdf(self):
+        dist = QUniform(min_value=0, max_value=3, q=1)
+        # 0 is sampled for [0, 0.5), 1 for [0.5, 1.5), ...
+        np.testing.assert_allclose(
+            [0.0, 1 / 6, 1 / 6, 0.5, 0.5, 1.0], dist.cdf([-1, 0, 0.9, 1, 1.9, 3])
+        )
+
+    def test_ppf(self):
+        dist = QUniform(min_value=0, max_value=3, q=1)
+        np.testing.assert_array_equal(
+            [0, 0, 1, 1, 2, 3], dist.ppf([0, 0.1, 0.2, 0.4, 0.6, 1])
+        )
+
+    def test_unit(self):
+        dist = QUniform(min_value=0, max_value=4, q=1)
+        np.testing.assert_allclose([0.0, 0.25, 0.25], dist.to_unit([0.0, 1.0, 1.2]))
+        np.testing.assert_array_equal(
+            [0.0, 1.0, 1.0, 4.0], dist.from_unit([0.0, 0.2, 0.3, 1.0])
+        )
+
+    def test_sample(self):
+        dist = QUniform(min_value=1, max_value=3, q=0.5)
+        samples = dist.sample(size=1000, rng=42)
+        self.assertEqual((1000,), samples.shape)
+        np.testing.assert_array_equal(samples, dist.round_to_q(samples))
+        self.assertTrue(np.all(dist.pdf(samples) > 0))
+
+    def test_bounds(self):
+        # The bounds are no multiples of q
+        dist = QUniform(min_value=0.3, max_value=2.2, q=1)
+        self.assertEqual((1, 2), dist.q_bounds)
+        values = np.concatenate(
+            [
+                dist.sample(size=1000, rng=42),
+                dist.ppf(np.linspace(0, 1, num=11)),
+                dist.from_unit(np.linspace(0, 1, num=11)),
+            ]
+        )
+        self.assertTrue(np.all(dist.pdf(values) > 0))
+        np.testing.assert_allclose([0, 0, 1.2 / 1.9, 1], dist.cdf([0, 0.9, 1, 2]))
+
     def test_mean(self):
         max_value = random.randint(1, 10)
         min_value = random.randint(0, max_value - 1)
@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# Author: Torben Hansing
+#
+import numpy as np
+import pytest
+
+from autoopt.distributions import Normal, QNormal, QUniform, Uniform
+from autoopt.optimizers import CMAOptimizer
+
+
+def create_space():
+    return {
+        "first": {
+            "uniform": Uniform(min_value=-5, max_value=5),
+            "q_uniform": QUniform(min_value=1, max_value=50, q=1),
+        },
+        "second": {
+            "normal": Normal(loc=0, scale=2),
+            "q_normal": QNormal(loc=0, scale=10, q=2),
+        },
+    }
+
+
+def loss(config):
+    first, second = config["first"], config["second"]
+    return (
+        (first["uniform"] - 1) ** 2
+        + abs(first["q_uniform"] - 20) / 10
+        + second["normal"] ** 2
+        + abs(second["q_normal"] - 6) / 10
+    )
+
+
+def optimize(optimizer, generations):
+    for _ in range(generations):
+        configs = optimizer.ask(optimizer.population_size)
+        optimizer.tell(configs, [loss(config) for config in configs])
+    return optimizer.best[1]
+
+
+def test_population_size():
+    optimizer = CMAOptimizer(create_space(), seed=0)
+    assert optimizer.population_size == 4 + int(3 * np.log(4))
+    configs = optimizer.ask(optimizer.population_size - 1)
+    optimizer.tell(configs, [loss(config) for config in configs])
+    assert optimizer.generation == 0
+    configs = optimizer.ask(3)
+    optimizer.tell(configs, [loss(config) for config in configs])
+    assert optimizer.generation == 1
+
+
+def test_suggestions_in_space():
+    optimizer = CMAOptimizer(create_space(), sigma=2, seed=1)
+    configs = optimizer.ask(100)
+    for config in configs:
+        assert -5 <= config["first"]["uniform"] <= 5
+        assert 1 <= config["first"]["q_uniform"] <= 50
+        assert config["first"]["q_uniform"] % 1 == 0
+        assert np.isfinite(config["second"]["normal"])
+        assert config["second"]["q_normal"] % 2 == 0
+
+
+def test_pending():
+    optimizer = CMAOptimizer(create_space(), seed=2)
+    configs = optimizer.ask(5)
+    assert optimizer.num_pending == 5
+    optimizer.tell(configs[::-1], [loss(config) for config in configs[::-1]])
+    assert optimizer.num_pending == 0
+    # Configurations, which have not been suggested, can be told as well
+    optimizer.tell([configs[0]], [1.0])
+    assert optimizer.num_pending == 0
+
+
+def test_converges():
+    optimizer = CMAOptimizer(create_space(), seed=3)
+    assert optimize(optimizer, 60) < 0.3
+    config, _ = optimizer.best
+    assert abs(config["first"]["uniform"] - 1) < 0.5
+    assert abs(config["second"]["normal"]) < 0.5
+    covariance = optimizer.covariance
+    assert np.allclose(covariance, covariance.T)
+    assert np.all(np.linalg.eigvalsh(covariance) > 0)
+
+
+def test_better_than_random():
+    cma = [optimize(CMAOptimizer(create_space(), seed=seed), 20) for seed in range(3)]
+    random = []
+    for seed in range(3):
+        optimizer = CMAOptimizer(create_space(), seed=seed)
+        configs = optimizer.space.decode(optimizer.space.sample(160, optimizer.rng))
+        optimizer.tell(configs, [loss(config) for config in configs])
+        random.append(optimizer.best[1])
+    assert np.median(cma) < np.median(random)
+
+
+def test_invalid_parameters():
+    with pytest.raises(ValueError):
+        CMAOptimizer(create_space(), population_size=1)
+    with pytest.raises(ValueError):
+        CMAOptimizer(create_space(), sigma=0)
+    with pytest.raises(ValueError):
+        CMAOptimizer({"node": {}})
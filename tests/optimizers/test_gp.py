@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# Author: Torben Hansing
+#
+import time
+
+import numpy as np
+import pytest
+
+from autoopt.distributions import LogUniform, Normal, QUniform, Uniform
+from autoopt.optimizers import GPOptimizer
+from autoopt.optimizers.gp import _matern52
+
+
+def create_space():
+    return {
+        "first": {
+            "uniform": Uniform(min_value=-5, max_value=5),
+            "log_uniform": LogUniform(min_value=1e-5, max_value=1),
+        },
+        "second": {
+            "normal": Normal(loc=0, scale=2),
+            "q_uniform": QUniform(min_value=1, max_value=50, q=1),
+        },
+    }
+
+
+def loss(config):
+    first, second = config["first"], config["second"]
+    return (
+        (first["uniform"] - 1) ** 2
+        + (np.log10(first["log_uniform"]) + 3) ** 2
+        + second["normal"] ** 2
+        + abs(second["q_uniform"] - 20) / 10
+    )
+
+
+def optimize(optimizer, iterations):
+    for _ in range(iterations):
+        configs = optimizer.ask()
+        optimizer.tell(configs, [loss(config) for config in configs])
+    return optimizer.best[1]
+
+
+def test_incremental_cholesky():
+    optimizer = GPOptimizer(create_space(), noise=1e-4, seed=0)
+    for size in (1, 7, 1, 30):
+        configs = optimizer.ask(size)
+        optimizer.tell(configs, [loss(config) for config in configs])
+    units = optimizer.space.to_unit(optimizer.samples)
+    kernel = _matern52(units, units, 0.25) + 1e-4 * np.eye(len(units))
+    inverse = optimizer.cholesky_inverse
+    assert np.allclose(np.tril(inverse), inverse)
+    assert np.allclose(inverse, np.linalg.inv(np.linalg.cholesky(kernel)))
+
+
+def test_duplicate_observations():
+    optimizer = GPOptimizer(create_space(), num_initial=1, seed=0)
+    configs = optimizer.ask()
+    optimizer.tell(configs * 3, [1.0, 1.0, 1.0])
+    assert np.all(np.isfinite(optimizer.cholesky_inverse))
+    assert len(optimizer.ask()) == 1
+
+
+def test_predict_interpolates():
+    optimizer = GPOptimizer(create_space(), seed=1)
+    optimize(optimizer, 20)
+    units = optimizer.space.to_unit(optimizer.samples)
+    mean, deviation = optimizer.predict(units)
+    targets = (optimizer.losses - optimizer.losses.mean()) / optimizer.losses.std()
+    assert np.allclose(mean, targets, atol=1e-2)
+    assert np.all(deviation < 1e-2)
+
+
+def test_better_than_random():
+    gp = [optimize(GPOptimizer(create_space(), seed=seed), 60) for seed in range(3)]
+    random = [
+        optimize(GPOptimizer(create_space(), num_initial=1000, seed=seed), 60)
+        for seed in range(3)
+    ]
+    assert np.median(gp) < np.median(random)
+
+
+def test_failed_observations():
+    optimizer = GPOptimizer(create_space(), num_initial=3, seed=2)
+    configs = optimizer.ask(5)
+    optimizer.tell(configs, [np.nan, np.inf, 1.0, 2.0, 3.0])
+    configs = optimizer.ask(4)
+    assert len(configs) == 4
+    for config in configs:
+        assert -5 <= config["first"]["uniform"] <= 5
+        assert np.isfinite(config["second"]["normal"])
+        assert config["second"]["q_uniform"] % 1 == 0
+
+
+def test_values_outside_of_space():
+    optimizer = GPOptimizer(create_space(), seed=0)
+    configs = optimizer.ask(2)
+    configs[1]["first"]["log_uniform"] = -1.0
+    with pytest.raises(ValueError, match="first.log_uniform"):
+        optimizer.tell(configs, [1.0, 2.0])
+    # Rejected observations are not stored
+    assert len(optimizer.losses) == 0
+    assert optimizer.cholesky_inverse.shape == (0, 0)
+    optimizer.tell(configs[:1], [1.0])
+    assert len(optimizer.losses) == 1
+
+
+def test_speed():
+    optimizer = GPOptimizer(create_space(), num_candidates=500, seed=0)
+    start = time.perf_counter()
+    for _ in range(20):
+        configs = optimizer.space.decode(optimizer.space.sample(100, optimizer.rng))
+        optimizer.tell(configs, [loss(config) for config in configs])
+    assert time.perf_counter() - start < 10
+    start = time.perf_counter()
+    optimizer.ask()
+    assert time.perf_counter() - start < 1
+
+
+def test_invalid_parameters():
+    with pytest.raises(ValueError):
+        GPOptimizer(create_space(), lengthscale=0)
+    with pytest.raises(ValueError):
+        GPOptimizer(create_space(), noise=-1)
@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# Author: Torben Hansing
+#
+import numpy as np
+import pytest
+
+from autoopt.distributions import Choice, Uniform
+from autoopt.optimizers import Optimizer
+from autoopt.pipelines import CompiledSpace
+
+
+class RandomOptimizer(Optimizer):
+    def __init__(self, space, seed=None):
+        super().__init__(space, seed)
+        self.observed = []
+
+    def ask(self, size=1):
+        return self.space.decode(self.space.sample(size, rng=self.rng))
+
+    def _observe(self, samples, losses):
+        self.observed.append(len(losses))
+
+
+def create_space():
+    return {
+        "node": {
+            "x": Uniform(min_value=0, max_value=1),
+            "choice": Choice(choices=["a", "b"]),
+            "constant": 1,
+        }
+    }
+
+
+def test_space():
+    assert len(RandomOptimizer(create_space()).space) == 2
+    space = CompiledSpace(create_space())
+    assert RandomOptimizer(space).space is space
+
+
+def test_tell():
+    optimizer = RandomOptimizer(create_space(), seed=42)
+    with pytest.raises(ValueError):
+        optimizer.best
+    configs = []
+    for losses in ([3.0], [1.0, np.nan], list(range(40))):
+        batch = optimizer.ask(len(losses))
+        optimizer.tell(batch, losses)
+        configs.extend(batch)
+    assert optimizer.observed == [1, 2, 40]
+    assert optimizer.samples.shape == (43, 2)
+    assert np.array_equal(optimizer.samples, optimizer.space.encode(configs))
+    assert optimizer.losses[2] == np.inf
+    assert optimizer.best == (configs[3], 0.0)
+
+
+def test_tell_mismatch():
+    optimizer = RandomOptimizer(create_space())
+    with pytest.raises(ValueError):
+        optimizer.tell(optimizer.ask(2), [1.0])
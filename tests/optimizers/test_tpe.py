@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# Author: Torben Hansing
+#
+import time
+
+import numpy as np
+import pytest
+
+from autoopt.distributions import (
+    Choice,
+    LogUniform,
+    Normal,
+    QLogNormal,
+    QLogUniform,
+    QUniform,
+    Uniform,
+)
+from autoopt.optimizers import TPEOptimizer
+
+
+def create_space():
+    return {
+        "first": {
+            "uniform": Uniform(min_value=-5, max_value=5),
+            "log_uniform": LogUniform(min_value=1e-5, max_value=1),
+            "q_uniform": QUniform(min_value=1, max_value=50, q=1),
+        },
+        "second": {
+            "choice": Choice(choices=["a", "b", "c"]),
+            "normal": Normal(loc=0, scale=2),
+            "q_log_normal": QLogNormal(loc=1, scale=1, q=1),
+        },
+    }
+
+
+def loss(config):
+    first, second = config["first"], config["second"]
+    return (
+        (first["uniform"] - 1) ** 2
+        + (np.log10(first["log_uniform"]) + 3) ** 2
+        + abs(first["q_uniform"] - 20) / 10
+        + (second["choice"] != "b")
+        + second["normal"] ** 2
+    )
+
+
+def optimize(optimizer, iterations):
+    for _ in range(iterations):
+        configs = optimizer.ask()
+        optimizer.tell(configs, [loss(config) for config in configs])
+    return optimizer.best[1]
+
+
+def test_initial_random():
+    optimizer = TPEOptimizer(create_space(), num_initial=5, seed=42)
+    configs = optimizer.ask(5)
+    assert len(configs) == 5
+    assert all(config["first"]["q_uniform"] % 1 == 0 for config in configs)
+
+
+def test_better_than_random():
+    tpe = [optimize(TPEOptimizer(create_space(), seed=seed), 100) for seed in range(3)]
+    random = [
+        optimize(TPEOptimizer(create_space(), num_initial=1000, seed=seed), 100)
+        for seed in range(3)
+    ]
+    assert np.median(tpe) < np.median(random)
+
+
+def test_suggestions_in_space():
+    optimizer = TPEOptimizer(create_space(), num_initial=5, seed=1)
+    optimize(optimizer, 20)
+    configs = optimizer.ask(50)
+    assert len(configs) == 50
+    samples = optimizer.space.encode(configs)
+    assert len(np.unique(samples, axis=0)) == 50
+    for config in configs:
+        assert -5 <= config["first"]["uniform"] <= 5
+        assert 1e-5 <= config["first"]["log_uniform"] <= 1
+        assert config["first"]["q_uniform"] % 1 == 0
+        assert config["second"]["choice"] in "abc"
+        assert config["second"]["q_log_normal"] % 1 == 0
+
+
+def test_quantized_bounds():
+    # Rounding the smallest values to a multiple of q would result in 0
+    space = {
+        "node": {
+            "uniform": QLogUniform(min_value=1, max_value=100, q=5),
+            "normal": QLogNormal(loc=-2, scale=1, q=1),
+        }
+    }
+    optimizer = TPEOptimizer(space, num_initial=5, seed=0)
+    for _ in range(20):
+        configs = optimizer.ask()
+        optimizer.tell(configs, [config["node"]["uniform"] for config in configs])
+    samples = optimizer.space.encode(optimizer.ask(100))
+    assert np.all(np.isfinite(optimizer.space.logpdf(samples)))
+
+
+def test_score():
+    optimizer = TPEOptimizer(create_space(), seed=3)
+    with pytest.raises(ValueError):
+        optimizer.score(optimizer.space.sample(1))
+    optimize(optimizer, 40)
+    good = optimizer.samples[np.argsort(optimizer.losses)[:3]]
+    bad = optimizer.samples[np.argsort(optimizer.losses)[-3:]]
+    assert optimizer.score(good).mean() > optimizer.score(bad).mean()
+
+
+def test_speed():
+    optimizer = TPEOptimizer(create_space(), num_candidates=1000, seed=0)
+    configs = optimizer.ask(200)
+    optimizer.tell(configs, [loss(config) for config in configs])
+    start = time.perf_counter()
+    optimizer.ask()
+    assert time.perf_counter() - start < 0.5
+
+
+def test_invalid_gamma():
+    with pytest.raises(ValueError):
+        TPEOptimizer(create_space(), gamma=1)
@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# Author: Torben Hansing
+#
+import asyncio
+import functools
+import threading
+
+import pytest
+
+from autoopt.pipelines import MemoryCache
+from autoopt.pipelines.node import execute_node
+from utils import AsyncFunctionNode, FunctionNode, create_pipeline
+
+
+class Sleep:
+    """
+    Awaits a short sleep and counts the concurrent calls.
+    """
+
+    def __init__(self):
+        self.running = 0
+        self.max_running = 0
+
+    async def __call__(self, input_data, value=0, fail=False):
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(0.01)
+        self.running -= 1
+        if fail:
+            raise RuntimeError("Failed")
+        return input_data + value
+
+
+def multiply(input_data, factor=1, threads=None):
+    threads.add(threading.get_ident())
+    return input_data * factor
+
+
+def create_async_pipeline(cache=None):
+    sleep = Sleep()
+    threads = set()
+    pipeline, _ = create_pipeline(
+        AsyncFunctionNode("sleep", sleep),
+        FunctionNode("thread", functools.partial(multiply, threads=threads)),
+        cache=cache,
+    )
+    return pipeline, sleep, threads
+
+
+def test_aexecute():
+    pipeline, _, threads = create_async_pipeline()
+    result = asyncio.run(pipeline.aexecute(1, sleep={"value": 2}, thread={"factor": 3}))
+    assert result == 9
+    assert threading.get_ident() not in threads
+
+
+def test_execute():
+    pipeline, _, _ = create_async_pipeline()
+    assert pipeline.execute(1, sleep={"value": 2}, thread={"factor": 3}) == 9
+    assert pipeline.execute_many(1, [{"sleep": {"value": 1}}, {}]) == [2, 1]
+
+
+def test_execute_node():
+    node = AsyncFunctionNode("sleep", Sleep())
+    assert execute_node(node, 1, {"value": 2}) == 3
+    node = FunctionNode("multiply", functools.partial(multiply, threads=set()))
+    assert execute_node(node, 2, {"factor": 3}) == 6
+
+
+def test_aexecute_cache():
+    pipeline, _, threads = create_async_pipeline(MemoryCache())
+    asyncio.run(pipeline.aexecute(1, thread={"factor": 3}))
+    threads.clear()
+    assert pipeline.execute(1, thread={"factor": 3}) == 3
+    assert not threads
+
+
+def test_aexecute_many():
+    pipeline, sleep, _ = create_async_pipeline()
+    configs = [{"sleep": {"value": value}} for value in range(50)]
+    results = asyncio.run(pipeline.aexecute_many(0, configs, max_concurrency=10))
+    assert results == list(range(50))
+    assert sleep.max_running == 10
+
+
+def test_aexecute_many_exceptions():
+    pipeline, _, _ = create_async_pipeline()
+    configs = [{"sleep": {"value": 1}}, {"sleep": {"fail": True}}]
+    results = asyncio.run(pipeline.aexecute_many(0, configs, return_exceptions=True))
+    assert results[0] == 1
+    assert isinstance(results[1], RuntimeError)
+    with pytest.raises(RuntimeError):
+        asyncio.run(pipeline.aexecute_many(0, configs))
+    with pytest.raises(ValueError):
+        asyncio.run(pipeline.aexecute_many(0, configs, max_concurrency=0))
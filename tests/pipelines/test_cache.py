@@ -0,0 +1,251 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# Author: Torben Hansing
+#
+import os
+import pickle
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from autoopt.pipelines import DiskCache, MemoryCache
+from autoopt.pipelines.cache import fingerprint, node_key
+from utils import create_pipeline
+
+
+NAMES = ("first", "second", "third")
+
+
+def test_fingerprint():
+    data = np.arange(10)
+    assert fingerprint(data) == fingerprint(np.arange(10))
+    assert fingerprint(data) != fingerprint(np.arange(10.0))
+    assert fingerprint(data) != fingerprint(data.reshape(2, 5))
+    assert fingerprint(data[::2]) == fingerprint(np.arange(0, 10, 2))
+    assert fingerprint({"a": 1}) == fingerprint({"a": 1})
+    assert fingerprint(np.array([1, "a"], dtype=object)) == fingerprint(
+        np.array([1, "a"], dtype=object)
+    )
+    assert fingerprint(threading.Lock()) is None
+
+
+def test_node_key():
+    assert node_key("input", "node", {"a": 1, "b": 2}) == node_key(
+        "input", "node", {"b": 2, "a": 1}
+    )
+    assert node_key("input", "node", {"a": 1}) != node_key("input", "node", {"a": 2})
+    assert node_key("input", "node", {}) != node_key("other", "node", {})
+    assert node_key("input", "node", {}) != node_key("input", "other", {})
+    assert node_key("input", "node", {"lock": threading.Lock()}) is None
+    assert node_key(None, "node", {}) is None
+
+
+class LockedNumber:
+    """
+    A number, whose content can't be hashed, because it can't be pickled.
+    """
+
+    def __init__(self, value):
+        self.value = value
+        self.lock = threading.Lock()
+
+    def __add__(self, other):
+        return self.value + other
+
+
+def test_unhashable_input_not_cached():
+    pipeline, nodes = create_pipeline(*NAMES, cache=MemoryCache())
+    for value in range(200):
+        # The freed inputs get the same addresses again and again
+        assert pipeline.execute(LockedNumber(value), first={"value": 1}) == value + 1
+    assert nodes[0].calls == 200
+    assert len(pipeline.cache) == 0
+
+
+def test_unhashable_parameters_not_cached():
+    pipeline, nodes = create_pipeline(*NAMES, cache=MemoryCache())
+    data = np.zeros(2)
+    lock = threading.Lock()
+    pipeline.execute(data, first={"value": 1}, second={"lock": lock})
+    pipeline.execute(data, first={"value": 1}, second={"lock": lock})
+    assert [node.calls for node in nodes] == [1, 2, 2]
+    results = pipeline.execute_many(
+        data,
+        [{"second": {"lock": lock}}, {"second": {"lock": lock}}, {}],
+    )
+    assert all(np.array_equal(result, [0, 0]) for result in results)
+    assert [node.calls for node in nodes] == [2, 5, 5]
+
+
+def test_prefix_reuse():
+    pipeline, nodes = create_pipeline(*NAMES, cache=MemoryCache())
+    data = np.zeros(3)
+    result = pipeline.execute(data, first={"value": 1}, second={"value": 2})
+    assert np.array_equal(result, [3, 3, 3])
+    assert [node.calls for node in nodes] == [1, 1, 1]
+
+    result = pipeline.execute(data, first={"value": 1}, second={"value": 2})
+    assert np.array_equal(result, [3, 3, 3])
+    assert [node.calls for node in nodes] == [1, 1, 1]
+
+    result = pipeline.execute(
+        data, first={"value": 1}, second={"value": 2}, third={"value": 3}
+    )
+    assert np.array_equal(result, [6, 6, 6])
+    assert [node.calls for node in nodes] == [1, 1, 2]
+
+    result = pipeline.execute(data, first={"value": 1}, second={"value": 5})
+    assert np.array_equal(result, [6, 6, 6])
+    assert [node.calls for node in nodes] == [1, 2, 3]
+
+    result = pipeline.execute(np.ones(3), first={"value": 1}, second={"value": 2})
+    assert np.array_equal(result, [4, 4, 4])
+    assert [node.calls for node in nodes] == [2, 3, 4]
+
+
+def test_without_cache():
+    pipeline, nodes = create_pipeline(*NAMES)
+    assert pipeline.cache is None
+    for _ in range(2):
+        pipeline.execute(np.zeros(3), first={"value": 1})
+    assert [node.calls for node in nodes] == [2, 2, 2]
+
+
+def test_max_entries():
+    cache = MemoryCache(max_entries=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    assert len(cache) == 2
+    assert "a" in cache
+    assert "b" not in cache
+    assert cache.get("b", "missing") == "missing"
+
+
+def test_max_bytes():
+    cache = MemoryCache(max_entries=None, max_bytes=2000)
+    cache.put("a", np.zeros(100))
+    cache.put("b", np.zeros(100))
+    assert cache.num_bytes == 1600
+    cache.put("c", np.zeros(100))
+    assert len(cache) == 2
+    assert "a" not in cache
+    cache.put("d", np.zeros(1000))
+    assert "d" not in cache
+    assert len(cache) == 2
+    cache.put("b", np.zeros(10))
+    assert cache.num_bytes == 880
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.num_bytes == 0
+
+
+def test_execute_many():
+    pipeline, nodes = create_pipeline(*NAMES)
+    configs = [
+        {"first": {"value": first}, "second": {"value": second}}
+        for first in range(3)
+        for second in range(4)
+    ]
+    configs.append({"first": {"value": 0}, "second": {"value": 0}})
+    results = pipeline.execute_many(np.zeros(2), configs)
+    assert len(results) == len(configs)
+    for config, result in zip(configs, results):
+        assert np.array_equal(result, pipeline.execute(np.zeros(2), **config))
+    assert [node.calls for node in nodes] == [3 + 13, 12 + 13, 12 + 13]
+
+
+def test_execute_many_with_cache():
+    pipeline, nodes = create_pipeline(*NAMES, cache=MemoryCache())
+    pipeline.execute(np.zeros(2), first={"value": 1})
+    configs = [{"first": {"value": 1}, "third": {"value": v}} for v in range(3)]
+    results = pipeline.execute_many(np.zeros(2), configs, release=False)
+    assert [result[0] for result in results] == [1, 2, 3]
+    assert [node.calls for node in nodes] == [1, 1, 4]
+    results = pipeline.execute_many(np.zeros(2), configs)
+    assert [node.calls for node in nodes] == [1, 1, 4]
+
+
+@pytest.mark.parametrize("disk", [False, True])
+def test_concurrent_cache(disk, tmp_path):
+    size = DiskCache(str(tmp_path / "size"))
+    size.put("a", np.zeros(100))
+    entry_bytes = size.num_bytes if disk else 800
+    if disk:
+        cache = DiskCache(str(tmp_path / "cache"), max_bytes=50 * entry_bytes)
+    else:
+        cache = MemoryCache(max_entries=None, max_bytes=50 * entry_bytes)
+
+    def use(thread):
+        for index in range(200):
+            key = str((thread * 7 + index) % 80)
+            if cache.get(key) is None:
+                cache.put(key, np.zeros(100))
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(use, range(8)))
+    assert len(cache) == 50
+    assert cache.num_bytes == 50 * entry_bytes
+    if disk:
+        assert len(os.listdir(tmp_path / "cache")) == 50
+
+
+@pytest.mark.parametrize("disk", [False, True])
+def test_pickle_cache(disk, tmp_path):
+    cache = DiskCache(str(tmp_path)) if disk else MemoryCache()
+    cache.put("a", np.zeros(3))
+    restored = pickle.loads(pickle.dumps(cache))
+    assert np.array_equal(restored.get("a"), np.zeros(3))
+    restored.put("b", np.ones(3))
+    assert len(restored) == 2
+
+
+def test_disk_cache(tmp_path):
+    cache = DiskCache(str(tmp_path))
+    data = np.arange(12.0).reshape(3, 4)
+    cache.put("a", data)
+    cache.put("object", np.array([object()]))
+    cache.put("list", [1, 2, 3])
+    assert len(cache) == 1
+    assert "list" not in cache
+    value = cache.get("a")
+    assert isinstance(value, np.memmap)
+    assert not value.flags.writeable
+    assert np.array_equal(value, data)
+    assert sorted(os.listdir(tmp_path)) == ["a.npy"]
+
+    restored = DiskCache(str(tmp_path))
+    assert len(restored) == 1
+    assert restored.num_bytes == cache.num_bytes
+    assert np.array_equal(restored.get("a"), data)
+    restored.clear()
+    assert os.listdir(tmp_path) == []
+
+
+def test_disk_cache_eviction(tmp_path):
+    size = DiskCache(str(tmp_path / "size"))
+    size.put("a", np.zeros(100))
+    cache = DiskCache(str(tmp_path / "cache"), max_bytes=2 * size.num_bytes)
+    cache.put("a", np.zeros(100))
+    cache.put("b", np.zeros(100))
+    cache.get("a")
+    cache.put("c", np.zeros(100))
+    assert "a" in cache
+    assert "b" not in cache
+    assert sorted(os.listdir(tmp_path / "cache")) == ["a.npy", "c.npy"]
+    os.remove(tmp_path / "cache" / "c.npy")
+    assert cache.get("c") is None
+    assert len(cache) == 1
+
+
+def test_pipeline_disk_cache(tmp_path):
+    pipeline, nodes = create_pipeline(*NAMES, cache=DiskCache(str(tmp_path)))
+    pipeline.execute(np.zeros(3), first={"value": 1}, second={"value": 2})
+    # A new run reuses the results of the previous one
+    pipeline, nodes = create_pipeline(*NAMES, cache=DiskCache(str(tmp_path)))
+    result = pipeline.execute(np.zeros(3), first={"value": 1}, second={"value": 3})
+    assert np.array_equal(result, [4, 4, 4])
+    assert [node.calls for node in nodes] == [0, 1, 1]
@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# Author: Torben Hansing
+#
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from autoopt.distributions import Choice
+from autoopt.pipelines import DagPipeline
+from utils import FunctionNode, create_node
+
+
+BARRIER = threading.Barrier(2, timeout=5)
+
+
+def combine(input_data, value=1):
+    if isinstance(input_data, tuple):
+        return sum(input_data) * value
+    return input_data + value
+
+
+def wait_combine(input_data, value=1):
+    # Only passes, if both branches are executed concurrently
+    BARRIER.wait()
+    return combine(input_data, value)
+
+
+def fail(input_data, value=1):
+    time.sleep(0.01)
+    raise RuntimeError("Failed")
+
+
+def create_dag_node(name, function=combine, input_types=("number",), **kwargs):
+    space = {"value": Choice(choices=[1, 2])}
+    return FunctionNode(name, function, input_types, space=space, **kwargs)
+
+
+def create_dag(branch=combine, executor=None):
+    pipeline = DagPipeline(executor=executor)
+    pipeline.add_node(create_dag_node("load"))
+    pipeline.add_node(create_dag_node("left", branch), inputs=["load"])
+    pipeline.add_node(create_dag_node("right", branch), inputs=["load"])
+    pipeline.add_node(create_dag_node("unused"), inputs=["load"])
+    pipeline.add_node(
+        create_dag_node("union", input_types=("number", "number")),
+        inputs=["left", "right"],
+    )
+    return pipeline
+
+
+def test_execute():
+    pipeline = create_dag()
+    assert pipeline.execute(1) == 6
+    assert pipeline.execute(1, left={"value": 2}, union={"value": 3}) == 21
+
+
+def test_concurrent_branches():
+    assert create_dag(wait_combine).execute(1) == 6
+
+
+def test_process_pool():
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        assert create_dag(executor=executor).execute(1, right={"value": 2}) == 7
+
+
+def test_failing_node():
+    with pytest.raises(RuntimeError):
+        create_dag(fail).execute(1)
+
+
+def test_parameter_space():
+    pipeline = create_dag()
+    space = pipeline.parameter_space()
+    assert list(space) == ["load", "left", "right", "unused", "union"]
+    assert len(pipeline.compiled_space()) == 5
+    assert pipeline.inputs("union") == ["left", "right"]
+
+
+def test_types():
+    pipeline = DagPipeline()
+    assert pipeline.input_type == "Any"
+    assert pipeline.output_type == "Any"
+    assert pipeline.execute(1) == 1
+    pipeline.add_node(
+        create_dag_node("load", input_types=["path"], output_type="table")
+    )
+    pipeline.add_node(create_dag_node("count", input_types=["table"]), inputs=["load"])
+    assert pipeline.input_type == "path"
+    # Another node, which gets the input data of the pipeline
+    pipeline.add_node(create_dag_node("size", input_types=["path"]))
+    assert pipeline.output_type == "number"
+    assert create_node("node", input_type="number").input_types == ("number",)
+
+
+@pytest.mark.parametrize(
+    "node, inputs",
+    [
+        (create_dag_node("load"), []),
+        (create_dag_node("node"), ["unknown"]),
+        (create_dag_node("node"), ["load", "load"]),
+        (create_dag_node("node", input_types=["number", "table"]), ["load", "load"]),
+        (create_dag_node("node", input_types=["table"]), []),
+        (create_dag_node("node", input_types=["number", "number"]), []),
+    ],
+)
+def test_invalid_node(node, inputs):
+    pipeline = DagPipeline()
+    pipeline.add_node(create_dag_node("load"))
+    with pytest.raises(ValueError):
+        pipeline.add_node(node, inputs=inputs)
@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# Author: Torben Hansing
+#
+import os
+import threading
+
+import pytest
+
+from autoopt.pipelines import ParallelEvaluator
+from utils import FunctionNode, create_pipeline
+
+
+def scale(input_data, factor=1, fail=False):
+    if fail:
+        raise RuntimeError(f"Failed with factor {factor}")
+    return input_data * factor, os.getpid()
+
+
+def lock(input_data, **kwargs):
+    return threading.Lock()
+
+
+def create_evaluator(function=scale, **kwargs):
+    pipeline, _ = create_pipeline(FunctionNode("scale", function))
+    return ParallelEvaluator(pipeline, **kwargs)
+
+
+def create_configs():
+    return [{"scale": {"factor": factor, "fail": factor == 3}} for factor in range(10)]
+
+
+@pytest.mark.parametrize("chunksize", [1, 3])
+def test_ordered(chunksize):
+    evaluator = create_evaluator(max_workers=2, chunksize=chunksize)
+    configs = create_configs()
+    trials = list(evaluator.evaluate(2, configs))
+    assert [trial.index for trial in trials] == list(range(10))
+    for trial in trials:
+        assert trial.config is configs[trial.index]
+        if trial.index == 3:
+            assert trial.result is None
+            assert "Failed with factor 3" in trial.error
+        else:
+            assert trial.error is None
+            assert trial.result[0] == 2 * trial.index
+            assert trial.result[1] != os.getpid()
+
+
+def test_as_completed():
+    evaluator = create_evaluator(max_workers=3, chunksize=2, mp_context="spawn")
+    trials = list(evaluator.evaluate(1, create_configs(), ordered=False))
+    assert sorted(trial.index for trial in trials) == list(range(10))
+    assert all(trial.result[0] == trial.index for trial in trials if trial.index != 3)
+
+
+def test_unpicklable_result():
+    evaluator = create_evaluator(lock, max_workers=1)
+    trials = list(evaluator.evaluate(1, create_configs()[:2]))
+    assert len(trials) == 2
+    assert all(trial.error is not None for trial in trials)
+
+
+def test_empty():
+    evaluator = create_evaluator()
+    assert list(evaluator.evaluate(1, [])) == []
+
+
+def test_invalid_chunksize():
+    with pytest.raises(ValueError):
+        create_evaluator(chunksize=0)
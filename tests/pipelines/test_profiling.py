@@ -0,0 +1,155 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# Author: Torben Hansing
+#
+import pickle
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from autoopt.pipelines import MemoryCache, PipelineHook, Profiler
+from utils import create_pipeline
+
+
+def allocate(input_data, size=10, sleep=0.0):
+    time.sleep(sleep)
+    temporary = np.ones(size * 10)
+    return temporary[:size].copy()
+
+
+class RecordingHook(PipelineHook):
+    def __init__(self):
+        self.events = []
+
+    def on_trial_start(self, input_data, config):
+        self.events.append(("trial_start", config))
+
+    def on_node_start(self, node, parameters):
+        self.events.append(("node_start", node.name, parameters))
+
+    def on_node_end(self, node, parameters, result):
+        self.events.append(("node_end", node.name, len(result)))
+
+    def on_trial_end(self, result):
+        self.events.append(("trial_end", len(result)))
+
+    def on_trial_error(self, error):
+        self.events.append(("trial_error", str(error)))
+
+
+def create_profiled_pipeline(cache=None):
+    pipeline, _ = create_pipeline("first", "second", cache=cache, function=allocate)
+    return pipeline
+
+
+def test_hooks():
+    pipeline = create_profiled_pipeline(MemoryCache())
+    hook = RecordingHook()
+    pipeline.add_hook(hook)
+    pipeline.add_hook(PipelineHook())
+    assert len(pipeline.hooks) == 2
+    pipeline.execute(None, second={"size": 5})
+    pipeline.execute(None, second={"size": 3})
+    assert hook.events == [
+        ("trial_start", {"second": {"size": 5}}),
+        ("node_start", "first", {}),
+        ("node_end", "first", 10),
+        ("node_start", "second", {"size": 5}),
+        ("node_end", "second", 5),
+        ("trial_end", 5),
+        ("trial_start", {"second": {"size": 3}}),
+        ("node_start", "second", {"size": 3}),
+        ("node_end", "second", 3),
+        ("trial_end", 3),
+    ]
+    pipeline.remove_hook(hook)
+    pipeline.execute(None)
+    assert len(hook.events) == 10
+
+
+def test_profiler():
+    pipeline = create_profiled_pipeline()
+    profiler = Profiler()
+    pipeline.add_hook(profiler)
+    pipeline.execute(None, first={"size": 100_000, "sleep": 0.02})
+    pipeline.execute(None, first={"size": 1000})
+    assert not tracemalloc.is_tracing()
+
+    profiles = profiler.profiles
+    assert [profile.node for profile in profiles] == ["first", "second"] * 2
+    assert profiles[0].wall_time >= 0.02
+    assert profiles[0].cpu_time < profiles[0].wall_time
+    assert profiles[0].output_bytes == 800_000
+    assert profiles[0].peak_memory >= 8_000_000
+    assert profiles[1].output_bytes == 80
+
+    report = profiler.report()
+    assert set(report) == {"first", "second"}
+    assert report["first"]["count"] == 2
+    assert report["first"]["wall_time"] >= 0.02
+    assert report["first"]["mean_wall_time"] == report["first"]["wall_time"] / 2
+    assert report["first"]["max_peak_memory"] == profiles[0].peak_memory
+    assert report["first"]["mean_output_bytes"] == (800_000 + 8000) / 2
+
+    profiler.clear()
+    assert profiler.report() == {}
+
+
+def test_profiler_without_memory():
+    pipeline = create_profiled_pipeline()
+    profiler = Profiler(trace_memory=False)
+    pipeline.add_hook(profiler)
+    pipeline.execute(None)
+    assert all(profile.peak_memory is None for profile in profiler.profiles)
+    assert profiler.report()["first"]["max_peak_memory"] is None
+
+
+def test_concurrent_executions():
+    pipeline = create_profiled_pipeline()
+    profiler = Profiler()
+    pipeline.add_hook(profiler)
+    sleeps = [0.05, 0.1, 0.02, 0.08]
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = executor.map(
+            lambda sleep: pipeline.execute(None, first={"sleep": sleep}), sleeps
+        )
+        assert all(len(result) == 10 for result in results)
+    assert not tracemalloc.is_tracing()
+    profiles = [profile for profile in profiler.profiles if profile.node == "first"]
+    assert len(profiles) == 4
+    assert all(profile.peak_memory is not None for profile in profiles)
+    wall_times = sorted(profile.wall_time for profile in profiles)
+    assert all(time >= sleep for time, sleep in zip(wall_times, sorted(sleeps)))
+
+
+def test_pickle_profiler():
+    profiler = Profiler()
+    pipeline = create_profiled_pipeline()
+    pipeline.add_hook(profiler)
+    pipeline.execute(None)
+    restored = pickle.loads(pickle.dumps(profiler))
+    assert restored.profiles == profiler.profiles
+    pipeline.remove_hook(profiler)
+    pipeline.add_hook(restored)
+    pipeline.execute(None)
+    assert len(restored.profiles) == 4
+    assert not tracemalloc.is_tracing()
+
+
+def test_failing_node():
+    pipeline, _ = create_pipeline("first", "second")
+    hook = RecordingHook()
+    profiler = Profiler()
+    pipeline.add_hook(profiler)
+    pipeline.add_hook(hook)
+    with pytest.raises(RuntimeError):
+        pipeline.execute(np.zeros(2), second={"fail": True})
+    assert not tracemalloc.is_tracing()
+    assert [profile.node for profile in profiler.profiles] == ["first"]
+    assert hook.events[-2:] == [
+        ("node_start", "second", {"fail": True}),
+        ("trial_error", "Failed"),
+    ]
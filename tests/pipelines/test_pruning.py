@@ -0,0 +1,206 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# Author: Torben Hansing
+#
+import asyncio
+import pickle
+import statistics
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from autoopt.pipelines import (
+    MedianPruner,
+    PrunedResult,
+    Profiler,
+    TimeBudgetPruner,
+    TrialPruned,
+)
+from autoopt.pipelines.pruning import _RunningMedian
+from utils import FunctionNode, create_pipeline
+
+
+NAMES = ("first", "second", "third")
+
+
+def test_node_prunes():
+    pipeline, nodes = create_pipeline(*NAMES)
+    profiler = Profiler(trace_memory=False)
+    pipeline.add_hook(profiler)
+    result = pipeline.execute(0, first={"value": 1}, second={"prune": True})
+    assert result == PrunedResult("second", "Pruned by the node", 1)
+    assert [node.calls for node in nodes] == [1, 1, 0]
+    assert [profile.node for profile in profiler.profiles] == ["first"]
+
+
+def test_execute_many_prunes():
+    pipeline, nodes = create_pipeline(*NAMES)
+    configs = [
+        {"first": {"value": 1}, "second": {"prune": True}, "third": {"value": 1}},
+        {"first": {"value": 1}, "second": {"prune": True}, "third": {"value": 2}},
+        {"first": {"value": 1}, "third": {"value": 3}},
+    ]
+    results = pipeline.execute_many(0, configs)
+    assert results == [PrunedResult("second", "Pruned by the node", 1)] * 2 + [4]
+    assert [node.calls for node in nodes] == [1, 2, 1]
+
+
+def test_execute_many_with_hooks():
+    pipeline, _ = create_pipeline(*NAMES)
+    profiler = Profiler(trace_memory=False)
+    pipeline.add_hook(profiler)
+    pipeline.add_hook(MedianPruner(lambda node, result: result, min_trials=1))
+    configs = [{"first": {"value": value}} for value in [2, 1, 3]]
+    results = pipeline.execute_many(0, configs)
+    assert results[:2] == [2, 1]
+    assert results[2] == PrunedResult("first", results[2].reason, 3)
+    nodes = [profile.node for profile in profiler.profiles]
+    assert nodes == [*NAMES, *NAMES, "first"]
+
+
+def test_aexecute_prunes():
+    pipeline, nodes = create_pipeline(*NAMES)
+    profiler = Profiler(trace_memory=False)
+    pipeline.add_hook(profiler)
+    result = asyncio.run(
+        pipeline.aexecute(0, first={"value": 1}, second={"prune": True})
+    )
+    assert result == PrunedResult("second", "Pruned by the node", 1)
+    assert [node.calls for node in nodes] == [1, 1, 0]
+    assert [profile.node for profile in profiler.profiles] == ["first"]
+
+
+def test_concurrent_time_budget():
+    pipeline, _ = create_pipeline(*NAMES)
+    pipeline.add_hook(TimeBudgetPruner(budget=0.1))
+    # The third execution starts while the second one is still running
+    configs = [
+        {"first": {"sleep": 0.08}},
+        {"first": {"sleep": 0.15}},
+        {"first": {"value": 1}},
+    ]
+    results = asyncio.run(pipeline.aexecute_many(0, configs, max_concurrency=2))
+    assert results[0] == 0
+    assert isinstance(results[1], PrunedResult)
+    assert results[2] == 1
+
+
+def test_threaded_time_budget():
+    pipeline, _ = create_pipeline(*NAMES)
+    pipeline.add_hook(TimeBudgetPruner(budget=0.1))
+    sleeps = [0.08, 0.15, 0.0]
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        # The third execution starts while the second one is still running
+        results = list(
+            executor.map(
+                lambda sleep: pipeline.execute(0, first={"sleep": sleep}), sleeps
+            )
+        )
+    assert results[0] == 0
+    assert isinstance(results[1], PrunedResult)
+    assert results[2] == 0
+
+
+def identity(node, result):
+    return result
+
+
+def test_threaded_median_pruner():
+    pipeline, _ = create_pipeline(*NAMES)
+    pipeline.add_hook(MedianPruner(identity, min_trials=10))
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(
+            executor.map(lambda _: pipeline.execute(0, first={"value": 5}), range(100))
+        )
+    assert results == [5] * 100
+    result = pipeline.execute(0, first={"value": 6})
+    assert result == PrunedResult("first", result.reason, 6)
+    assert "median 5" in result.reason
+
+
+def test_pickle_median_pruner():
+    pruner = MedianPruner(identity, min_trials=1)
+    pipeline, _ = create_pipeline(*NAMES)
+    pipeline.add_hook(pruner)
+    pipeline.execute(0, first={"value": 1})
+    pipeline, _ = create_pipeline(*NAMES)
+    pipeline.add_hook(pickle.loads(pickle.dumps(pruner)))
+    assert isinstance(pipeline.execute(0, first={"value": 2}), PrunedResult)
+
+
+def prune_large(input_data, limit=10):
+    if input_data > limit:
+        raise TrialPruned(f"{input_data} exceeds {limit}")
+    return input_data
+
+
+@pytest.mark.parametrize("buffer_size", [0, 2])
+def test_stream_prunes(buffer_size):
+    pipeline, _ = create_pipeline(FunctionNode("limit", prune_large), "add")
+    chunks = list(pipeline.execute_stream(range(20), buffer_size, add={"value": 1}))
+    assert chunks[:-1] == list(range(1, 12))
+    assert chunks[-1] == PrunedResult("limit", "11 exceeds 10", None)
+
+
+def test_stream_rejects_hooks():
+    pipeline, _ = create_pipeline(*NAMES)
+    pipeline.add_hook(TimeBudgetPruner(budget=1))
+    with pytest.raises(ValueError):
+        pipeline.execute_stream(range(3))
+
+
+def test_median_pruner():
+    pipeline, nodes = create_pipeline(*NAMES)
+    pipeline.add_hook(
+        MedianPruner(
+            lambda node, result: result if node.name == "first" else None,
+            min_trials=3,
+        )
+    )
+    results = [pipeline.execute(0, first={"value": value}) for value in [5, 3, 4]]
+    assert results == [5, 3, 4]
+    assert pipeline.execute(0, first={"value": 4}) == 4
+    result = pipeline.execute(0, first={"value": 6})
+    assert isinstance(result, PrunedResult)
+    assert result.node == "first"
+    assert result.result == 6
+    assert "median 4" in result.reason
+    assert [node.calls for node in nodes] == [5, 4, 4]
+
+
+def test_median_pruner_maximize():
+    pipeline, _ = create_pipeline(*NAMES)
+    pipeline.add_hook(
+        MedianPruner(lambda node, result: result, min_trials=1, minimize=False)
+    )
+    assert pipeline.execute(0, first={"value": 2}) == 2
+    assert pipeline.execute(0, first={"value": 3}) == 3
+    assert isinstance(pipeline.execute(0, first={"value": 1}), PrunedResult)
+
+
+def test_invalid_min_trials():
+    with pytest.raises(ValueError):
+        MedianPruner(lambda node, result: result, min_trials=0)
+
+
+def test_time_budget_pruner():
+    pipeline, nodes = create_pipeline(*NAMES)
+    pipeline.add_hook(TimeBudgetPruner(budget=0.05))
+    assert pipeline.execute(0, first={"value": 1}) == 1
+    result = pipeline.execute(0, second={"sleep": 0.06})
+    assert result.node == "second"
+    assert [node.calls for node in nodes] == [2, 2, 1]
+    with pytest.raises(ValueError):
+        TimeBudgetPruner(budget=0)
+
+
+def test_running_median():
+    rng = np.random.default_rng(42)
+    median = _RunningMedian()
+    values = []
+    for value in rng.normal(size=101):
+        median.add(value)
+        values.append(value)
+        assert len(median) == len(values)
+        assert median.median == pytest.approx(statistics.median(values))
@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# Author: Torben Hansing
+#
+import time
+
+import pytest
+
+from autoopt.pipelines import NodeRegistry, Pipeline
+from utils import create_node
+
+
+def create_registry():
+    registry = NodeRegistry()
+    for name, input_type, output_type in [
+        ("load", "path", "table"),
+        ("clean", "table", "table"),
+        ("features", "table", "matrix"),
+        ("pca", "matrix", "matrix"),
+        ("model", "matrix", "loss"),
+        ("plot", "matrix", "image"),
+        ("orphan", "text", "loss"),
+    ]:
+        registry.register(create_node(name, input_type, output_type))
+    return registry
+
+
+def names(chains):
+    return [[node.name for node in chain] for chain in chains]
+
+
+def test_register():
+    registry = create_registry()
+    assert len(registry) == 7
+    assert "pca" in registry
+    assert [node.name for node in registry.by_input_type("matrix")] == [
+        "pca",
+        "model",
+        "plot",
+    ]
+    assert [node.name for node in registry.by_output_type("loss")] == [
+        "model",
+        "orphan",
+    ]
+    assert registry.by_input_type("unknown") == []
+    with pytest.raises(ValueError):
+        registry.register(create_node("pca", "matrix", "matrix"))
+
+
+def test_chains():
+    registry = create_registry()
+    assert names(registry.chains("path", "loss", max_length=2)) == []
+    assert names(registry.chains("path", "loss", max_length=3)) == [
+        ["load", "features", "model"]
+    ]
+    assert names(registry.chains("path", "loss", max_length=5)) == [
+        ["load", "features", "model"],
+        ["load", "clean", "features", "model"],
+        ["load", "features", "pca", "model"],
+        ["load", "clean", "features", "pca", "model"],
+    ]
+    assert names(registry.chains("table", "matrix", max_length=1)) == [["features"]]
+    assert names(registry.chains("text", "loss")) == [["orphan"]]
+    assert names(registry.chains("path", "unknown")) == []
+
+
+def test_any():
+    registry = create_registry()
+    assert names(registry.chains("Any", "loss", max_length=1)) == [
+        ["model"],
+        ["orphan"],
+    ]
+    assert len(list(registry.chains("matrix", "Any", max_length=2))) == 5
+    registry.register(create_node("anything", "image", "Any"))
+    assert ["plot", "anything", "model"] in names(
+        registry.chains("matrix", "loss", max_length=3)
+    )
+
+
+def test_beam():
+    registry = create_registry()
+    chains = names(registry.chains("path", "loss", max_length=5, beam_width=1))
+    assert chains == [["load", "features", "model"]]
+    with pytest.raises(ValueError):
+        list(registry.chains("path", "loss", beam_width=0))
+
+
+def test_pipelines():
+    pipelines = list(create_registry().pipelines("path", "loss", max_length=4))
+    assert len(pipelines) == 3
+    assert all(isinstance(pipeline, Pipeline) for pipeline in pipelines)
+    assert all(pipeline.input_type == "path" for pipeline in pipelines)
+    assert all(pipeline.output_type == "loss" for pipeline in pipelines)
+
+
+def test_many_nodes():
+    registry = NodeRegistry()
+    for index in range(5000):
+        registry.register(create_node(f"node{index}", f"t{index // 10}", f"t{index}"))
+    start = time.perf_counter()
+    chains = list(registry.chains("t0", "t4999", max_length=4))
+    assert time.perf_counter() - start < 1
+    assert names(chains) == [["node4", "node49", "node499", "node4999"]]
@@ -0,0 +1,211 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# Author: Torben Hansing
+#
+import unittest
+
+import numpy as np
+
+from autoopt.distributions import (
+    Choice,
+    LogNormal,
+    LogUniform,
+    Normal,
+    QLogNormal,
+    QLogUniform,
+    QNormal,
+    QUniform,
+    Uniform,
+    WeightedChoice,
+)
+from autoopt.distributions.base import Distribution
+from autoopt.pipelines import CompiledSpace, Pipeline
+from utils import create_node
+
+
+class Exponential(Distribution):
+    """A distribution, which is not part of the vectorized families."""
+
+    def mean(self):
+        return 1.0
+
+    def pdf(self, x):
+        x = np.asarray(x, dtype=float)
+        return np.where(x >= 0, np.exp(-x), 0.0)
+
+    def cdf(self, x):  # pragma: no cover
+        raise NotImplementedError()
+
+    def ppf(self, q):  # pragma: no cover
+        raise NotImplementedError()
+
+    def to_unit(self, x):
+        return 1 - np.exp(-np.asarray(x, dtype=float))
+
+    def from_unit(self, u):
+        return -np.log(1 - np.asarray(u, dtype=float))
+
+    def sample(self, size=None, rng=None):
+        return np.random.default_rng(rng).exponential(size=size)
+
+    def _plot_min_value(self):  # pragma: no cover
+        return 0.0
+
+    def _plot_max_value(self):  # pragma: no cover
+        return 5.0
+
+    def _plot_label(self):  # pragma: no cover
+        return ""
+
+
+def create_space():
+    return {
+        "first": {
+            "uniform": Uniform(min_value=-1, max_value=1),
+            "q_uniform": QUniform(min_value=0, max_value=10, q=2),
+            "log_uniform": LogUniform(min_value=1, max_value=100),
+            "q_log_uniform": QLogUniform(min_value=5, max_value=100, q=5),
+            "choice": Choice(choices=["a", (1, 2), None]),
+            "constant": 42,
+        },
+        "second": {
+            "normal": Normal(loc=1, scale=2),
+            "q_normal": QNormal(loc=0, scale=3, q=0.5),
+            "log_normal": LogNormal(loc=0, scale=1),
+            "q_log_normal": QLogNormal(loc=3, scale=0.5, q=1),
+            "weighted_choice": WeightedChoice(choices={"x": 1, "y": 3}),
+            "exponential": Exponential(),
+        },
+        "empty": {},
+    }
+
+
+class TestCompiledSpace(unittest.TestCase):
+    def setUp(self):
+        self.space = create_space()
+        self.compiled = CompiledSpace(self.space)
+
+    def test_keys(self):
+        check = [
+            (node_name, name)
+            for node_name, parameters in self.space.items()
+            for name, value in parameters.items()
+            if isinstance(value, Distribution)
+        ]
+        self.assertListEqual(check, self.compiled.keys)
+        self.assertEqual(len(check), len(self.compiled))
+
+    def test_sample(self):
+        samples = self.compiled.sample(1000, rng=42)
+        self.assertEqual((1000, len(self.compiled)), samples.shape)
+        np.testing.assert_array_equal(samples, self.compiled.sample(1000, rng=42))
+        self.assertTrue(np.all(np.isfinite(self.compiled.logpdf(samples))))
+
+    def test_decode(self):
+        samples = self.compiled.sample(10, rng=42)
+        configurations = self.compiled.decode(samples)
+        self.assertEqual(10, len(configurations))
+        for config in configurations:
+            self.assertSetEqual(set(self.space), set(config))
+            self.assertEqual(42, config["first"]["constant"])
+            self.assertIn(config["first"]["choice"], ["a", (1, 2), None])
+            self.assertIn(config["second"]["weighted_choice"], ["x", "y"])
+            self.assertDictEqual({}, config["empty"])
+
+    def test_encode(self):
+        samples = self.compiled.sample(10, rng=42)
+        encoded = self.compiled.encode(self.compiled.decode(samples))
+        np.testing.assert_array_equal(samples, encoded)
+
+    def test_logpdf(self):
+        samples = self.compiled.sample(100, rng=42)
+        configurations = self.compiled.decode(samples)
+        check = [
+            sum(
+                dist.logpdf(config[node_name][name])
+                for (node_name, name), dist in zip(
+                    self.compiled.keys, self.compiled.distributions
+                )
+            )
+            for config in configurations
+        ]
+        np.testing.assert_allclose(check, self.compiled.logpdf(samples))
+        np.testing.assert_allclose(np.exp(check), self.compiled.pdf(samples))
+
+    def test_quantized_bounds(self):
+        # Rounding the values of the underlying distributions would result in 0
+        compiled = CompiledSpace(
+            {
+                "node": {
+                    "uniform": QLogUniform(min_value=1, max_value=100, q=5),
+                    "normal": QLogNormal(loc=-2, scale=1, q=1),
+                }
+            }
+        )
+        samples = compiled.sample(1000, rng=0)
+        self.assertTrue(np.all(samples >= [5, 1]))
+        self.assertTrue(np.all(np.isfinite(compiled.logpdf(samples))))
+        units = compiled.to_unit(samples)
+        self.assertTrue(np.all(np.isfinite(units)))
+        np.testing.assert_array_equal(samples, compiled.from_unit(units))
+        decoded = compiled.from_unit(np.random.default_rng(0).random((1000, 2)))
+        self.assertTrue(np.all(np.isfinite(compiled.logpdf(decoded))))
+
+    def test_logpdf_outside(self):
+        samples = self.compiled.sample(2, rng=42)
+        samples[0, self.compiled.keys.index(("first", "uniform"))] = 2.0
+        samples[1, self.compiled.keys.index(("first", "choice"))] = 3
+        self.assertTrue(np.all(np.isneginf(self.compiled.logpdf(samples))))
+
+    def test_encode_unknown_choice(self):
+        config = self.compiled.decode(self.compiled.sample(1, rng=42))[0]
+        config["first"]["choice"] = "unknown"
+        encoded = self.compiled.encode([config])
+        column = self.compiled.keys.index(("first", "choice"))
+        self.assertTrue(np.isnan(encoded[0, column]))
+
+    def test_to_unit(self):
+        samples = self.compiled.sample(1000, rng=42)
+        units = self.compiled.to_unit(samples)
+        self.assertTrue(np.all((units >= 0) & (units <= 1)))
+        configurations = self.compiled.decode(samples)
+        for column, ((node_name, name), dist) in enumerate(
+            zip(self.compiled.keys, self.compiled.distributions)
+        ):
+            values = [config[node_name][name] for config in configurations]
+            np.testing.assert_allclose(dist.to_unit(values), units[:, column])
+
+    def test_from_unit(self):
+        units = np.random.default_rng(42).random((1000, len(self.compiled)))
+        samples = self.compiled.from_unit(units)
+        self.assertTrue(np.all(np.isfinite(self.compiled.logpdf(samples))))
+        configurations = self.compiled.decode(samples)
+        for column, ((node_name, name), dist) in enumerate(
+            zip(self.compiled.keys, self.compiled.distributions)
+        ):
+            check = dist.from_unit(units[:, column])
+            values = [config[node_name][name] for config in configurations]
+            if isinstance(dist, WeightedChoice):
+                self.assertListEqual(list(check), values)
+            else:
+                np.testing.assert_allclose(check, values)
+
+    def test_unit_round_trip(self):
+        samples = self.compiled.sample(1000, rng=42)
+        round_trip = self.compiled.from_unit(self.compiled.to_unit(samples))
+        np.testing.assert_allclose(samples, round_trip)
+
+    def test_empty(self):
+        compiled = CompiledSpace({})
+        self.assertEqual(0, len(compiled))
+        self.assertListEqual([{}, {}], compiled.decode(compiled.sample(2)))
+
+
+def test_pipeline_compiled_space():
+    pipeline = Pipeline()
+    node = create_node(
+        name="node", input_type="in", output_type="out", space={"param": Uniform(0, 1)}
+    )
+    pipeline.add_node(node)
+    compiled = pipeline.compiled_space()
+    assert compiled.keys == [("node", "param")]
@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# Author: Torben Hansing
+#
+import itertools
+
+import numpy as np
+import pytest
+
+from autoopt.pipelines.streaming import prefetch
+from utils import FunctionNode, create_node, create_pipeline
+
+
+def cumulative_sum(input_data, initial=0):
+    total = initial
+    for chunk in input_data:
+        chunk = total + np.cumsum(chunk)
+        total = chunk[-1]
+        yield chunk
+
+
+def create_stream_pipeline():
+    pipeline, _ = create_pipeline(
+        FunctionNode("add"), FunctionNode("sum", cumulative_sum, streaming=True)
+    )
+    return pipeline
+
+
+def test_streaming_property():
+    assert not create_node("add").streaming
+    assert FunctionNode("sum", cumulative_sum, streaming=True).streaming
+
+
+@pytest.mark.parametrize("buffer_size", [0, 1, 4])
+def test_execute_stream(buffer_size):
+    pipeline = create_stream_pipeline()
+    data = np.arange(100)
+    stream = pipeline.execute_stream(
+        np.array_split(data, 7),
+        buffer_size=buffer_size,
+        add={"value": 1},
+        sum={"initial": 10},
+    )
+    chunks = list(stream)
+    assert len(chunks) == 7
+    assert np.array_equal(np.concatenate(chunks), 10 + np.cumsum(data + 1))
+
+
+def test_lazy():
+    pipeline = create_stream_pipeline()
+    stream = pipeline.execute_stream(np.ones(2) for _ in itertools.count())
+    first = list(itertools.islice(stream, 3))
+    assert np.array_equal(first[-1], [5, 6])
+
+
+def test_prefetch():
+    assert list(prefetch(range(100), 3)) == list(range(100))
+    assert list(itertools.islice(prefetch(itertools.count(), 2), 5)) == list(range(5))
+    with pytest.raises(ValueError):
+        list(prefetch(range(3), 0))
+
+
+def test_prefetch_error():
+    def failing():
+        yield 1
+        raise RuntimeError("Failed")
+
+    stream = prefetch(failing(), 2)
+    assert next(stream) == 1
+    with pytest.raises(RuntimeError):
+        next(stream)
+
+
+def test_negative_buffer_size():
+    with pytest.raises(ValueError):
+        create_stream_pipeline().execute_stream([], buffer_size=-1)
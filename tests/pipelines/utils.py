@@ -2,7 +2,9 @@
 # -*- coding: UTF-8 -*-
 # Author: Torben Hansing
 #
-from autoopt.pipelines import PipelineNode
+import time
+
+from autoopt.pipelines import AsyncPipelineNode, Pipeline, PipelineNode, TrialPruned
 
 
 def create_node(
@@ -38,3 +40,103 @@ def create_node(
             return input_data
 
     return Node()
+
+
+def step(input_data, value=0, sleep=0.0, prune=False, fail=False, **kwargs):
+    """
+    The default function of a `FunctionNode`, which adds a value to its input.
+    """
+    time.sleep(sleep)
+    if prune:
+        raise TrialPruned("Pruned by the node")
+    if fail:
+        raise RuntimeError("Failed")
+    return input_data + value
+
+
+class FunctionNode(PipelineNode):
+    """
+    A node, which applies a function to its input and records the parameters
+    of each execution. It can be pickled, if the function can be pickled.
+    """
+
+    def __init__(
+        self,
+        name,
+        function=step,
+        input_types=("number",),
+        output_type="number",
+        space=None,
+        streaming=False,
+    ):
+        self.__name = name
+        self.__function = function
+        self.__input_types = tuple(input_types)
+        self.__output_type = output_type
+        self.__space = space or {}
+        self.__streaming = streaming
+        self.executions = []
+
+    @property
+    def name(self):
+        return self.__name
+
+    @property
+    def function(self):
+        return self.__function
+
+    @property
+    def calls(self):
+        return len(self.executions)
+
+    @property
+    def input_type(self):
+        return self.__input_types[0]
+
+    @property
+    def input_types(self):
+        return self.__input_types
+
+    @property
+    def output_type(self):
+        return self.__output_type
+
+    @property
+    def streaming(self):
+        return self.__streaming
+
+    def parameter_space(self):
+        return dict(self.__space)
+
+    def execute(self, input_data, **kwargs):
+        self.executions.append(kwargs)
+        return self.__function(input_data, **kwargs)
+
+
+class AsyncFunctionNode(AsyncPipelineNode, FunctionNode):
+    """
+    A `FunctionNode`, which awaits its function.
+    """
+
+    async def aexecute(self, input_data, **kwargs):
+        self.executions.append(kwargs)
+        return await self.function(input_data, **kwargs)
+
+
+def create_pipeline(*nodes, cache=None, **kwargs):
+    """
+    Create a linear pipeline of the given nodes.
+
+    :param nodes: The nodes or the names of `FunctionNode`s, which are created
+                  with the `kwargs`.
+    :param cache: The cache of the pipeline.
+    :return: The pipeline and its nodes.
+    """
+    nodes = [
+        FunctionNode(node, **kwargs) if isinstance(node, str) else node
+        for node in nodes
+    ]
+    pipeline = Pipeline(cache=cache)
+    for node in nodes:
+        pipeline.add_node(node)
+    return pipeline, nodes
@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# Author: Torben Hansing
+#
+import itertools
+
+import pytest
+
+from autoopt.distributions import (
+    Choice,
+    QLogUniform,
+    QUniform,
+    Uniform,
+    WeightedChoice,
+)
+from autoopt.samplers import GridSampler
+
+
+def create_space():
+    return {
+        "first": {
+            "q_uniform": QUniform(min_value=0, max_value=1, q=0.25),
+            "constant": 42,
+        },
+        "second": {
+            "q_log_uniform": QLogUniform(min_value=3, max_value=10, q=3),
+            "choice": Choice(choices=["a", "b"]),
+            "weighted": WeightedChoice(choices={"x": 1, "y": 0, "z": 2}),
+        },
+    }
+
+
+def test_values():
+    grid = GridSampler(create_space())
+    assert grid.radices == [5, 3, 2, 2]
+    assert len(grid) == 60
+    assert grid.keys == [
+        ("first", "q_uniform"),
+        ("second", "q_log_uniform"),
+        ("second", "choice"),
+        ("second", "weighted"),
+    ]
+
+
+def test_mixed_radix_order():
+    grid = GridSampler(create_space())
+    check = itertools.product(
+        [0.0, 0.25, 0.5, 0.75, 1.0], [3.0, 6.0, 9.0], ["a", "b"], ["x", "z"]
+    )
+    for config, values in itertools.zip_longest(grid, check):
+        assert config["first"]["constant"] == 42
+        assert values == (
+            config["first"]["q_uniform"],
+            config["second"]["q_log_uniform"],
+            config["second"]["choice"],
+            config["second"]["weighted"],
+        )
+
+
+def test_configuration():
+    grid = GridSampler(create_space())
+    configurations = list(grid)
+    for index in (0, 17, 59):
+        assert grid.configuration(index) == configurations[index]
+    with pytest.raises(IndexError):
+        grid.configuration(60)
+
+
+def test_shards():
+    grid = GridSampler(create_space())
+    indices = []
+    for shard in range(7):
+        for index, config in grid.iterate(shard=shard, num_shards=7):
+            assert index % 7 == shard
+            assert config == grid.configuration(index)
+            indices.append(index)
+    assert sorted(indices) == list(range(60))
+
+
+def test_resume():
+    grid = GridSampler(create_space())
+    first = list(itertools.islice(grid.iterate(shard=1, num_shards=3), 5))
+    cursor = first[-1][0]
+    resumed = list(grid.iterate(start=cursor + 1, shard=1, num_shards=3))
+    assert first + resumed == list(grid.iterate(shard=1, num_shards=3))
+
+
+def test_stop():
+    grid = GridSampler(create_space())
+    assert [index for index, _ in grid.iterate(start=10, stop=14)] == [10, 11, 12, 13]
+    assert list(grid.iterate(start=60)) == []
+
+
+def test_invalid_shard():
+    with pytest.raises(ValueError):
+        list(GridSampler(create_space()).iterate(shard=3, num_shards=3))
+
+
+def test_large_grid():
+    space = {"node": {str(i): QUniform(0, 99, 1) for i in range(5)}}
+    grid = GridSampler(space)
+    assert len(grid) == 10**10
+    index, config = next(grid.iterate(start=10**10 - 1))
+    assert index == 10**10 - 1
+    assert all(value == 99 for value in config["node"].values())
+
+
+def test_continuous():
+    with pytest.raises(ValueError):
+        GridSampler({"node": {"param": Uniform(min_value=0, max_value=1)}})
@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# Author: Torben Hansing
+#
+import itertools
+
+import numpy as np
+
+from autoopt.distributions import Choice, LogUniform, Normal, QUniform, Uniform
+from autoopt.samplers import HaltonSampler
+from autoopt.samplers.halton import _primes
+
+
+def create_space():
+    return {
+        "first": {
+            "uniform": Uniform(min_value=0, max_value=1),
+            "log_uniform": LogUniform(min_value=1, max_value=100),
+            "q_uniform": QUniform(min_value=0, max_value=10, q=1),
+        },
+        "second": {
+            "normal": Normal(loc=0, scale=1),
+            "choice": Choice(choices=["a", "b", "c"]),
+        },
+    }
+
+
+def test_primes():
+    assert _primes(10) == [2, 3, 5, 7, 11, 13, 17, 19, 23, 29]
+
+
+def test_points_unscrambled():
+    sampler = HaltonSampler(create_space(), scramble=False)
+    points = sampler.points(4)
+    assert np.allclose([0.5, 0.25, 0.75, 0.125], points[:, 0])
+    assert np.allclose([1 / 3, 2 / 3, 1 / 9, 4 / 9], points[:, 1])
+    assert sampler.index == 4
+
+
+def test_points_scrambled():
+    sampler = HaltonSampler(create_space(), seed=42)
+    points = sampler.points(1000)
+    assert np.all((points > 0) & (points < 1))
+    # Each column is a permutation of the same stratification
+    for column in range(points.shape[1]):
+        counts = np.histogram(points[:, column], bins=10, range=(0, 1))[0]
+        assert np.all(np.abs(counts - 100) <= 10)
+
+
+def test_sample():
+    space = create_space()
+    sampler = HaltonSampler(space, seed=42)
+    configurations = sampler.sample(100)
+    assert len(configurations) == 100
+    for config in configurations:
+        assert 0 <= config["first"]["uniform"] <= 1
+        assert 1 <= config["first"]["log_uniform"] <= 100
+        assert config["second"]["choice"] in ["a", "b", "c"]
+    samples = sampler.space.encode(configurations)
+    assert np.all(np.isfinite(sampler.space.logpdf(samples)))
+
+
+def test_blocks():
+    sampler = HaltonSampler(create_space(), seed=42)
+    blocks = list(itertools.islice(sampler.blocks(block_size=10), 3))
+    assert [len(block) for block in blocks] == [10, 10, 10]
+    check = HaltonSampler(create_space(), seed=42).sample(30)
+    assert check == [config for block in blocks for config in block]
+
+
+def test_resume():
+    sampler = HaltonSampler(create_space(), seed=42)
+    sampler.sample(10)
+    resumed = HaltonSampler(create_space(), seed=42, index=sampler.index)
+    assert sampler.sample(10) == resumed.sample(10)
@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# Author: Torben Hansing
+#
+import numpy as np
+
+from autoopt.distributions import Choice, LogUniform, Normal, Uniform
+from autoopt.samplers import LatinHypercubeSampler
+
+
+def create_space():
+    return {
+        "first": {
+            "uniform": Uniform(min_value=0, max_value=1),
+            "log_uniform": LogUniform(min_value=1, max_value=100),
+        },
+        "second": {
+            "normal": Normal(loc=0, scale=1),
+            "choice": Choice(choices=["a", "b", "c", "d"]),
+        },
+    }
+
+
+def minimal_distance(points):
+    distances = np.sqrt(((points[:, None, :] - points[None, :, :]) ** 2).sum(-1))
+    np.fill_diagonal(distances, np.inf)
+    return distances.min()
+
+
+def assert_latin_hypercube(points):
+    size = len(points)
+    strata = np.sort(np.floor(points * size), axis=0)
+    assert np.array_equal(np.tile(np.arange(size)[:, None], points.shape[1]), strata)
+
+
+def test_points():
+    sampler = LatinHypercubeSampler(create_space(), seed=42)
+    points = sampler.points(50)
+    assert points.shape == (50, 4)
+    assert_latin_hypercube(points)
+
+
+def test_maximin():
+    points = LatinHypercubeSampler(create_space(), seed=42).points(30)
+    sampler = LatinHypercubeSampler(create_space(), maximin_iterations=500, seed=42)
+    optimized = sampler.points(30)
+    assert_latin_hypercube(optimized)
+    assert minimal_distance(optimized) > minimal_distance(points)
+
+
+def test_sample():
+    sampler = LatinHypercubeSampler(create_space(), maximin_iterations=10, seed=42)
+    configurations = sampler.sample(20)
+    assert len(configurations) == 20
+    # each choice is sampled equally often
+    choices = [config["second"]["choice"] for config in configurations]
+    assert all(choices.count(choice) == 5 for choice in "abcd")
+    values = [config["first"]["log_uniform"] for config in configurations]
+    log_uniform = np.log10(values)
+    assert np.array_equal(np.arange(20), np.sort(np.floor(log_uniform / 2 * 20)))
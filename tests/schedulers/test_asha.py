@@ -0,0 +1,161 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# Author: Torben Hansing
+#
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from autoopt.distributions import Uniform
+from autoopt.optimizers import TPEOptimizer
+from autoopt.pipelines import MedianPruner, MemoryCache
+from autoopt.schedulers import ASHAScheduler
+from autoopt.schedulers.asha import _Rung
+from autoopt.tasks import Fidelity
+from utils import FunctionNode, create_pipeline
+
+
+class Fit:
+    """
+    Calculates the loss of a configuration. The first call is slow, if
+    `slow_first` is True.
+    """
+
+    def __init__(self, slow_first=False):
+        self.slow_first = slow_first
+        self.lock = threading.Lock()
+
+    def __call__(self, input_data, x=0.0, epochs=9):
+        with self.lock:
+            slow, self.slow_first = self.slow_first, False
+        if slow:
+            time.sleep(0.5)
+        if x > 1.5:
+            raise RuntimeError("Diverged")
+        return input_data**2 + x**2 + 1 / epochs
+
+
+def create_scheduler(slow_first=False, cache=None, loss=float, hooks=(), **kwargs):
+    pipeline, (shift, _) = create_pipeline(
+        FunctionNode("shift", space={"value": Uniform(min_value=-1, max_value=1)}),
+        FunctionNode(
+            "fit", Fit(slow_first), space={"x": Uniform(min_value=-2, max_value=2)}
+        ),
+        cache=cache,
+    )
+    for hook in hooks:
+        pipeline.add_hook(hook)
+    fidelity = Fidelity("fit", "epochs", min_budget=1, max_budget=9)
+    optimizer = TPEOptimizer(pipeline.parameter_space(), seed=0)
+    scheduler = ASHAScheduler(pipeline, optimizer, fidelity, loss, **kwargs)
+    return scheduler, optimizer, shift
+
+
+def brute_force_promotable(losses, promoted, eta):
+    ranked = sorted((loss, trial) for trial, loss in losses.items())
+    top = ranked[: len(ranked) // eta]
+    candidates = [(loss, trial) for loss, trial in top if trial not in promoted]
+    return candidates[0][1] if candidates else None
+
+
+def test_rung_matches_brute_force():
+    rng = np.random.default_rng(0)
+    rung, losses, promoted = _Rung(3), {}, set()
+    for trial in range(300):
+        loss = float(rng.integers(50))
+        rung.add(trial, loss)
+        losses[trial] = loss
+        if rng.random() < 0.5:
+            expected = brute_force_promotable(losses, promoted, 3)
+            assert rung.pop_promotable() == expected
+            if expected is not None:
+                promoted.add(expected)
+    assert len(rung) == 300
+
+
+def test_rung_speed():
+    rng = np.random.default_rng(1)
+    rung = _Rung(3)
+    start = time.perf_counter()
+    for trial, loss in enumerate(rng.random(50000)):
+        rung.add(trial, loss)
+        rung.pop_promotable()
+    assert time.perf_counter() - start < 2
+
+
+def test_run():
+    scheduler, optimizer, _ = create_scheduler(max_workers=4)
+    assert scheduler.budgets == [1, 3, 9]
+    best = scheduler.run(0.0, max_evaluations=60)
+    history = scheduler.history
+    assert len(history) == 60
+    assert len(optimizer.losses) == 60
+    assert best.budget == 9
+    for evaluation in history:
+        if evaluation.budget > 1:
+            assert any(
+                other.config is evaluation.config and other.budget < evaluation.budget
+                for other in history
+            )
+
+
+def test_failed_evaluations(caplog):
+    scheduler, _, _ = create_scheduler(max_workers=2)
+    scheduler.run(0.0, max_evaluations=40)
+    failed = [e for e in scheduler.history if e.config["fit"]["x"] > 1.5]
+    assert failed
+    assert all(evaluation.loss == np.inf for evaluation in failed)
+    errors = [record for record in caplog.records if record.levelname == "ERROR"]
+    assert len(errors) == len(failed)
+    assert all("Diverged" in record.exc_text for record in errors)
+
+
+def test_pruned_evaluations():
+    pruner = MedianPruner(lambda node, result: result, min_trials=1)
+    scheduler, _, _ = create_scheduler(max_workers=2, hooks=[pruner])
+    scheduler.run(0.0, max_evaluations=20)
+    losses = [evaluation.loss for evaluation in scheduler.history]
+    assert np.inf in losses
+    assert any(np.isfinite(loss) for loss in losses)
+
+
+def test_failing_loss():
+    def loss(result):
+        raise ValueError("Broken loss")
+
+    scheduler, _, _ = create_scheduler(max_workers=2, loss=loss)
+    with pytest.raises(ValueError, match="Broken loss"):
+        scheduler.run(0.0, max_evaluations=10)
+
+
+def test_workers_do_not_wait():
+    scheduler, _, _ = create_scheduler(slow_first=True, max_workers=2)
+    scheduler.run(0.0, max_evaluations=10)
+    history = scheduler.history
+    # The other worker completes all evaluations, while the first one is running
+    first = history[-1]
+    assert first.budget == 1
+    assert all(evaluation.config is not first.config for evaluation in history[:-1])
+
+
+def test_promotion_reuses_cache():
+    scheduler, _, shift = create_scheduler(
+        cache=MemoryCache(max_entries=1000), max_workers=1
+    )
+    scheduler.run(0.0, max_evaluations=30)
+    assert shift.calls == len({id(e.config) for e in scheduler.history})
+
+
+def test_best_without_evaluations():
+    scheduler, _, _ = create_scheduler()
+    with pytest.raises(ValueError):
+        scheduler.best
+
+
+def test_invalid_parameters():
+    with pytest.raises(ValueError):
+        create_scheduler(eta=1)
+    with pytest.raises(ValueError):
+        create_scheduler(max_workers=0)
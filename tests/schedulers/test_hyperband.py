@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# Author: Torben Hansing
+#
+import numpy as np
+import pytest
+
+from autoopt.distributions import QUniform, Uniform
+from autoopt.optimizers import TPEOptimizer
+from autoopt.pipelines import MemoryCache, TrialPruned
+from autoopt.schedulers import HyperbandScheduler
+from autoopt.tasks import Fidelity
+from utils import FunctionNode, create_pipeline
+
+
+def train(input_data, x=0.0, epochs=27):
+    # The loss converges to the true loss with increasing budget
+    return input_data**2 + x**2 + 1 / epochs
+
+
+def unstable_train(input_data, x=0.0, epochs=27):
+    if x > 1.5:
+        raise RuntimeError("Diverged")
+    if x < -1.5:
+        raise TrialPruned("Too slow")
+    return train(input_data, x, epochs)
+
+
+def create_scheduler(cache=None, eta=3, function=train, loss=float):
+    pipeline, (prepare, train_node) = create_pipeline(
+        FunctionNode("prepare", space={"value": Uniform(min_value=-1, max_value=1)}),
+        FunctionNode(
+            "train",
+            function,
+            space={
+                "x": Uniform(min_value=-2, max_value=2),
+                "epochs": QUniform(min_value=1, max_value=27, q=1),
+            },
+        ),
+        cache=cache,
+    )
+    fidelity = Fidelity("train", "epochs", min_budget=1, max_budget=27)
+    optimizer = TPEOptimizer(fidelity.strip(pipeline.parameter_space()), seed=0)
+    scheduler = HyperbandScheduler(pipeline, optimizer, fidelity, loss, eta=eta)
+    return scheduler, optimizer, prepare, train_node
+
+
+def test_brackets():
+    scheduler, _, _, _ = create_scheduler()
+    assert scheduler.brackets == [
+        [(27, 1), (9, 3), (3, 9), (1, 27)],
+        [(12, 3), (4, 9), (1, 27)],
+        [(6, 9), (2, 27)],
+        [(4, 27)],
+    ]
+
+
+def test_run_bracket_promotes_best():
+    scheduler, optimizer, _, train = create_scheduler()
+    evaluations = scheduler.run_bracket(0.0, 0)
+    assert [evaluation.budget for evaluation in evaluations] == (
+        [1] * 27 + [3] * 9 + [9] * 3 + [27]
+    )
+    budgets = [execution["epochs"] for execution in train.executions]
+    assert budgets == [1] * 27 + [3] * 9 + [9] * 3 + [27]
+    first = sorted(evaluations[:27], key=lambda evaluation: evaluation.loss)
+    promoted = [evaluation.config for evaluation in evaluations[27:36]]
+    assert promoted == [evaluation.config for evaluation in first[:9]]
+    assert "epochs" not in promoted[0]["train"]
+    # Each configuration is told once with its loss at its largest budget
+    assert len(optimizer.losses) == 27
+    assert sorted(optimizer.losses)[0] == evaluations[-1].loss
+
+
+def test_run():
+    scheduler, optimizer, _, _ = create_scheduler()
+    best = scheduler.run(0.0)
+    assert best.budget == 27
+    assert len(optimizer.losses) == 27 + 12 + 6 + 4
+    assert len(scheduler.history) == 40 + 17 + 8 + 4
+    assert best.loss == min(
+        evaluation.loss for evaluation in scheduler.history if evaluation.budget == 27
+    )
+
+
+def test_failed_and_pruned_evaluations(caplog):
+    scheduler, optimizer, _, _ = create_scheduler(function=unstable_train)
+    evaluations = scheduler.run_bracket(0.0, 0)
+    assert len(evaluations) == 27 + 9 + 3 + 1
+    failed = [e for e in evaluations if e.config["train"]["x"] > 1.5]
+    pruned = [e for e in evaluations if e.config["train"]["x"] < -1.5]
+    assert failed and pruned
+    for evaluation in evaluations:
+        assert np.isinf(evaluation.loss) == (evaluation in failed + pruned)
+    errors = [record for record in caplog.records if record.levelname == "ERROR"]
+    assert len(errors) == len(failed)
+    assert all("Diverged" in record.exc_text for record in errors)
+    assert np.isfinite(scheduler.best.loss)
+    assert np.isinf(optimizer.losses).sum() == len(failed) + len(pruned)
+
+
+def test_failing_loss():
+    def loss(result):
+        raise ValueError("Broken loss")
+
+    scheduler, _, _, _ = create_scheduler(loss=loss)
+    with pytest.raises(ValueError, match="Broken loss"):
+        scheduler.run_bracket(0.0, 0)
+
+
+def test_promotion_reuses_cache():
+    scheduler, _, prepare, _ = create_scheduler(cache=MemoryCache(max_entries=1000))
+    scheduler.run_bracket(0.0, 0)
+    assert prepare.calls == 27
+
+
+def test_best_without_evaluations():
+    scheduler, _, _, _ = create_scheduler()
+    with pytest.raises(ValueError):
+        scheduler.best
+
+
+def test_invalid_eta():
+    with pytest.raises(ValueError):
+        create_scheduler(eta=1)
@@ -5,7 +5,7 @@
 import os
 import pickle  # nosec
 
-from autoopt.tasks import BaseTask
+from autoopt.tasks import BaseTask, Fidelity
 
 
 def create_bas_task(input_path=None, optimizer=None):
@@ -32,3 +32,12 @@ def test_pickle_BaseTask():
     check_task = pickle.loads(task_pickle)  # nosec
     assert task.input_path == check_task.input_path
     assert task.optimizer == check_task.optimizer
+
+
+def test_pickle_BaseTask_fidelity():
+    fidelity = Fidelity("train", "epochs", min_budget=1, max_budget=81)
+    task = BaseTask(os.path.realpath("."), "Dummy", fidelity=fidelity)
+    check_task = pickle.loads(pickle.dumps(task))  # nosec
+    assert check_task.fidelity.node == "train"
+    assert check_task.fidelity.max_budget == 81
+    assert create_bas_task().fidelity is None
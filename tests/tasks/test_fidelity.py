@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# Author: Torben Hansing
+#
+import pytest
+
+from autoopt.distributions import Uniform
+from autoopt.tasks import Fidelity
+
+
+def test_budget():
+    fidelity = Fidelity("train", "epochs", min_budget=1, max_budget=81)
+    assert fidelity.integer
+    assert fidelity.budget(2.6) == 3
+    assert fidelity.budget(0.1) == 1
+    assert fidelity.budget(100) == 81
+    fidelity = Fidelity("subsample", "fraction", min_budget=0.1, max_budget=1.0)
+    assert not fidelity.integer
+    assert fidelity.budget(0.25) == 0.25
+
+
+def test_strip():
+    fidelity = Fidelity("train", "epochs", min_budget=1, max_budget=81)
+    space = {
+        "prepare": {"scale": Uniform(min_value=0, max_value=1)},
+        "train": {
+            "epochs": Uniform(min_value=1, max_value=81),
+            "rate": Uniform(min_value=0, max_value=1),
+        },
+    }
+    stripped = fidelity.strip(space)
+    assert set(stripped["train"]) == {"rate"}
+    assert set(stripped["prepare"]) == {"scale"}
+    assert set(space["train"]) == {"epochs", "rate"}
+
+
+def test_inject():
+    fidelity = Fidelity("train", "epochs", min_budget=1, max_budget=81)
+    config = {"prepare": {"scale": 0.5}, "train": {"rate": 0.1}}
+    injected = fidelity.inject(config, 9)
+    assert injected == {"prepare": {"scale": 0.5}, "train": {"rate": 0.1, "epochs": 9}}
+    assert config == {"prepare": {"scale": 0.5}, "train": {"rate": 0.1}}
+    assert fidelity.inject({}, 3) == {"train": {"epochs": 3}}
+
+
+def test_invalid_budgets():
+    with pytest.raises(ValueError):
+        Fidelity("train", "epochs", min_budget=0, max_budget=10)
+    with pytest.raises(ValueError):
+        Fidelity("train", "epochs", min_budget=10, max_budget=10)